@@ -5,7 +5,7 @@ import os
 from logging.config import fileConfig
 
 from alembic import context
-from sqlalchemy import pool
+from sqlalchemy import pool, text
 from sqlalchemy.ext.asyncio import async_engine_from_config
 
 # Import Base and all models (models are auto-imported via app.models.__init__)
@@ -25,6 +25,9 @@ if config.config_file_name is not None:
 # for 'autogenerate' support
 target_metadata = Base.metadata
 
+# Arbitrary application-wide key for the migration advisory lock.
+MIGRATION_LOCK_KEY = 7_316_504_211
+
 
 def get_url():
     """Get database URL from environment variable."""
@@ -58,11 +61,32 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection):
-    """Configure context and run migrations."""
+    """Configure context and run migrations.
+
+    On PostgreSQL a session-level advisory lock serializes concurrent
+    migration runs (e.g. several containers starting at once) without
+    holding table locks while waiting.
+    """
     context.configure(connection=connection, target_metadata=target_metadata)
 
-    with context.begin_transaction():
-        context.run_migrations()
+    use_advisory_lock = connection.dialect.name == "postgresql"
+    if use_advisory_lock:
+        connection.execute(
+            text("SELECT pg_advisory_lock(:key)"),
+            {"key": MIGRATION_LOCK_KEY},
+        )
+        connection.commit()
+
+    try:
+        with context.begin_transaction():
+            context.run_migrations()
+    finally:
+        if use_advisory_lock:
+            connection.execute(
+                text("SELECT pg_advisory_unlock(:key)"),
+                {"key": MIGRATION_LOCK_KEY},
+            )
+            connection.commit()
 
 
 async def run_migrations_online() -> None:
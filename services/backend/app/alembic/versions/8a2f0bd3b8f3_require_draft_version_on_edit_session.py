@@ -20,14 +20,7 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     """Upgrade schema."""
-    conn = op.get_bind()
-    inspector = sa.inspect(conn)
-    fk_name = None
-    for fk in inspector.get_foreign_keys("quiz_edit_session"):
-        if fk.get("constrained_columns") == ["draft_version_id"]:
-            fk_name = fk.get("name")
-            break
-
+    fk_name = _find_draft_version_fk_name(op.get_bind())
     if fk_name:
         op.drop_constraint(fk_name, "quiz_edit_session", type_="foreignkey")
 
@@ -69,3 +62,33 @@ def downgrade() -> None:
         ["quiz_version_id"],
         ondelete="SET NULL",
     )
+
+
+def _find_draft_version_fk_name(conn: sa.Connection) -> str | None:
+    """Return the name of the foreign key on quiz_edit_session.draft_version_id.
+
+    PostgreSQL is asked directly via pg_constraint instead of reflecting
+    every foreign key of the table through the Inspector.
+    """
+    if conn.dialect.name == "postgresql":
+        return conn.execute(
+            sa.text(
+                """
+                SELECT conname
+                FROM pg_constraint
+                WHERE conrelid = 'quiz_edit_session'::regclass
+                  AND contype = 'f'
+                  AND conkey = ARRAY[(
+                    SELECT attnum
+                    FROM pg_attribute
+                    WHERE attrelid = 'quiz_edit_session'::regclass
+                      AND attname = 'draft_version_id'
+                  )]
+                """,
+            ),
+        ).scalar_one_or_none()
+
+    for fk in sa.inspect(conn).get_foreign_keys("quiz_edit_session"):
+        if fk.get("constrained_columns") == ["draft_version_id"]:
+            return fk.get("name")
+    return None
@@ -21,6 +21,9 @@ down_revision: Union[str, Sequence[str], None] = "3f21ababfc70"
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Number of quizzes processed per executemany batch in the portable backfill.
+_BACKFILL_BATCH_SIZE = 1000
+
 
 def upgrade() -> None:
     """Upgrade schema."""
@@ -166,15 +169,6 @@ def upgrade() -> None:
             comment="Current published version of this quiz",
         ),
     )
-    op.create_foreign_key(
-        "fk_quiz_current_version",
-        "quiz",
-        "quiz_version",
-        ["current_version_id"],
-        ["quiz_version_id"],
-        ondelete="SET NULL",
-    )
-
     op.add_column(
         "task",
         sa.Column(
@@ -191,18 +185,32 @@ def upgrade() -> None:
         unique=False,
     )
     op.create_index("ix_task_quiz_id", "task", ["quiz_id"], unique=False)
-    op.create_foreign_key(
-        "fk_task_quiz_version",
-        "task",
-        "quiz_version",
-        ["quiz_version_id"],
-        ["quiz_version_id"],
-        ondelete="CASCADE",
-    )
 
+    # Foreign keys are added after the backfill so the bulk writes do not
+    # pay a constraint check per row.
     _backfill_versions()
 
-    op.alter_column("task", "quiz_version_id", nullable=False)
+    if op.get_bind().dialect.name == "postgresql":
+        _add_version_constraints_postgresql()
+    else:
+        op.create_foreign_key(
+            "fk_quiz_current_version",
+            "quiz",
+            "quiz_version",
+            ["current_version_id"],
+            ["quiz_version_id"],
+            ondelete="SET NULL",
+        )
+        op.create_foreign_key(
+            "fk_task_quiz_version",
+            "task",
+            "quiz_version",
+            ["quiz_version_id"],
+            ["quiz_version_id"],
+            ondelete="CASCADE",
+        )
+        op.alter_column("task", "quiz_version_id", nullable=False)
+
     op.drop_index("ix_task_quiz_order", table_name="task")
 
 
@@ -233,18 +241,138 @@ def downgrade() -> None:
     op.drop_table("quiz_version")
 
 
+def _add_version_constraints_postgresql() -> None:
+    """Add the post-backfill constraints with as few table locks as possible.
+
+    The task foreign key and NOT NULL change share one ALTER TABLE. Foreign
+    keys are created NOT VALID and validated in a separate statement, which
+    only needs a SHARE UPDATE EXCLUSIVE lock.
+    """
+    op.execute(
+        """
+        ALTER TABLE quiz
+        ADD CONSTRAINT fk_quiz_current_version
+            FOREIGN KEY (current_version_id)
+            REFERENCES quiz_version (quiz_version_id)
+            ON DELETE SET NULL
+            NOT VALID
+        """,
+    )
+    op.execute(
+        """
+        ALTER TABLE task
+        ADD CONSTRAINT fk_task_quiz_version
+            FOREIGN KEY (quiz_version_id)
+            REFERENCES quiz_version (quiz_version_id)
+            ON DELETE CASCADE
+            NOT VALID,
+        ALTER COLUMN quiz_version_id SET NOT NULL
+        """,
+    )
+    op.execute("ALTER TABLE quiz VALIDATE CONSTRAINT fk_quiz_current_version")
+    op.execute("ALTER TABLE task VALIDATE CONSTRAINT fk_task_quiz_version")
+
+
 def _backfill_versions() -> None:
     conn = op.get_bind()
-    rows = conn.execute(
-        sa.text("SELECT quiz_id, created_by, created_at FROM quiz"),
-    ).fetchall()
+    if conn.dialect.name == "postgresql":
+        _backfill_versions_set_based(conn)
+        return
+
+    # Stream quizzes in batches instead of materializing the whole table.
+    stmt = sa.text("SELECT quiz_id, created_by, created_at FROM quiz")
+    result = conn.execute(stmt.execution_options(yield_per=_BACKFILL_BATCH_SIZE))
+    for rows in result.partitions():
+        _backfill_version_batch(conn, rows)
+
 
+def _backfill_version_batch(conn: sa.Connection, rows: Sequence[sa.Row]) -> None:
+    """Insert versions and relink quizzes/tasks for one batch of quiz rows.
+
+    Each statement is executed once with a list of parameter sets so the
+    driver can use ``executemany`` instead of one round-trip per quiz.
+    """
+    now = datetime.now(timezone.utc)
+    version_rows = []
+    link_rows = []
     for row in rows:
-        version_id = uuid.uuid4()
-        created_at = row.created_at or datetime.now(timezone.utc)
-        conn.execute(
-            sa.text(
-                """
+        version_id = str(uuid.uuid4())
+        quiz_id = str(row.quiz_id)
+        created_at = row.created_at or now
+        version_rows.append(
+            {
+                "quiz_version_id": version_id,
+                "quiz_id": quiz_id,
+                "status": "PUBLISHED",
+                "created_by": str(row.created_by),
+                "created_at": created_at,
+                "committed_at": created_at,
+            },
+        )
+        link_rows.append({"version_id": version_id, "quiz_id": quiz_id})
+
+    if not version_rows:
+        return
+
+    conn.execute(
+        sa.text(
+            """
+            INSERT INTO quiz_version (
+                quiz_version_id,
+                quiz_id,
+                base_version_id,
+                version_number,
+                status,
+                created_by,
+                created_at,
+                committed_at
+            )
+            VALUES (
+                :quiz_version_id,
+                :quiz_id,
+                NULL,
+                1,
+                :status,
+                :created_by,
+                :created_at,
+                :committed_at
+            )
+            """,
+        ),
+        version_rows,
+    )
+
+    conn.execute(
+        sa.text(
+            "UPDATE quiz SET current_version_id = :version_id WHERE quiz_id = :quiz_id",
+        ),
+        link_rows,
+    )
+
+    conn.execute(
+        sa.text(
+            """
+            UPDATE task
+            SET quiz_version_id = :version_id
+            WHERE quiz_id = :quiz_id
+            """,
+        ),
+        link_rows,
+    )
+
+
+def _backfill_versions_set_based(conn: sa.Connection) -> None:
+    """Backfill initial versions in a single statement (PostgreSQL).
+
+    A writable CTE inserts one version per quiz and feeds the generated ids
+    straight into the quiz and task updates, so the whole backfill is one
+    round-trip and one plan. All parts see the same snapshot, which is why
+    the updates join on the CTE output instead of the quiz_version table.
+    """
+    conn.execute(
+        sa.text(
+            """
+            WITH new_versions AS (
                 INSERT INTO quiz_version (
                     quiz_version_id,
                     quiz_id,
@@ -255,42 +383,28 @@ def _backfill_versions() -> None:
                     created_at,
                     committed_at
                 )
-                VALUES (
-                    :quiz_version_id,
-                    :quiz_id,
+                SELECT
+                    gen_random_uuid(),
+                    quiz_id,
                     NULL,
                     1,
-                    :status,
-                    :created_by,
-                    :created_at,
-                    :committed_at
-                )
-                """,
-            ),
-            {
-                "quiz_version_id": str(version_id),
-                "quiz_id": str(row.quiz_id),
-                "status": "PUBLISHED",
-                "created_by": str(row.created_by),
-                "created_at": created_at,
-                "committed_at": created_at,
-            },
-        )
-
-        conn.execute(
-            sa.text(
-                "UPDATE quiz SET current_version_id = :version_id WHERE quiz_id = :quiz_id",
-            ),
-            {"version_id": str(version_id), "quiz_id": str(row.quiz_id)},
-        )
-
-        conn.execute(
-            sa.text(
-                """
-                UPDATE task
-                SET quiz_version_id = :version_id
-                WHERE quiz_id = :quiz_id
-                """,
+                    'PUBLISHED',
+                    created_by,
+                    COALESCE(created_at, now()),
+                    COALESCE(created_at, now())
+                FROM quiz
+                RETURNING quiz_version_id, quiz_id
             ),
-            {"version_id": str(version_id), "quiz_id": str(row.quiz_id)},
-        )
+            updated_quizzes AS (
+                UPDATE quiz
+                SET current_version_id = new_versions.quiz_version_id
+                FROM new_versions
+                WHERE new_versions.quiz_id = quiz.quiz_id
+            )
+            UPDATE task
+            SET quiz_version_id = new_versions.quiz_version_id
+            FROM new_versions
+            WHERE new_versions.quiz_id = task.quiz_id
+            """,
+        ),
+    )
@@ -0,0 +1,53 @@
+"""Replace ix_attempt_user_id with a (user_id, started_at, attempt_id) index.
+
+Revision ID: a4d8f2c6e0b3
+Revises: f3b8d2e6a4c7
+Create Date: 2026-10-16 18:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a4d8f2c6e0b3"
+down_revision: Union[str, Sequence[str], None] = "f3b8d2e6a4c7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The new index leads with user_id, so it subsumes the single-column one
+    # and serves the keyset-paginated attempt list without a sort.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_attempt_user_started",
+            "attempt",
+            ["user_id", "started_at", "attempt_id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_attempt_user_id",
+            table_name="attempt",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_attempt_user_id",
+            "attempt",
+            ["user_id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_attempt_user_started",
+            table_name="attempt",
+            postgresql_concurrently=True,
+        )
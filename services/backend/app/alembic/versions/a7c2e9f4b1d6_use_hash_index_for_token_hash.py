@@ -0,0 +1,55 @@
+"""Use a hash index for magic_link_token.token_hash.
+
+Revision ID: a7c2e9f4b1d6
+Revises: f1b3d5a7c9e2
+Create Date: 2026-10-16 11:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a7c2e9f4b1d6"
+down_revision: Union[str, Sequence[str], None] = "f1b3d5a7c9e2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Build the replacement before dropping the unique B-tree so lookups are
+    # never left without an index. CONCURRENTLY cannot run inside a
+    # transaction, so the migration transaction is committed first.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_magic_link_token_token_hash_lookup",
+            "magic_link_token",
+            ["token_hash"],
+            unique=False,
+            postgresql_using="hash",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_magic_link_token_token_hash",
+            table_name="magic_link_token",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_magic_link_token_token_hash",
+            "magic_link_token",
+            ["token_hash"],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_magic_link_token_token_hash_lookup",
+            table_name="magic_link_token",
+            postgresql_concurrently=True,
+        )
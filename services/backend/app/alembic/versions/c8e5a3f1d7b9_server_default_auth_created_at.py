@@ -0,0 +1,45 @@
+"""Use database defaults for auth created_at columns.
+
+Revision ID: c8e5a3f1d7b9
+Revises: a7c2e9f4b1d6
+Create Date: 2026-10-16 12:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c8e5a3f1d7b9"
+down_revision: Union[str, Sequence[str], None] = "a7c2e9f4b1d6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_TABLES = ("user", "magic_link_token")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in _TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                "created_at",
+                existing_type=sa.DateTime(timezone=True),
+                existing_nullable=False,
+                server_default=sa.func.now(),
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in _TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                "created_at",
+                existing_type=sa.DateTime(timezone=True),
+                existing_nullable=False,
+                server_default=None,
+            )
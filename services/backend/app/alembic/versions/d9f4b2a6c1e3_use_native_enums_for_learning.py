@@ -0,0 +1,68 @@
+"""Use native PostgreSQL enums for learning discriminators.
+
+Revision ID: d9f4b2a6c1e3
+Revises: c8e5a3f1d7b9
+Create Date: 2026-10-16 13:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d9f4b2a6c1e3"
+down_revision: Union[str, Sequence[str], None] = "c8e5a3f1d7b9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_ENUM_COLUMNS = (
+    (
+        "attempt",
+        "status",
+        postgresql.ENUM("IN_PROGRESS", "EVALUATED", name="attempt_status"),
+    ),
+    (
+        "answer",
+        "type",
+        postgresql.ENUM("MULTIPLE_CHOICE", "FREE_TEXT", "CLOZE", name="answer_type"),
+    ),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # SQLite has no enum type; the columns stay VARCHAR there.
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table, column, enum_type in _ENUM_COLUMNS:
+        enum_type.create(op.get_bind(), checkfirst=True)
+        op.alter_column(
+            table,
+            column,
+            type_=enum_type,
+            existing_type=sa.String(length=20),
+            existing_nullable=False,
+            postgresql_using=f"{column}::{enum_type.name}",
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table, column, enum_type in _ENUM_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.String(length=20),
+            existing_type=enum_type,
+            existing_nullable=False,
+            postgresql_using=f"{column}::text",
+        )
+        enum_type.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,51 @@
+"""Add partial unique index for active edit sessions.
+
+Revision ID: e4a1c7d9b2f5
+Revises: b6c2e8a4f1d3
+Create Date: 2026-10-16 09:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e4a1c7d9b2f5"
+down_revision: Union[str, Sequence[str], None] = "b6c2e8a4f1d3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Abort all but the newest active session per quiz before enforcing
+    # uniqueness.
+    op.execute(
+        """
+        UPDATE quiz_edit_session
+        SET status = 'ABORTED'
+        WHERE status = 'ACTIVE'
+          AND edit_session_id NOT IN (
+            SELECT DISTINCT ON (quiz_id) edit_session_id
+            FROM quiz_edit_session
+            WHERE status = 'ACTIVE'
+            ORDER BY quiz_id, updated_at DESC
+          )
+        """,
+    )
+
+    op.create_index(
+        "uq_quiz_edit_session_active",
+        "quiz_edit_session",
+        ["quiz_id"],
+        unique=True,
+        postgresql_where=sa.text("status = 'ACTIVE'"),
+        sqlite_where=sa.text("status = 'ACTIVE'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("uq_quiz_edit_session_active", table_name="quiz_edit_session")
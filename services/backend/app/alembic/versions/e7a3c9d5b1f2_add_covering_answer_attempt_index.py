@@ -0,0 +1,55 @@
+"""Replace ix_answer_attempt_id with a covering (attempt_id, type) index.
+
+Revision ID: e7a3c9d5b1f2
+Revises: d9f4b2a6c1e3
+Create Date: 2026-10-16 14:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e7a3c9d5b1f2"
+down_revision: Union[str, Sequence[str], None] = "d9f4b2a6c1e3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The new index leads with attempt_id, so it subsumes the single-column
+    # one. CONCURRENTLY cannot run inside a transaction, so the migration
+    # transaction is committed first.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_answer_attempt_type",
+            "answer",
+            ["attempt_id", "type"],
+            unique=False,
+            postgresql_include=["answer_id", "task_id", "percentage_correct"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_answer_attempt_id",
+            table_name="answer",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_answer_attempt_id",
+            "answer",
+            ["attempt_id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_answer_attempt_type",
+            table_name="answer",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,73 @@
+"""Store auth hashes as raw SHA-256 digests.
+
+Revision ID: f1b3d5a7c9e2
+Revises: e4a1c7d9b2f5
+Create Date: 2026-10-16 10:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f1b3d5a7c9e2"
+down_revision: Union[str, Sequence[str], None] = "e4a1c7d9b2f5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_HASH_COLUMNS = (
+    ("user", "email_hash"),
+    ("magic_link_token", "token_hash"),
+    ("magic_link_token", "email_hash"),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name == "postgresql":
+        for table, column in _HASH_COLUMNS:
+            op.alter_column(
+                table,
+                column,
+                type_=sa.LargeBinary(length=32),
+                existing_type=sa.String(length=64),
+                existing_nullable=False,
+                postgresql_using=f"decode({column}, 'hex')",
+            )
+        return
+
+    for table, column in _HASH_COLUMNS:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                column,
+                type_=sa.LargeBinary(length=32),
+                existing_type=sa.String(length=64),
+                existing_nullable=False,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "postgresql":
+        for table, column in _HASH_COLUMNS:
+            op.alter_column(
+                table,
+                column,
+                type_=sa.String(length=64),
+                existing_type=sa.LargeBinary(length=32),
+                existing_nullable=False,
+                postgresql_using=f"encode({column}, 'hex')",
+            )
+        return
+
+    for table, column in _HASH_COLUMNS:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                column,
+                type_=sa.String(length=64),
+                existing_type=sa.LargeBinary(length=32),
+                existing_nullable=False,
+            )
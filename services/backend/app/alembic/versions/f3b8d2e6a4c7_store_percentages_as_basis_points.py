@@ -0,0 +1,92 @@
+"""Store learning percentages as SMALLINT basis points.
+
+Revision ID: f3b8d2e6a4c7
+Revises: e7a3c9d5b1f2
+Create Date: 2026-10-16 15:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f3b8d2e6a4c7"
+down_revision: Union[str, Sequence[str], None] = "e7a3c9d5b1f2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_PERCENT_COLUMNS = (
+    (
+        "answer",
+        "percentage_correct",
+        "Score as percentage (0-100)",
+        "Score in basis points (0-10000 = 0-100%)",
+    ),
+    (
+        "attempt",
+        "total_percentage",
+        "Overall score as percentage (0-100)",
+        "Overall score in basis points (0-10000 = 0-100%)",
+    ),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name == "postgresql":
+        for table, column, percent_comment, basis_points_comment in _PERCENT_COLUMNS:
+            op.alter_column(
+                table,
+                column,
+                type_=sa.SmallInteger(),
+                existing_type=sa.Numeric(precision=5, scale=2),
+                existing_nullable=True,
+                comment=basis_points_comment,
+                existing_comment=percent_comment,
+                postgresql_using=f"round({column} * 100)::smallint",
+            )
+        return
+
+    for table, column, percent_comment, basis_points_comment in _PERCENT_COLUMNS:
+        op.execute(f"UPDATE {table} SET {column} = round({column} * 100)")
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                column,
+                type_=sa.SmallInteger(),
+                existing_type=sa.Numeric(precision=5, scale=2),
+                existing_nullable=True,
+                comment=basis_points_comment,
+                existing_comment=percent_comment,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "postgresql":
+        for table, column, percent_comment, basis_points_comment in _PERCENT_COLUMNS:
+            op.alter_column(
+                table,
+                column,
+                type_=sa.Numeric(precision=5, scale=2),
+                existing_type=sa.SmallInteger(),
+                existing_nullable=True,
+                comment=percent_comment,
+                existing_comment=basis_points_comment,
+                postgresql_using=f"{column} / 100.0",
+            )
+        return
+
+    for table, column, percent_comment, basis_points_comment in _PERCENT_COLUMNS:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                column,
+                type_=sa.Numeric(precision=5, scale=2),
+                existing_type=sa.SmallInteger(),
+                existing_nullable=True,
+                comment=percent_comment,
+                existing_comment=basis_points_comment,
+            )
+        op.execute(f"UPDATE {table} SET {column} = {column} / 100.0")
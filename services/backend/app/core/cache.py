@@ -0,0 +1,46 @@
+"""In-process caching utilities."""
+
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Size-bounded cache whose entries expire after a fixed time-to-live.
+
+    The cache is local to the process: with several workers each one holds
+    its own copy, so it must only be used where a stale entry for up to
+    `ttl_seconds` is acceptable.
+    """
+
+    def __init__(self, ttl_seconds: float, max_size: int):
+        self._ttl_seconds = ttl_seconds
+        self._max_size = max_size
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K) -> Optional[V]:
+        """Return the cached value for `key`, or None if absent or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """Store `value` under `key`, evicting the least recently used entry."""
+        self._entries[key] = (time.monotonic() + self._ttl_seconds, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
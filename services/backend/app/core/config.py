@@ -1,7 +1,6 @@
 """Application configuration using Pydantic Settings."""
 
 from pydantic_settings import BaseSettings
-from functools import lru_cache
 
 
 class Settings(BaseSettings):
@@ -15,7 +14,14 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str
+    database_read_url: str | None = None  # Optional replica for read endpoints
     echo_sql: bool = False  # Set to True to log SQL queries
+    db_pool_size: int = 20  # Persistent connections kept in the pool
+    db_max_overflow: int = 20  # Extra connections allowed under burst load
+    db_pool_recycle: int = 1800  # Seconds before a connection is recycled
+    db_pool_pre_ping: bool = True  # Detect dropped connections on checkout
+    db_pool_timeout: float = 10.0  # Seconds to wait for a free connection
+    db_behind_pgbouncer: bool = False  # Transaction pooling: no prepared stmts
 
     # JWT Configuration
     jwt_secret_key: str
@@ -24,6 +30,9 @@ class Settings(BaseSettings):
 
     # Magic Link Configuration
     magic_link_expiration_minutes: int = 5  # App logic
+    magic_link_cleanup_interval_seconds: int = 60  # Expired token purge period
+    magic_link_rate_limit: int = 5  # Requests per email within the window
+    magic_link_rate_limit_window_seconds: int = 900  # Sliding window length
 
     # Mail-Service Configuration
     SMTP_HOST: str
@@ -56,7 +65,18 @@ class Settings(BaseSettings):
         case_sensitive = False
 
 
-@lru_cache
+_settings: Settings | None = None
+
+
 def get_settings() -> Settings:
-    """Get cached settings instance."""
-    return Settings()
+    """Get the process-wide settings instance, creating it on first use."""
+    global _settings
+    if _settings is None:
+        _settings = Settings()
+    return _settings
+
+
+def reset_settings() -> None:
+    """Drop the cached settings so the next call re-reads the environment."""
+    global _settings
+    _settings = None
@@ -6,6 +6,9 @@ Based on: https://praciano.com.br/fastapi-and-async-sqlalchemy-20-with-pytest-do
 import contextlib
 from typing import Any, AsyncIterator
 
+from sqlalchemy import event
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import (
     AsyncConnection,
     AsyncSession,
@@ -18,6 +21,16 @@ from app.core.config import get_settings
 
 settings = get_settings()
 
+# Applied to every new SQLite connection: WAL lets readers run alongside the
+# writer and, with synchronous=NORMAL, commits no longer fsync each time.
+_SQLITE_PRAGMAS = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "cache_size=-20000",
+    "busy_timeout=5000",
+)
+
 
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models.
@@ -29,16 +42,75 @@ class Base(DeclarativeBase):
     __mapper_args__ = {"eager_defaults": True}
 
 
+def _set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    """Tune a freshly opened SQLite connection (engine `connect` event)."""
+    cursor = dbapi_connection.cursor()
+    for pragma in _SQLITE_PRAGMAS:
+        cursor.execute(f"PRAGMA {pragma}")
+    cursor.close()
+
+
+def _disable_sqlite_implicit_begin(
+    dbapi_connection: Any,
+    connection_record: Any,
+) -> None:
+    """Stop the driver from emitting its own deferred BEGIN."""
+    dbapi_connection.isolation_level = None
+
+
+# Execution option set on the write bind of a SQLite session manager
+_SQLITE_BEGIN_IMMEDIATE = "sqlite_begin_immediate"
+
+
+def _begin_sqlite_transaction(connection: Any) -> None:
+    """Emit BEGIN for a transaction (engine `begin` event).
+
+    Write sessions start with BEGIN IMMEDIATE: a deferred transaction that
+    reads first and writes later must upgrade its lock mid-transaction, which
+    fails with SQLITE_BUSY if another writer got there first. Other sessions
+    keep a plain deferred BEGIN, so they run alongside the writer under WAL.
+    """
+    if connection.get_execution_options().get(_SQLITE_BEGIN_IMMEDIATE):
+        connection.exec_driver_sql("BEGIN IMMEDIATE")
+    else:
+        connection.exec_driver_sql("BEGIN")
+
+
 class DatabaseSessionManager:
-    """Manages database engine and session lifecycle for async SQLAlchemy."""
+    """Manages database engine and session lifecycle for async SQLAlchemy.
 
-    def __init__(self, host: str, engine_kwargs: dict[str, Any] = {}):
+    `new_session` begins transactions deferred. `new_write_session` shares the
+    engine and pool but, on SQLite, takes the write lock when its transaction
+    begins; it is meant for code that reads and then writes.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        engine_kwargs: dict[str, Any] = {},
+        read_only: bool = False,
+    ):
         self._engine = create_async_engine(host, **engine_kwargs)
+        self._write_engine = self._engine
+        if self._engine.dialect.name == "sqlite":
+            sync_engine = self._engine.sync_engine
+            event.listen(sync_engine, "connect", _set_sqlite_pragmas)
+            if not read_only:
+                event.listen(sync_engine, "connect", _disable_sqlite_implicit_begin)
+                event.listen(sync_engine, "begin", _begin_sqlite_transaction)
+                self._write_engine = self._engine.execution_options(
+                    **{_SQLITE_BEGIN_IMMEDIATE: True},
+                )
         self._sessionmaker = async_sessionmaker(
             autocommit=False,
             bind=self._engine,
             expire_on_commit=False,
         )
+        self._write_sessionmaker = async_sessionmaker(
+            autocommit=False,
+            bind=self._write_engine,
+            expire_on_commit=False,
+        )
 
     async def close(self):
         """Close database engine and clean up resources."""
@@ -47,7 +119,9 @@ class DatabaseSessionManager:
         await self._engine.dispose()
 
         self._engine = None
+        self._write_engine = None
         self._sessionmaker = None
+        self._write_sessionmaker = None
 
     @contextlib.asynccontextmanager
     async def connect(self) -> AsyncIterator[AsyncConnection]:
@@ -55,20 +129,31 @@ class DatabaseSessionManager:
         if self._engine is None:
             raise Exception("DatabaseSessionManager is not initialized")
 
-        async with self._engine.begin() as connection:
+        async with self._write_engine.begin() as connection:
             try:
                 yield connection
             except Exception:
                 await connection.rollback()
                 raise
 
-    @contextlib.asynccontextmanager
-    async def session(self) -> AsyncIterator[AsyncSession]:
-        """Get a database session with automatic cleanup."""
+    def new_session(self) -> AsyncSession:
+        """Create a new session; the caller is responsible for closing it."""
         if self._sessionmaker is None:
             raise Exception("DatabaseSessionManager is not initialized")
 
-        session = self._sessionmaker()
+        return self._sessionmaker()
+
+    def new_write_session(self) -> AsyncSession:
+        """Create a session that reads then writes; the caller must close it."""
+        if self._write_sessionmaker is None:
+            raise Exception("DatabaseSessionManager is not initialized")
+
+        return self._write_sessionmaker()
+
+    @contextlib.asynccontextmanager
+    async def session(self) -> AsyncIterator[AsyncSession]:
+        """Get a database session with automatic cleanup."""
+        session = self.new_session()
         try:
             yield session
         except Exception:
@@ -78,10 +163,64 @@ class DatabaseSessionManager:
             await session.close()
 
 
+def upsert_insert(session: AsyncSession, entity: Any):
+    """Build an INSERT for `entity` that supports ON CONFLICT clauses.
+
+    PostgreSQL and SQLite (used in tests) both implement ON CONFLICT, but
+    SQLAlchemy exposes it through dialect-specific insert constructs.
+    """
+    if session.get_bind().dialect.name == "postgresql":
+        return postgresql.insert(entity)
+    return sqlite.insert(entity)
+
+
+def _build_engine_kwargs(url: str) -> dict[str, Any]:
+    """Build engine options, including connection pool sizing for server DBs.
+
+    SQLite (used in tests) keeps SQLAlchemy's default pool, which does not
+    accept the queue pool options.
+    """
+    engine_kwargs: dict[str, Any] = {"echo": settings.echo_sql}
+    url_info = make_url(url)
+    if url_info.get_backend_name() == "sqlite":
+        return engine_kwargs
+
+    engine_kwargs.update(
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        pool_timeout=settings.db_pool_timeout,
+    )
+    if url_info.get_driver_name() == "asyncpg":
+        # Short OLTP queries do not benefit from JIT compilation.
+        connect_args: dict[str, Any] = {"server_settings": {"jit": "off"}}
+        if settings.db_behind_pgbouncer:
+            # PgBouncer in transaction mode hands each transaction a different
+            # server connection, so prepared statements cached on one
+            # connection are unknown on the next.
+            connect_args["statement_cache_size"] = 0
+            connect_args["prepared_statement_cache_size"] = 0
+        engine_kwargs["connect_args"] = connect_args
+    return engine_kwargs
+
+
 # Initialize global session manager
 sessionmanager = DatabaseSessionManager(
     settings.database_url,
-    {"echo": settings.echo_sql},
+    _build_engine_kwargs(settings.database_url),
+)
+
+# Separate engine and pool for read-only endpoints, e.g. against a streaming
+# replica, so reads do not queue behind writes for primary connections.
+read_sessionmanager: DatabaseSessionManager | None = (
+    DatabaseSessionManager(
+        settings.database_read_url,
+        _build_engine_kwargs(settings.database_read_url),
+        read_only=True,
+    )
+    if settings.database_read_url
+    else None
 )
 
 
@@ -96,5 +235,62 @@ async def get_db_session():
         async def get_items(db: DBSessionDep):
             ...
     """
-    async with sessionmanager.session() as session:
+    # Manage the session inline rather than through sessionmanager.session()
+    # to avoid an extra context-manager layer on every request.
+    session = sessionmanager.new_session()
+    try:
+        yield session
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
+
+
+async def get_write_db_session():
+    """
+    FastAPI dependency for a session that reads and then writes.
+
+    On SQLite its transactions begin IMMEDIATE, so the write lock is taken
+    up front instead of being upgraded mid-transaction. Elsewhere it is the
+    same as get_db_session.
+
+    Usage:
+        from app.shared.dependencies import WriteDBSessionDep
+
+        @router.post("/items")
+        async def create_item(db: WriteDBSessionDep):
+            ...
+    """
+    session = sessionmanager.new_write_session()
+    try:
+        yield session
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
+
+
+async def get_read_db_session():
+    """
+    FastAPI dependency for a session used only for reads.
+
+    Uses the read engine when DATABASE_READ_URL is configured and a read
+    session on the primary engine otherwise. Never commit through this session.
+
+    Usage:
+        from app.shared.dependencies import ReadDBSessionDep
+
+        @router.get("/items")
+        async def get_items(db: ReadDBSessionDep):
+            ...
+    """
+    session = (read_sessionmanager or sessionmanager).new_session()
+    try:
         yield session
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
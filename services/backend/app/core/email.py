@@ -1,5 +1,7 @@
 from email.message import EmailMessage
 from typing import Optional
+import asyncio
+import html
 import logging
 import aiosmtplib
 from .config import get_settings
@@ -7,16 +9,39 @@ from .config import get_settings
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
+# SMTP configuration read once at import; used as MailService defaults.
+_SMTP_HOST = settings.SMTP_HOST
+_SMTP_PORT = settings.SMTP_PORT
+_SMTP_USER = settings.SMTP_USER
+_SMTP_PASSWORD = settings.SMTP_PASSWORD
+_SMTP_USE_TLS = settings.SMTP_USE_TLS
+_SMTP_FROM = settings.SMTP_FROM
+
+_MAGIC_LINK_SUBJECT = "Ihr Login-Link"
+_MAGIC_LINK_TEXT_TEMPLATE = (
+    "Sehr geehrter KI-Tutor Nutzer,"
+    "Nutzen Sie folgenden Link, um sich anzumelden:\n{link}\n\n"
+    "Wenn Sie diese Anfrage nicht gestellt haben, ignorieren Sie diese E-Mail."
+)
+_MAGIC_LINK_HTML_TEMPLATE = (
+    "<html><body>"
+    "<p>Sehr geehrter KI-Tutor Nutzer,</p>"
+    "<p>Nutzen Sie folgenden Link, um sich anzumelden:</p>"
+    '<p><a href="{link}">Hier klicken, um einzuloggen</a></p>'
+    "<p>Wenn Sie diese Anfrage nicht gestellt haben, ignorieren Sie diese E-Mail.</p>"
+    "</body></html>"
+)
+
 
 class MailService:
     def __init__(
         self,
-        host: str = settings.SMTP_HOST,
-        port: int = settings.SMTP_PORT,
-        username: Optional[str] = settings.SMTP_USER,
-        password: Optional[str] = settings.SMTP_PASSWORD,
-        use_tls: bool = settings.SMTP_USE_TLS,
-        sender: str = settings.SMTP_FROM,
+        host: str = _SMTP_HOST,
+        port: int = _SMTP_PORT,
+        username: Optional[str] = _SMTP_USER,
+        password: Optional[str] = _SMTP_PASSWORD,
+        use_tls: bool = _SMTP_USE_TLS,
+        sender: str = _SMTP_FROM,
     ):
         self.host = host
         self.port = port
@@ -24,6 +49,10 @@ class MailService:
         self.password = password
         self.use_tls = use_tls
         self.sender = sender
+        # Persistent SMTP connection, reused across sends so the TLS
+        # handshake and AUTH are paid once instead of per message.
+        self._client: Optional[aiosmtplib.SMTP] = None
+        self._lock = asyncio.Lock()
 
     async def send(self, to: str, subject: str, html: str, text: Optional[str] = None):
         """
@@ -51,31 +80,47 @@ class MailService:
         else:
             msg.set_content(html, subtype="html")
 
-        await aiosmtplib.send(
-            msg,
-            hostname=self.host,
-            port=self.port,
-            username=self.username,
-            password=self.password,
-            start_tls=self.use_tls,
-        )
+        async with self._lock:
+            try:
+                await self._send_message(msg)
+            except aiosmtplib.SMTPServerDisconnected:
+                # Server dropped the idle connection; reconnect once and retry.
+                logger.info("SMTP connection lost, reconnecting")
+                await self._disconnect()
+                await self._send_message(msg)
+
+    async def close(self) -> None:
+        """Close the pooled SMTP connection, if any."""
+        async with self._lock:
+            await self._disconnect()
+
+    async def _send_message(self, msg: EmailMessage) -> None:
+        if self._client is None or not self._client.is_connected:
+            self._client = aiosmtplib.SMTP(
+                hostname=self.host,
+                port=self.port,
+                username=self.username,
+                password=self.password,
+                start_tls=self.use_tls,
+            )
+            await self._client.connect()
+        await self._client.send_message(msg)
+
+    async def _disconnect(self) -> None:
+        client, self._client = self._client, None
+        if client is None or not client.is_connected:
+            return
+        try:
+            await client.quit()
+        except aiosmtplib.SMTPException:
+            client.close()
 
     def build_magic_link_email(self, email: str, magiclink: str):
         """
         Returns (subject, html_body, text_body)
         """
-        subject = "Ihr Login-Link"
-        text = (
-            "Sehr geehrter KI-Tutor Nutzer,"
-            f"Nutzen Sie folgenden Link, um sich anzumelden:\n{magiclink}\n\n"
-            "Wenn Sie diese Anfrage nicht gestellt haben, ignorieren Sie diese E-Mail."
-        )
-        html = (
-            "<html><body>"
-            "<p>Sehr geehrter KI-Tutor Nutzer,</p>"
-            "<p>Nutzen Sie folgenden Link, um sich anzumelden:</p>"
-            f'<p><a href="{magiclink}">Hier klicken, um einzuloggen</a></p>'
-            "<p>Wenn Sie diese Anfrage nicht gestellt haben, ignorieren Sie diese E-Mail.</p>"
-            "</body></html>"
+        return (
+            _MAGIC_LINK_SUBJECT,
+            _MAGIC_LINK_HTML_TEMPLATE.format(link=html.escape(magiclink, quote=True)),
+            _MAGIC_LINK_TEXT_TEMPLATE.format(link=magiclink),
         )
-        return subject, html, text
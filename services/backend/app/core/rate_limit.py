@@ -0,0 +1,57 @@
+"""In-process rate limiting utilities."""
+
+import time
+from collections import deque
+from typing import Hashable
+
+_MIN_PRUNE_THRESHOLD = 1024
+
+
+class SlidingWindowRateLimiter:
+    """
+    Allow at most `max_hits` hits per key within a sliding time window.
+
+    State is local to the process, so with several workers the effective
+    limit is `max_hits` per worker.
+    """
+
+    def __init__(self, max_hits: int, window_seconds: float):
+        self._max_hits = max_hits
+        self._window_seconds = window_seconds
+        self._hits: dict[Hashable, deque[float]] = {}
+        self._prune_threshold = _MIN_PRUNE_THRESHOLD
+
+    def hit(self, key: Hashable) -> bool:
+        """
+        Record a hit for `key` unless it already reached the limit.
+
+        Returns:
+            True if the hit is allowed, False if the key is throttled
+        """
+        now = time.monotonic()
+        window_start = now - self._window_seconds
+        hits = self._hits.setdefault(key, deque())
+        while hits and hits[0] <= window_start:
+            hits.popleft()
+
+        if len(hits) >= self._max_hits:
+            return False
+
+        hits.append(now)
+        if len(self._hits) >= self._prune_threshold:
+            self._prune(window_start)
+        return True
+
+    def reset(self) -> None:
+        """Forget all recorded hits."""
+        self._hits.clear()
+        self._prune_threshold = _MIN_PRUNE_THRESHOLD
+
+    def _prune(self, window_start: float) -> None:
+        """Drop keys whose newest hit has left the window."""
+        stale = [key for key, hits in self._hits.items() if hits[-1] <= window_start]
+        for key in stale:
+            del self._hits[key]
+        # Sweep again only once the table has doubled, keeping hit() O(1)
+        # amortized.
+        self._prune_threshold = max(_MIN_PRUNE_THRESHOLD, 2 * len(self._hits))
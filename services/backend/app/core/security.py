@@ -4,9 +4,9 @@ This module provides functions for creating and verifying JWT tokens
 used for authentication after successful Magic Link verification.
 """
 
-from datetime import datetime, timedelta, timezone
+import time
 
-from jose import jwt, JWTError
+import jwt
 
 from app.core.config import get_settings
 from app.shared.schemas import TokenPayload
@@ -29,12 +29,10 @@ def create_jwt_token(payload: TokenPayload) -> str:
     """
     settings = get_settings()
 
-    expiration = datetime.now(timezone.utc) + timedelta(
-        hours=settings.jwt_expiration_hours,
-    )
-
+    # NumericDate (seconds since epoch) avoids building datetime objects that
+    # the JWT library would convert back to a timestamp anyway.
     claims = payload.to_jwt_claims()
-    claims["exp"] = expiration
+    claims["exp"] = int(time.time()) + settings.jwt_expiration_hours * 3600
 
     token = jwt.encode(
         claims,
@@ -56,7 +54,7 @@ def verify_jwt_token(token: str) -> TokenPayload:
         TokenPayload containing authenticated user data
 
     Raises:
-        JWTError: If token is invalid, expired, or malformed
+        jwt.PyJWTError: If token is invalid, expired, or malformed
         KeyError: If required claims are missing
         ValueError: If claim values are invalid
     """
@@ -66,6 +64,7 @@ def verify_jwt_token(token: str) -> TokenPayload:
         token,
         settings.jwt_secret_key,
         algorithms=[settings.jwt_algorithm],
+        options={"require": ["exp"]},
     )
 
     return TokenPayload.from_jwt_claims(claims)
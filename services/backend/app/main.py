@@ -1,5 +1,7 @@
 """Main FastAPI application with router registration."""
 
+import asyncio
+import contextlib
 import logging
 
 from fastapi import FastAPI
@@ -7,6 +9,7 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import get_settings
 from app.modules.auth.router import router as auth_router
+from app.modules.auth.tasks import run_magic_link_token_cleanup
 from app.modules.auth.exception_handlers import (
     register_exception_handlers as register_auth_exception_handlers,
 )
@@ -23,6 +26,7 @@ from app.modules.learning.exception_handlers import (
     register_exception_handlers as register_learning_exception_handlers,
 )
 from app.modules.learning.public.subscribers import register_quiz_subscribers
+from app.shared.dependencies import close_mailer
 
 settings = get_settings()
 
@@ -36,11 +40,35 @@ if not root_logger.handlers:
         format="%(asctime)s %(levelname)s %(name)s %(message)s",
     )
 
+# Only let SQLAlchemy build per-statement log records when SQL echo is on;
+# otherwise a DEBUG/INFO root logger would log every query.
+logging.getLogger("sqlalchemy.engine").setLevel(
+    logging.INFO if settings.echo_sql else logging.WARNING,
+)
+logging.getLogger("sqlalchemy.pool").setLevel(logging.WARNING)
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run background jobs for the app's lifetime and release shared clients."""
+    cleanup_task = asyncio.create_task(
+        run_magic_link_token_cleanup(settings.magic_link_cleanup_interval_seconds),
+    )
+    try:
+        yield
+    finally:
+        cleanup_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await cleanup_task
+        await close_mailer()
+
+
 app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     description="AI-powered learning platform API with modular monolith architecture (3-Module Structure)",
     debug=settings.debug,
+    lifespan=lifespan,
 )
 
 # Wire shared ports and register cross-module subscribers.
@@ -48,18 +76,25 @@ register_quiz_ports(app)
 register_llm_ports(app)
 register_quiz_subscribers(get_quiz_event_publisher())
 
+# Explicit methods/headers (what the frontend actually sends) instead of
+# wildcards, so preflight responses are built from fixed values.
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[settings.frontend_base_url],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE"],
+    allow_headers=["Authorization", "Content-Type", "X-Edit-Session-Id"],
+    # The attempt list advertises its next page in a Link header
+    expose_headers=["Link"],
 )
 
 # Register module exception handlers
-register_auth_exception_handlers(app)
-register_quiz_exception_handlers(app)
-register_learning_exception_handlers(app)
+for register_exception_handlers in (
+    register_auth_exception_handlers,
+    register_quiz_exception_handlers,
+    register_learning_exception_handlers,
+):
+    register_exception_handlers(app)
 
 # Register module routers
 app.include_router(auth_router)
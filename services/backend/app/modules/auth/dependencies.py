@@ -4,6 +4,9 @@ from typing import Annotated
 
 from fastapi import Depends
 
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+from app.core.rate_limit import SlidingWindowRateLimiter
 from app.shared.dependencies import DBSessionDep
 from app.modules.auth.repositories.magic_link_token_repository import (
     MagicLinkTokenRepository,
@@ -13,6 +16,20 @@ from app.modules.auth.services import MagicLinkService
 from app.modules.auth.services.account_service import AccountService
 
 
+# Email hashes known to be registered, shared by all requests of this process.
+# Short TTL: other workers may delete an account without invalidating it here.
+registered_users_cache: TTLCache[bytes, bool] = TTLCache(
+    ttl_seconds=60,
+    max_size=10_000,
+)
+
+# Magic link requests per email hash, checked before any database work.
+magic_link_rate_limiter = SlidingWindowRateLimiter(
+    max_hits=get_settings().magic_link_rate_limit,
+    window_seconds=get_settings().magic_link_rate_limit_window_seconds,
+)
+
+
 def get_user_repository(db: DBSessionDep) -> UserRepository:
     return UserRepository(db)
 
@@ -33,14 +50,24 @@ def get_magic_link_service(
     user_repo: UserRepositoryDep,
     token_repo: MagicLinkTokenRepositoryDep,
 ) -> MagicLinkService:
-    return MagicLinkService(db=db, user_repo=user_repo, token_repo=token_repo)
+    return MagicLinkService(
+        db=db,
+        user_repo=user_repo,
+        token_repo=token_repo,
+        registered_users=registered_users_cache,
+        rate_limiter=magic_link_rate_limiter,
+    )
 
 
 def get_account_service(
     db: DBSessionDep,
     user_repo: UserRepositoryDep,
 ) -> AccountService:
-    return AccountService(db=db, user_repo=user_repo)
+    return AccountService(
+        db=db,
+        user_repo=user_repo,
+        registered_users=registered_users_cache,
+    )
 
 
 MagicLinkServiceDep = Annotated[MagicLinkService, Depends(get_magic_link_service)]
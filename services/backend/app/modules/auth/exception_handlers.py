@@ -1,7 +1,8 @@
 """Exception handlers for auth module."""
 
-from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+import json
+
+from fastapi import FastAPI, Request, Response
 
 from app.modules.auth.exceptions import (
     MagicLinkTokenExpiredError,
@@ -9,6 +10,11 @@ from app.modules.auth.exceptions import (
     UserNotRegisteredError,
 )
 
+# Auth error messages are static, so the JSON bodies are serialized once.
+_TOKEN_INVALID_BODY = json.dumps({"detail": "Invalid or expired token"}).encode()
+_TOKEN_EXPIRED_BODY = json.dumps({"detail": "Token expired"}).encode()
+_USER_NOT_REGISTERED_BODY = json.dumps({"detail": "User not registered"}).encode()
+
 
 def register_exception_handlers(app: FastAPI) -> None:
     """Register auth module exception handlers with the FastAPI app."""
@@ -17,28 +23,31 @@ def register_exception_handlers(app: FastAPI) -> None:
     async def magic_link_token_invalid_handler(
         request: Request,
         exc: MagicLinkTokenInvalidError,
-    ) -> JSONResponse:
-        return JSONResponse(
+    ) -> Response:
+        return Response(
+            content=_TOKEN_INVALID_BODY,
             status_code=404,
-            content={"detail": "Invalid or expired token"},
+            media_type="application/json",
         )
 
     @app.exception_handler(MagicLinkTokenExpiredError)
     async def magic_link_token_expired_handler(
         request: Request,
         exc: MagicLinkTokenExpiredError,
-    ) -> JSONResponse:
-        return JSONResponse(
+    ) -> Response:
+        return Response(
+            content=_TOKEN_EXPIRED_BODY,
             status_code=401,
-            content={"detail": "Token expired"},
+            media_type="application/json",
         )
 
     @app.exception_handler(UserNotRegisteredError)
     async def user_not_registered_handler(
         request: Request,
         exc: UserNotRegisteredError,
-    ) -> JSONResponse:
-        return JSONResponse(
+    ) -> Response:
+        return Response(
+            content=_USER_NOT_REGISTERED_BODY,
             status_code=404,
-            content={"detail": "User not registered"},
+            media_type="application/json",
         )
@@ -1,9 +1,9 @@
 """Magic link token model for authentication module."""
 
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime
 
-from sqlalchemy import DateTime, String
+from sqlalchemy import DateTime, Index, LargeBinary, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.database import Base
@@ -13,13 +13,13 @@ class MagicLinkToken(Base):
     """
     Magic Link Token model for passwordless authentication.
 
-    Tokens are stored as SHA-256 hashes for security. The actual token is
+    Tokens are stored as raw 32-byte SHA-256 digests for security. The actual token is
     generated using secrets.token_urlsafe(32) and sent to the user via email.
 
     Attributes:
         id: UUID primary key
-        token_hash: SHA-256 hash of the actual token (unique)
-        email_hash: SHA-256 hash of the user's email address (unique)
+        token_hash: SHA-256 digest of the actual token (hash-indexed)
+        email_hash: SHA-256 digest of the user's email address (unique)
         created_at: Timestamp when token was created
         expires_at: Timestamp when token expires (created_at + 5 minutes)
     """
@@ -32,16 +32,14 @@ class MagicLinkToken(Base):
         comment="UUID primary key",
     )
 
-    token_hash: Mapped[str] = mapped_column(
-        String(64),
-        unique=True,
+    token_hash: Mapped[bytes] = mapped_column(
+        LargeBinary(32),
         nullable=False,
-        index=True,
         comment="SHA-256 hash of the magic link token",
     )
 
-    email_hash: Mapped[str] = mapped_column(
-        String(64),
+    email_hash: Mapped[bytes] = mapped_column(
+        LargeBinary(32),
         unique=True,
         nullable=False,
         index=True,
@@ -50,7 +48,7 @@ class MagicLinkToken(Base):
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
         nullable=False,
         comment="Timestamp when the token was created",
     )
@@ -62,9 +60,23 @@ class MagicLinkToken(Base):
         comment="Timestamp when the token expires",
     )
 
+    # Load server-generated created_at via RETURNING in the INSERT itself.
+    __mapper_args__ = {"eager_defaults": True}
+
+    # token_hash is only ever matched by equality and is 256 bits of entropy,
+    # so a hash index replaces the unique B-tree. email_hash stays a unique
+    # B-tree because it enforces one pending token per address.
+    __table_args__ = (
+        Index(
+            "ix_magic_link_token_token_hash_lookup",
+            "token_hash",
+            postgresql_using="hash",
+        ),
+    )
+
     def __repr__(self) -> str:
         return (
             f"<MagicLinkToken(id={self.id}, "
-            f"token_hash={self.token_hash[:8]}..., "
+            f"token_hash={self.token_hash[:4].hex()}..., "
             f"expires_at={self.expires_at})>"
         )
@@ -1,9 +1,9 @@
 """User model for authentication module."""
 
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime
 
-from sqlalchemy import DateTime, String
+from sqlalchemy import DateTime, LargeBinary, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.database import Base
@@ -15,7 +15,7 @@ class User(Base):
 
     Attributes:
         user_id: UUID primary key and reference point for all data relationships
-        email_hash: Hash of email address; used solely to assign Magic Link dispatch
+        email_hash: SHA-256 digest of email address; used solely to assign Magic Link dispatch
                    to an existing account
         created_at: Timestamp when the user was created (optional, for auditing)
     """
@@ -28,8 +28,8 @@ class User(Base):
         comment="UUID primary key and reference point for all data relationships",
     )
 
-    email_hash: Mapped[str] = mapped_column(
-        String(64),  # SHA-256 hash is 64 characters in hex
+    email_hash: Mapped[bytes] = mapped_column(
+        LargeBinary(32),  # Raw SHA-256 digest
         unique=True,
         nullable=False,
         index=True,  # Index for fast lookups during Magic Link dispatch
@@ -38,10 +38,15 @@ class User(Base):
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
         nullable=False,
         comment="Timestamp when the user account was created",
     )
 
+    # Load server-generated created_at via RETURNING in the INSERT itself.
+    __mapper_args__ = {"eager_defaults": True}
+
     def __repr__(self) -> str:
-        return f"<User(user_id={self.user_id}, email_hash={self.email_hash[:8]}...)>"
+        return (
+            f"<User(user_id={self.user_id}, email_hash={self.email_hash[:4].hex()}...)>"
+        )
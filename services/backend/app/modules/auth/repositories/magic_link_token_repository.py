@@ -8,10 +8,36 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import Row, bindparam, delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.modules.auth.models import MagicLinkToken
+from app.core.database import upsert_insert
+from app.modules.auth.models import MagicLinkToken, User
+
+# Hot-path statements are built once at import time; each call only binds
+# parameters, so SQLAlchemy reuses the cached compiled form without
+# reconstructing the statement.
+_GET_BY_TOKEN_HASH = select(MagicLinkToken).where(
+    MagicLinkToken.token_hash == bindparam("token_hash"),
+)
+_CLAIM_BY_TOKEN_HASH = (
+    delete(MagicLinkToken)
+    .where(MagicLinkToken.token_hash == bindparam("token_hash"))
+    .returning(
+        MagicLinkToken.id,
+        MagicLinkToken.email_hash,
+        MagicLinkToken.expires_at,
+        # Resolve the owning user in the same round-trip; NULL if the
+        # account no longer exists.
+        select(User.user_id)
+        .where(User.email_hash == MagicLinkToken.email_hash)
+        .scalar_subquery()
+        .label("user_id"),
+    )
+)
+_DELETE_BY_EMAIL_HASH = delete(MagicLinkToken).where(
+    MagicLinkToken.email_hash == bindparam("email_hash"),
+)
 
 
 class MagicLinkTokenRepository:
@@ -28,16 +54,16 @@ class MagicLinkTokenRepository:
 
     async def create(
         self,
-        token_hash: str,
-        email_hash: str,
+        token_hash: bytes,
+        email_hash: bytes,
         expires_at: datetime,
     ) -> MagicLinkToken:
         """
         Create a new magic link token.
 
         Args:
-            token_hash: SHA-256 hash of the token
-            email_hash: SHA-256 hash of the user's email
+            token_hash: SHA-256 digest of the token
+            email_hash: SHA-256 digest of the user's email
             expires_at: Expiration timestamp
 
         Returns:
@@ -53,23 +79,56 @@ class MagicLinkTokenRepository:
         )
         self.db.add(magic_link_token)
         await self.db.flush()  # Flush to detect constraint violations
-        await self.db.refresh(magic_link_token)  # Refresh to load all fields
         return magic_link_token
 
-    async def get_by_token_hash(self, token_hash: str) -> Optional[MagicLinkToken]:
+    async def upsert(
+        self,
+        token_hash: bytes,
+        email_hash: bytes,
+        expires_at: datetime,
+    ) -> None:
+        """
+        Create the magic link token for an email, replacing any existing one.
+
+        Uses INSERT ... ON CONFLICT (email_hash) DO UPDATE, so issuing a new
+        token invalidates the previous one in a single statement.
+
+        Args:
+            token_hash: SHA-256 digest of the token
+            email_hash: SHA-256 digest of the user's email
+            expires_at: Expiration timestamp
+        """
+        stmt = upsert_insert(self.db, MagicLinkToken).values(
+            token_hash=token_hash,
+            email_hash=email_hash,
+            expires_at=expires_at,
+        )
+        await self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[MagicLinkToken.email_hash],
+                set_={
+                    "token_hash": stmt.excluded.token_hash,
+                    "created_at": func.now(),
+                    "expires_at": stmt.excluded.expires_at,
+                },
+            ),
+        )
+
+    async def get_by_token_hash(self, token_hash: bytes) -> Optional[MagicLinkToken]:
         """
         Get magic link token by token hash.
 
         This is used during verification to find the token record.
 
         Args:
-            token_hash: SHA-256 hash of the token
+            token_hash: SHA-256 digest of the token
 
         Returns:
             MagicLinkToken instance if found, None otherwise
         """
         result = await self.db.execute(
-            select(MagicLinkToken).where(MagicLinkToken.token_hash == token_hash),
+            _GET_BY_TOKEN_HASH,
+            {"token_hash": token_hash},
         )
         return result.scalar_one_or_none()
 
@@ -86,11 +145,7 @@ class MagicLinkTokenRepository:
         Returns:
             True if token was deleted, False if token was not found
         """
-        # Use the token object to delete
-        result = await self.db.execute(
-            select(MagicLinkToken).where(MagicLinkToken.id == token_id),
-        )
-        token = result.scalar_one_or_none()
+        token = await self.db.get(MagicLinkToken, token_id)
 
         if token is None:
             return False
@@ -99,24 +154,57 @@ class MagicLinkTokenRepository:
         await self.db.flush()
         return True
 
-    async def delete_by_email_hash(self, email_hash: str) -> bool:
+    async def claim_by_token_hash(
+        self,
+        token_hash: bytes,
+    ) -> Optional[Row[tuple[uuid.UUID, bytes, datetime, Optional[uuid.UUID]]]]:
         """
-        Delete magic link token by email hash.
+        Delete a magic link token by token hash and return its data.
+
+        Lookup and deletion happen in a single DELETE ... RETURNING statement,
+        so a token can be claimed at most once even under concurrent requests.
+        The statement also resolves the user owning the token's email hash.
 
         Args:
-            email_hash: SHA-256 hash of the user's email
+            token_hash: SHA-256 digest of the token
 
         Returns:
-            True if token was deleted, False if no token existed
+            Row with id, email_hash, expires_at and user_id (None if no user
+            is registered for the email) if a token was deleted, None otherwise
         """
         result = await self.db.execute(
-            select(MagicLinkToken).where(MagicLinkToken.email_hash == email_hash),
+            _CLAIM_BY_TOKEN_HASH,
+            {"token_hash": token_hash},
         )
-        token = result.scalar_one_or_none()
+        return result.first()
 
-        if token is None:
-            return False
+    async def delete_expired(self, now: datetime) -> int:
+        """
+        Delete all magic link tokens that expired before the given time.
 
-        await self.db.delete(token)
-        await self.db.flush()
-        return True
+        Args:
+            now: Reference timestamp; tokens with expires_at < now are deleted
+
+        Returns:
+            Number of deleted tokens
+        """
+        result = await self.db.execute(
+            delete(MagicLinkToken).where(MagicLinkToken.expires_at < now),
+        )
+        return result.rowcount
+
+    async def delete_by_email_hash(self, email_hash: bytes) -> bool:
+        """
+        Delete magic link token by email hash.
+
+        Args:
+            email_hash: SHA-256 digest of the user's email
+
+        Returns:
+            True if token was deleted, False if no token existed
+        """
+        result = await self.db.execute(
+            _DELETE_BY_EMAIL_HASH,
+            {"email_hash": email_hash},
+        )
+        return result.rowcount > 0
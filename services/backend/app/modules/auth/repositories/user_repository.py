@@ -7,11 +7,19 @@ Repository pattern: isolates database operations from business logic.
 import uuid
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.database import upsert_insert
 from app.modules.auth.models import User
 
+# Hot-path statements are built once at import time; each call only binds
+# parameters.
+_GET_BY_EMAIL_HASH = select(User).where(User.email_hash == bindparam("email_hash"))
+_EXISTS_BY_EMAIL_HASH = (
+    select(1).where(User.email_hash == bindparam("email_hash")).limit(1)
+)
+
 
 class UserRepository:
     """Repository for User database operations."""
@@ -25,12 +33,12 @@ class UserRepository:
         """
         self.db = db
 
-    async def create(self, email_hash: str) -> User:
+    async def create(self, email_hash: bytes) -> User:
         """
         Create a new user with the given email hash.
 
         Args:
-            email_hash: SHA-256 hash of the user's email
+            email_hash: SHA-256 digest of the user's email
 
         Returns:
             Created User instance
@@ -41,9 +49,30 @@ class UserRepository:
         user = User(email_hash=email_hash)
         self.db.add(user)
         await self.db.flush()  # Flush to get the generated user_id
-        await self.db.refresh(user)  # Refresh to load all fields
         return user
 
+    async def create_if_absent(self, email_hash: bytes) -> bool:
+        """
+        Create a user unless one with the given email hash already exists.
+
+        Uses INSERT ... ON CONFLICT DO NOTHING, so the existence check and the
+        insert are one atomic statement and concurrent registrations of the
+        same address cannot race.
+
+        Args:
+            email_hash: SHA-256 digest of the user's email
+
+        Returns:
+            True if a new user was created, False if it already existed
+        """
+        result = await self.db.execute(
+            upsert_insert(self.db, User)
+            .values(email_hash=email_hash)
+            .on_conflict_do_nothing(index_elements=[User.email_hash])
+            .returning(User.user_id),
+        )
+        return result.first() is not None
+
     async def get_by_id(self, user_id: uuid.UUID) -> Optional[User]:
         """
         Get user by ID.
@@ -54,36 +83,39 @@ class UserRepository:
         Returns:
             User instance if found, None otherwise
         """
-        result = await self.db.execute(select(User).where(User.user_id == user_id))
-        return result.scalar_one_or_none()
+        return await self.db.get(User, user_id)
 
-    async def get_by_email_hash(self, email_hash: str) -> Optional[User]:
+    async def get_by_email_hash(self, email_hash: bytes) -> Optional[User]:
         """
         Get user by email hash.
 
         Args:
-            email_hash: SHA-256 hash of the email address
+            email_hash: SHA-256 digest of the email address
 
         Returns:
             User instance if found, None otherwise
         """
         result = await self.db.execute(
-            select(User).where(User.email_hash == email_hash),
+            _GET_BY_EMAIL_HASH,
+            {"email_hash": email_hash},
         )
         return result.scalar_one_or_none()
 
-    async def exists_by_email_hash(self, email_hash: str) -> bool:
+    async def exists_by_email_hash(self, email_hash: bytes) -> bool:
         """
         Check if a user with the given email hash exists.
 
         Args:
-            email_hash: SHA-256 hash of the email address
+            email_hash: SHA-256 digest of the email address
 
         Returns:
             True if user exists, False otherwise
         """
-        user = await self.get_by_email_hash(email_hash)
-        return user is not None
+        result = await self.db.execute(
+            _EXISTS_BY_EMAIL_HASH,
+            {"email_hash": email_hash},
+        )
+        return result.scalar() is not None
 
     async def delete(self, user_id: uuid.UUID) -> bool:
         """
@@ -27,7 +27,7 @@ REGISTER_ALREADY_REGISTERED_MESSAGE = (
 
 
 @router.get("/health")
-async def health_check():
+async def health_check() -> dict[str, str]:
     """Health check endpoint for auth module."""
     return {"status": "ok", "module": "auth"}
 
@@ -182,7 +182,7 @@ async def report_error(
     request: ReportRequest,
     user_id: CurrentUserId,
     mailer: Annotated[MailService, Depends(get_mailer)],
-):
+) -> ReportResponse:
     """Report an application error. Sends an email to the configured support address.
 
     The authenticated user's id is included for context.
@@ -4,15 +4,22 @@ import uuid
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import TTLCache
 from app.modules.auth.repositories.user_repository import UserRepository
 
 
 class AccountService:
     """Service for user account operations."""
 
-    def __init__(self, db: AsyncSession, user_repo: UserRepository):
+    def __init__(
+        self,
+        db: AsyncSession,
+        user_repo: UserRepository,
+        registered_users: TTLCache[bytes, bool] | None = None,
+    ):
         self.db = db
         self.user_repo = user_repo
+        self.registered_users = registered_users
 
     async def delete_user_account(self, user_id: uuid.UUID) -> bool:
         """Delete a user account and commit the transaction.
@@ -22,4 +29,8 @@ class AccountService:
         deleted = await self.user_repo.delete(user_id)
         if deleted:
             await self.db.commit()
+            if self.registered_users is not None:
+                # Only the user id is known here; deletions are rare enough
+                # to simply drop the whole cache.
+                self.registered_users.clear()
         return deleted
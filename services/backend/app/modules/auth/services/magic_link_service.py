@@ -6,15 +6,20 @@ This module orchestrates authentication operations including:
 - JWT token generation
 """
 
+import base64
+import binascii
 import hashlib
 import asyncio
+import contextlib
 import logging
 import secrets
 from datetime import datetime, timedelta, timezone
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import TTLCache
 from app.core.config import get_settings
+from app.core.rate_limit import SlidingWindowRateLimiter
 from app.core.security import create_jwt_token
 from app.modules.auth.services.dtos import MagicLinkResult, TokenResult
 from app.modules.auth.exceptions import (
@@ -33,6 +38,16 @@ from app.shared.dependencies import get_mailer
 
 logger = logging.getLogger(__name__)
 
+_sha256 = hashlib.sha256
+
+# Upper bound on magic link emails sent in the background. Beyond it the
+# request sends the email itself, so bursts apply back-pressure to callers
+# instead of piling up tasks on the event loop.
+_MAX_PENDING_MAGIC_LINK_SENDS = 100
+# Strong references to in-flight send tasks; the event loop only keeps weak
+# references, so unreferenced tasks could be garbage collected mid-send.
+_pending_sends: set[asyncio.Task] = set()
+
 
 class MagicLinkService:
     """Service for Magic Link authentication operations."""
@@ -42,24 +57,62 @@ class MagicLinkService:
         db: AsyncSession,
         user_repo: UserRepository,
         token_repo: MagicLinkTokenRepository,
+        registered_users: TTLCache[bytes, bool] | None = None,
+        rate_limiter: SlidingWindowRateLimiter | None = None,
     ):
         self.db = db
         self.user_repo = user_repo
         self.token_repo = token_repo
+        # Process-wide cache of email hashes known to belong to a user.
+        self.registered_users = registered_users
+        # Process-wide limiter for magic link requests per email hash.
+        self.rate_limiter = rate_limiter
         self.settings = get_settings()
+        # Derived values that stay constant for the lifetime of the settings.
+        self._expiration_delta = timedelta(
+            minutes=self.settings.magic_link_expiration_minutes,
+        )
+        self._expires_in_seconds = self.settings.magic_link_expiration_minutes * 60
+        self._magic_link_prefix = (
+            self.settings.frontend_base_url.rstrip("/") + "/auth/verify?token="
+        )
 
     @staticmethod
-    def _hash(data: str) -> str:
+    def _hash(data: str) -> bytes:
         """
-        Generate SHA-256 hash of input data.
+        Generate SHA-256 digest of input data.
 
         Args:
             data: String to hash
 
         Returns:
-            Hexadecimal SHA-256 hash (64 characters)
+            Raw SHA-256 digest (32 bytes)
+        """
+        return _sha256(data.encode()).digest()
+
+    @staticmethod
+    def _hash_token(token: str) -> bytes:
+        """
+        Generate the SHA-256 digest of the raw bytes behind a magic link token.
+
+        Args:
+            token: URL-safe base64 token (unpadded) as sent in the magic link
+
+        Returns:
+            Raw SHA-256 digest (32 bytes)
+
+        Raises:
+            MagicLinkTokenInvalidError: Token is not valid URL-safe base64
         """
-        return hashlib.sha256(data.encode()).hexdigest()
+        try:
+            raw_token = base64.b64decode(
+                token + "=" * (-len(token) % 4),
+                altchars=b"-_",
+                validate=True,
+            )
+        except (binascii.Error, ValueError):
+            raise MagicLinkTokenInvalidError() from None
+        return _sha256(raw_token).digest()
 
     async def request_magic_link(self, email: str) -> MagicLinkResult:
         """
@@ -74,11 +127,11 @@ class MagicLinkService:
             AuthError: Never raised for non-existing users to avoid enumeration
         """
         email_hash = self._hash(email)
-        user = await self.user_repo.get_by_email_hash(email_hash)
-        if user is None:
+        if self._is_throttled(email_hash) or not await self._is_registered(
+            email_hash,
+        ):
             # Return generic response to avoid user enumeration.
-            expires_in_seconds = self.settings.magic_link_expiration_minutes * 60
-            return MagicLinkResult(expires_in=expires_in_seconds)
+            return MagicLinkResult(expires_in=self._expires_in_seconds)
 
         return await self._issue_magic_link(email, email_hash)
 
@@ -98,42 +151,73 @@ class MagicLinkService:
             AuthError: Never raised for existing users to avoid enumeration
         """
         email_hash = self._hash(email)
-        existing_user = await self.user_repo.get_by_email_hash(email_hash)
-        if existing_user is not None:
+        if self._is_throttled(email_hash):
+            # Same response an unthrottled call would give, without creating
+            # the user or sending an email.
+            return MagicLinkResult(
+                expires_in=self._expires_in_seconds,
+                already_registered=await self._is_registered(email_hash),
+            )
+
+        created = await self.user_repo.create_if_absent(email_hash)
+        if not created:
+            self._remember_registered(email_hash)
             # Return response without sending an email.
-            expires_in_seconds = self.settings.magic_link_expiration_minutes * 60
             return MagicLinkResult(
-                expires_in=expires_in_seconds,
+                expires_in=self._expires_in_seconds,
                 already_registered=True,
             )
 
-        await self.user_repo.create(email_hash=email_hash)
-        return await self._issue_magic_link(
+        result = await self._issue_magic_link(
             email,
             email_hash,
             already_registered=False,
         )
+        # Cache only once the new user row is committed
+        self._remember_registered(email_hash)
+        return result
+
+    def _is_throttled(self, email_hash: bytes) -> bool:
+        """Record a magic link request and report whether it exceeds the limit."""
+        return self.rate_limiter is not None and not self.rate_limiter.hit(email_hash)
+
+    async def _is_registered(self, email_hash: bytes) -> bool:
+        """Check whether a user exists for the email hash, using the cache."""
+        if self.registered_users is not None and self.registered_users.get(
+            email_hash,
+        ):
+            return True
+
+        user = await self.user_repo.get_by_email_hash(email_hash)
+        if user is None:
+            return False
+
+        self._remember_registered(email_hash)
+        return True
+
+    def _remember_registered(self, email_hash: bytes) -> None:
+        """Cache that a user exists for the email hash."""
+        if self.registered_users is not None:
+            self.registered_users.set(email_hash, True)
 
     async def _issue_magic_link(
         self,
         email: str,
-        email_hash: str,
+        email_hash: bytes,
         already_registered: bool | None = None,
     ) -> MagicLinkResult:
-        token = secrets.token_urlsafe(32)
-
-        token_hash = self._hash(token)
-
-        expires_at = datetime.now(timezone.utc) + timedelta(
-            minutes=self.settings.magic_link_expiration_minutes,
-        )
-
-        # Delete existing token for this email (if any)
-        # TODO: Rate-limiting needed - without it, an attacker knowing the email
-        # could spam this endpoint to continuously invalidate tokens
-        await self.token_repo.delete_by_email_hash(email_hash)
-
-        await self.token_repo.create(
+        # Hash the random bytes directly; only the link carries their base64
+        # form (same encoding as secrets.token_urlsafe).
+        raw_token = secrets.token_bytes(32)
+        token = base64.urlsafe_b64encode(raw_token).rstrip(b"=").decode("ascii")
+        token_hash = _sha256(raw_token).digest()
+
+        expires_at = datetime.now(timezone.utc) + self._expiration_delta
+
+        # Replace existing token for this email (if any). Requests are rate
+        # limited per email hash, so this cannot be used to keep invalidating
+        # a user's link.
+        await self.token_repo.upsert(
             token_hash=token_hash,
             email_hash=email_hash,
             expires_at=expires_at,
@@ -141,8 +225,7 @@ class MagicLinkService:
 
         await self.db.commit()
 
-        frontend_base_url = self.settings.frontend_base_url.rstrip("/")
-        magic_link_url = f"{frontend_base_url}/auth/verify?token={token}"
+        magic_link_url = self._magic_link_prefix + token
 
         # Log magic link for debugging
         logger.info(f"Magic Link for {email}: {magic_link_url}")
@@ -150,12 +233,16 @@ class MagicLinkService:
         # Magic Link per E-Mail versenden (im Hintergrund starten, damit
         # die HTTP-Anfrage nicht auf den E-Mail-Versand warten muss)
         # Fehler beim Versand werden geloggt innerhalb von `send_magic_link`.
-        asyncio.create_task(self.send_magic_link(email, magic_link_url))
-
-        expires_in_seconds = self.settings.magic_link_expiration_minutes * 60
+        if len(_pending_sends) >= _MAX_PENDING_MAGIC_LINK_SENDS:
+            with contextlib.suppress(Exception):
+                await self.send_magic_link(email, magic_link_url)
+        else:
+            task = asyncio.create_task(self.send_magic_link(email, magic_link_url))
+            _pending_sends.add(task)
+            task.add_done_callback(_pending_sends.discard)
 
         return MagicLinkResult(
-            expires_in=expires_in_seconds,
+            expires_in=self._expires_in_seconds,
             already_registered=already_registered,
         )
 
@@ -191,11 +278,11 @@ class MagicLinkService:
         Verify magic link token and authenticate user.
 
         Process:
-        1. Hash token and lookup in database
-        2. Validate token exists and not expired
-        3. Delete token (single-use)
-        4. Get user
-        5. Generate JWT token
+        1. Hash token and atomically delete it from the database (single-use),
+           resolving the owning user in the same statement
+        2. Validate token existed and is not expired
+        3. Validate user exists
+        4. Generate JWT token
 
         Args:
             token: The magic link token from URL query parameter
@@ -212,34 +299,27 @@ class MagicLinkService:
             - Token is deleted after verification (single-use)
             - JWT token is valid for JWT_EXPIRATION_HOURS (default: 5 hours)
         """
-        token_hash = self._hash(token)
+        token_hash = self._hash_token(token)
 
-        magic_link_token = await self.token_repo.get_by_token_hash(token_hash)
+        # Delete the token in the same statement that looks it up: this makes
+        # it single-use even under concurrent verification requests.
+        claimed_token = await self.token_repo.claim_by_token_hash(token_hash)
 
-        if magic_link_token is None:
+        if claimed_token is None:
             raise MagicLinkTokenInvalidError()
 
-        # Check if token is expired
-        if datetime.now(timezone.utc) > magic_link_token.expires_at:
-            await self.token_repo.delete(magic_link_token.id)
+        # Check if token is expired (it has been deleted either way)
+        if datetime.now(timezone.utc) > claimed_token.expires_at:
             await self.db.commit()
-
             raise MagicLinkTokenExpiredError()
 
-        email_hash = magic_link_token.email_hash
-
-        # Delete token immediately (single-use, prevents reuse)
-        await self.token_repo.delete(magic_link_token.id)
-
-        user = await self.user_repo.get_by_email_hash(email_hash)
-
-        if user is None:
+        if claimed_token.user_id is None:
             await self.db.commit()
             raise UserNotRegisteredError()
 
         await self.db.commit()
 
         # Generate JWT token
-        access_token = create_jwt_token(TokenPayload(user_id=user.user_id))
+        access_token = create_jwt_token(TokenPayload(user_id=claimed_token.user_id))
 
         return TokenResult(access_token=access_token, token_type="bearer")
@@ -0,0 +1,44 @@
+"""Background tasks for the auth module."""
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+
+from app.core import database
+from app.modules.auth.repositories.magic_link_token_repository import (
+    MagicLinkTokenRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def purge_expired_magic_link_tokens() -> int:
+    """
+    Delete all expired magic link tokens in one transaction.
+
+    Returns:
+        Number of deleted tokens
+    """
+    async with database.sessionmanager.session() as session:
+        deleted = await MagicLinkTokenRepository(session).delete_expired(
+            datetime.now(timezone.utc),
+        )
+        await session.commit()
+    return deleted
+
+
+async def run_magic_link_token_cleanup(interval_seconds: int) -> None:
+    """
+    Purge expired magic link tokens every `interval_seconds` until cancelled.
+
+    Tokens are otherwise only removed when used or re-issued, so without this
+    loop abandoned tokens would accumulate in magic_link_token forever.
+    """
+    while True:
+        try:
+            deleted = await purge_expired_magic_link_tokens()
+            if deleted:
+                logger.info("Purged %d expired magic link tokens", deleted)
+        except Exception:
+            logger.exception("Failed to purge expired magic link tokens")
+        await asyncio.sleep(interval_seconds)
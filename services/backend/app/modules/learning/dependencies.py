@@ -1,13 +1,16 @@
 """Learning module dependencies for DI."""
 
-from functools import lru_cache
 from typing import Annotated
 
-from fastapi import Depends
+from fastapi import Depends, Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
 
-from app.shared.dependencies import DBSessionDep
+from app.core import database
+from app.shared.dependencies import DBSessionDep, ReadDBSessionDep, WriteDBSessionDep
 from app.shared.ports.quiz_read import QuizReadPortDep
 from app.modules.learning.repositories import AttemptRepository, AnswerRepository
+from app.modules.learning.schemas import AnswerUpsertAdapter, AnswerUpsertRequest
 from app.modules.learning.services import (
     AttemptAnswerService,
     EvaluationService,
@@ -19,99 +22,134 @@ from app.modules.learning.strategies import (
     answer_mapping_registry,
     answer_upsert_registry,
 )
+from app.modules.learning.services.autosave_batcher import AutosaveBatcher
 from app.modules.learning.services.evaluation_strategies import (
     AnswerEvaluationRegistry,
     answer_evaluation_registry,
 )
 
+# Strategy registries are stateless, so one instance per process is shared.
+# Service factories use them directly rather than resolving them as
+# sub-dependencies on every request.
+_ANSWER_UPSERT_REGISTRY = answer_upsert_registry()
+_ANSWER_MAPPING_REGISTRY = answer_mapping_registry()
+_ANSWER_EVALUATION_REGISTRY = answer_evaluation_registry()
+
+# One batcher per process, so concurrent autosaves on an attempt share
+# transactions. Sessions come from the session manager current at write time.
+_AUTOSAVE_BATCHER = AutosaveBatcher(
+    lambda: database.sessionmanager.new_write_session(),
+)
+
 
-@lru_cache
 def get_answer_upsert_registry() -> AnswerUpsertRegistry:
-    """Factory for answer upsert strategy registry."""
-    return answer_upsert_registry()
+    """Provide the shared answer upsert strategy registry."""
+    return _ANSWER_UPSERT_REGISTRY
 
 
-@lru_cache
 def get_answer_mapping_registry() -> AnswerMappingRegistry:
-    """Factory for answer mapping strategy registry."""
-    return answer_mapping_registry()
+    """Provide the shared answer mapping strategy registry."""
+    return _ANSWER_MAPPING_REGISTRY
 
 
-def get_attempt_repository(db: DBSessionDep) -> AttemptRepository:
-    """Factory for AttemptRepository."""
-    return AttemptRepository(db)
+def get_answer_evaluation_registry() -> AnswerEvaluationRegistry:
+    """Provide the shared answer evaluation strategy registry."""
+    return _ANSWER_EVALUATION_REGISTRY
 
 
-def get_answer_repository(db: DBSessionDep) -> AnswerRepository:
-    """Factory for AnswerRepository."""
-    return AnswerRepository(db)
+# Factories below only construct objects, so they are declared async: FastAPI
+# awaits async dependencies directly instead of running them in the threadpool.
+async def get_attempt_answer_service(
+    db: WriteDBSessionDep,
+    quiz_read_port: QuizReadPortDep,
+) -> AttemptAnswerService:
+    """
+    Factory for AttemptAnswerService.
 
+    Repositories are built inline rather than resolved as sub-dependencies,
+    saving two dependency nodes per request.
+    """
+    return AttemptAnswerService(
+        db,
+        quiz_read_port,
+        _ANSWER_UPSERT_REGISTRY,
+        _ANSWER_MAPPING_REGISTRY,
+        AttemptRepository(db),
+        AnswerRepository(db),
+    )
 
-AttemptRepositoryDep = Annotated[
-    AttemptRepository,
-    Depends(get_attempt_repository),
-]
-AnswerRepositoryDep = Annotated[
-    AnswerRepository,
-    Depends(get_answer_repository),
-]
 
+async def get_autosave_service(
+    db: DBSessionDep,
+    quiz_read_port: QuizReadPortDep,
+) -> AttemptAnswerService:
+    """
+    Factory for an AttemptAnswerService that saves answers via the batcher.
 
-@lru_cache
-def get_answer_evaluation_registry() -> AnswerEvaluationRegistry:
-    """Factory for answer evaluation strategy registry."""
-    return answer_evaluation_registry()
+    The request session only runs the ownership and task checks, so it is a
+    plain session; the writes use the batcher's write sessions.
+    """
+    return AttemptAnswerService(
+        db,
+        quiz_read_port,
+        _ANSWER_UPSERT_REGISTRY,
+        _ANSWER_MAPPING_REGISTRY,
+        AttemptRepository(db),
+        AnswerRepository(db),
+        _AUTOSAVE_BATCHER,
+    )
 
 
-def get_attempt_answer_service(
-    db: DBSessionDep,
+async def get_attempt_read_service(
+    db: ReadDBSessionDep,
     quiz_read_port: QuizReadPortDep,
-    attempt_repo: AttemptRepositoryDep,
-    answer_repo: AnswerRepositoryDep,
-    upsert_registry: AnswerUpsertRegistry = Depends(get_answer_upsert_registry),
-    mapping_registry: AnswerMappingRegistry = Depends(get_answer_mapping_registry),
 ) -> AttemptAnswerService:
-    """Factory for AttemptAnswerService."""
+    """
+    Factory for an AttemptAnswerService bound to the read-only session.
+
+    Only for endpoints that never write (listing and fetching attempts).
+    """
     return AttemptAnswerService(
         db,
         quiz_read_port,
-        upsert_registry,
-        mapping_registry,
-        attempt_repo,
-        answer_repo,
+        _ANSWER_UPSERT_REGISTRY,
+        _ANSWER_MAPPING_REGISTRY,
+        AttemptRepository(db),
+        AnswerRepository(db),
     )
 
 
-def get_evaluation_service(
-    db: DBSessionDep,
+async def get_evaluation_service(
+    db: WriteDBSessionDep,
     quiz_read_port: QuizReadPortDep,
-    attempt_repo: AttemptRepositoryDep,
-    answer_repo: AnswerRepositoryDep,
-    evaluation_registry: AnswerEvaluationRegistry = Depends(
-        get_answer_evaluation_registry,
-    ),
 ) -> EvaluationService:
     """Factory for EvaluationService."""
     return EvaluationService(
         db,
         quiz_read_port,
-        evaluation_registry,
-        attempt_repo,
-        answer_repo,
+        _ANSWER_EVALUATION_REGISTRY,
+        AttemptRepository(db),
+        AnswerRepository(db),
     )
 
 
-def get_learning_cleanup_service(
-    attempt_repo: AttemptRepositoryDep,
-) -> LearningCleanupService:
+async def get_learning_cleanup_service(db: DBSessionDep) -> LearningCleanupService:
     """Factory for LearningCleanupService."""
-    return LearningCleanupService(attempt_repo)
+    return LearningCleanupService.for_session(db)
 
 
 AttemptAnswerServiceDep = Annotated[
     AttemptAnswerService,
     Depends(get_attempt_answer_service),
 ]
+AutosaveServiceDep = Annotated[
+    AttemptAnswerService,
+    Depends(get_autosave_service),
+]
+AttemptReadServiceDep = Annotated[
+    AttemptAnswerService,
+    Depends(get_attempt_read_service),
+]
 AnswerEvaluationRegistryDep = Annotated[
     AnswerEvaluationRegistry,
     Depends(get_answer_evaluation_registry),
@@ -121,3 +159,28 @@ LearningCleanupServiceDep = Annotated[
     LearningCleanupService,
     Depends(get_learning_cleanup_service),
 ]
+
+
+async def get_answer_upsert_payload(request: Request) -> AnswerUpsertRequest:
+    """
+    Validate the answer upsert body directly from the raw request bytes.
+
+    FastAPI would decode the JSON into dicts first and validate those;
+    the compiled adapter parses and validates in one pass. Errors are
+    reported in the same format as FastAPI's own body validation.
+    """
+    try:
+        return AnswerUpsertAdapter.validate_json(await request.body())
+    except ValidationError as exc:
+        raise RequestValidationError(
+            [
+                {**error, "loc": ("body", *error["loc"])}
+                for error in exc.errors(include_url=False)
+            ],
+        ) from None
+
+
+AnswerUpsertPayloadDep = Annotated[
+    AnswerUpsertRequest,
+    Depends(get_answer_upsert_payload),
+]
@@ -1,120 +1,55 @@
 """Exception handlers for learning module."""
 
-from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+import json
+
+from fastapi import FastAPI, Request, Response
 
 from app.modules.learning.exceptions import (
-    LearningModuleException,
-    AttemptNotFoundException,
-    AttemptLockedException,
-    QuizNotFoundException,
-    QuizNotCompletedException,
+    NOT_YOUR_ATTEMPT,
     AccessDeniedException,
-    TaskNotFoundException,
-    AnswerTypeMismatchException,
-    AnswerNotFoundException,
-    InvalidAnswerTypeException,
+    LearningModuleException,
 )
 
 
-async def attempt_not_found_handler(
-    request: Request,
-    exc: AttemptNotFoundException,
-) -> JSONResponse:
-    return JSONResponse(
-        status_code=404,
-        content={"detail": str(exc)},
-    )
-
-
-async def attempt_locked_handler(
-    request: Request,
-    exc: AttemptLockedException,
-) -> JSONResponse:
-    return JSONResponse(
-        status_code=409,
-        content={"detail": str(exc)},
-    )
-
-
-async def quiz_not_found_handler(
-    request: Request,
-    exc: QuizNotFoundException,
-) -> JSONResponse:
-    return JSONResponse(
-        status_code=404,
-        content={"detail": str(exc)},
-    )
-
-
-async def quiz_not_completed_handler(
-    request: Request,
-    exc: QuizNotCompletedException,
-) -> JSONResponse:
-    return JSONResponse(
-        status_code=409,
-        content={"detail": str(exc)},
-    )
+def _encode_detail(detail: str) -> bytes:
+    """Serialize `{"detail": ...}` straight to bytes, like JSONResponse would."""
+    return json.dumps(
+        {"detail": detail},
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
 
 
-async def access_denied_handler(
-    request: Request,
-    exc: AccessDeniedException,
-) -> JSONResponse:
-    return JSONResponse(
-        status_code=403,
-        content={"detail": str(exc)},
-    )
+# Access-denied details never vary, so their bodies are serialized once.
+_STATIC_ERROR_BODIES: dict[str, bytes] = {
+    detail: _encode_detail(detail)
+    for detail in (AccessDeniedException().message, NOT_YOUR_ATTEMPT)
+}
 
 
-async def task_not_found_handler(
-    request: Request,
-    exc: TaskNotFoundException,
-) -> JSONResponse:
-    return JSONResponse(
-        status_code=404,
-        content={"detail": str(exc)},
+def _error_response(status_code: int, detail: str) -> Response:
+    """Build a JSON error response, reusing a pre-serialized body if any."""
+    body = _STATIC_ERROR_BODIES.get(detail)
+    if body is None:
+        body = _encode_detail(detail)
+    return Response(
+        content=body,
+        status_code=status_code,
+        media_type="application/json",
     )
 
 
-async def answer_type_mismatch_handler(
+async def learning_exception_handler(
     request: Request,
-    exc: AnswerTypeMismatchException,
-) -> JSONResponse:
-    return JSONResponse(
-        status_code=400,
-        content={"detail": str(exc)},
-    )
-
-
-async def answer_not_found_handler(
-    request: Request,
-    exc: AnswerNotFoundException,
-) -> JSONResponse:
-    return JSONResponse(
-        status_code=404,
-        content={"detail": str(exc)},
-    )
-
-
-async def invalid_answer_type_handler(
-    request: Request,
-    exc: InvalidAnswerTypeException,
-) -> JSONResponse:
-    return JSONResponse(
-        status_code=422,
-        content={"detail": str(exc)},
-    )
+    exc: LearningModuleException,
+) -> Response:
+    return _error_response(exc.status_code, exc.message)
 
 
 def register_exception_handlers(app: FastAPI) -> None:
-    """Register all learning module exception handlers with the FastAPI app."""
-    app.add_exception_handler(AttemptNotFoundException, attempt_not_found_handler)
-    app.add_exception_handler(AttemptLockedException, attempt_locked_handler)
-    app.add_exception_handler(QuizNotFoundException, quiz_not_found_handler)
-    app.add_exception_handler(QuizNotCompletedException, quiz_not_completed_handler)
-    app.add_exception_handler(AccessDeniedException, access_denied_handler)
-    app.add_exception_handler(TaskNotFoundException, task_not_found_handler)
-    app.add_exception_handler(AnswerTypeMismatchException, answer_type_mismatch_handler)
-    app.add_exception_handler(AnswerNotFoundException, answer_not_found_handler)
-    app.add_exception_handler(InvalidAnswerTypeException, invalid_answer_type_handler)
+    """Register the learning module exception handler with the FastAPI app.
+
+    A single handler on the base class covers every learning exception; each
+    exception class carries its own HTTP status code.
+    """
+    app.add_exception_handler(LearningModuleException, learning_exception_handler)
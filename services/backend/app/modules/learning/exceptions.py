@@ -1,15 +1,33 @@
 """Learning module exceptions."""
 
+NOT_YOUR_ATTEMPT = "Not your attempt"
+
 
 class LearningModuleException(Exception):
-    """Base exception for learning module."""
+    """Base exception for learning module.
+
+    Subclasses set `status_code` to the HTTP status they are reported with.
+    Every class in the hierarchy declares `__slots__`, so instances store
+    their attributes without allocating a per-instance `__dict__`.
+    """
+
+    __slots__ = ("message",)
 
-    pass
+    status_code: int = 500
+
+    def __init__(self, message: str = "Learning module error"):
+        # Formatted once here; handlers reuse it instead of calling str(exc).
+        self.message = message
+        super().__init__(message)
 
 
 class AttemptNotFoundException(LearningModuleException):
     """Raised when attempt is not found."""
 
+    __slots__ = ("attempt_id",)
+
+    status_code = 404
+
     def __init__(self, attempt_id: str):
         self.attempt_id = attempt_id
         super().__init__(f"Attempt not found: {attempt_id}")
@@ -18,6 +36,10 @@ class AttemptNotFoundException(LearningModuleException):
 class AttemptLockedException(LearningModuleException):
     """Raised when attempt is already evaluated and locked."""
 
+    __slots__ = ("attempt_id",)
+
+    status_code = 409
+
     def __init__(self, attempt_id: str):
         self.attempt_id = attempt_id
         super().__init__(f"Attempt is locked (already evaluated): {attempt_id}")
@@ -26,6 +48,10 @@ class AttemptLockedException(LearningModuleException):
 class QuizNotFoundException(LearningModuleException):
     """Raised when quiz is not found."""
 
+    __slots__ = ("quiz_id",)
+
+    status_code = 404
+
     def __init__(self, quiz_id: str):
         self.quiz_id = quiz_id
         super().__init__(f"Quiz not found: {quiz_id}")
@@ -34,6 +60,10 @@ class QuizNotFoundException(LearningModuleException):
 class QuizNotCompletedException(LearningModuleException):
     """Raised when quiz is not in completed status."""
 
+    __slots__ = ("quiz_id",)
+
+    status_code = 409
+
     def __init__(self, quiz_id: str):
         self.quiz_id = quiz_id
         super().__init__(f"Quiz not in completed status: {quiz_id}")
@@ -42,6 +72,10 @@ class QuizNotCompletedException(LearningModuleException):
 class AccessDeniedException(LearningModuleException):
     """Raised when user has no access to quiz."""
 
+    __slots__ = ()
+
+    status_code = 403
+
     def __init__(self, message: str = "Access denied"):
         super().__init__(message)
 
@@ -49,6 +83,10 @@ class AccessDeniedException(LearningModuleException):
 class TaskNotFoundException(LearningModuleException):
     """Raised when task is not found or doesn't belong to quiz."""
 
+    __slots__ = ("task_id",)
+
+    status_code = 404
+
     def __init__(self, task_id: str):
         self.task_id = task_id
         super().__init__(f"Task not found: {task_id}")
@@ -57,6 +95,10 @@ class TaskNotFoundException(LearningModuleException):
 class AnswerTypeMismatchException(LearningModuleException):
     """Raised when answer type doesn't match task type."""
 
+    __slots__ = ("expected", "got")
+
+    status_code = 400
+
     def __init__(self, expected: str, got: str):
         self.expected = expected
         self.got = got
@@ -66,6 +108,10 @@ class AnswerTypeMismatchException(LearningModuleException):
 class AnswerNotFoundException(LearningModuleException):
     """Raised when answer is not found."""
 
+    __slots__ = ("task_id",)
+
+    status_code = 404
+
     def __init__(self, task_id: str):
         self.task_id = task_id
         super().__init__(f"Answer not found for task: {task_id}")
@@ -74,6 +120,10 @@ class AnswerNotFoundException(LearningModuleException):
 class InvalidAnswerTypeException(LearningModuleException):
     """Raised when trying to perform operation on wrong answer type."""
 
+    __slots__ = ("expected", "actual")
+
+    status_code = 422
+
     def __init__(self, expected: str, actual: str):
         self.expected = expected
         self.actual = actual
@@ -1,5 +1,8 @@
 """Learning module mappers."""
 
-from app.modules.learning.mappers.answer_mapper import answer_to_dto
+from app.modules.learning.mappers.answer_mapper import (
+    answer_to_dto,
+    answers_to_dtos,
+)
 
-__all__ = ["answer_to_dto"]
+__all__ = ["answer_to_dto", "answers_to_dtos"]
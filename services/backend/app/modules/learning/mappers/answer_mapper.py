@@ -1,8 +1,10 @@
 """Answer model to DTO mappings."""
 
-from app.modules.learning.models.answer import Answer
+from collections import defaultdict
+
+from app.modules.learning.models.answer import Answer, AnswerType
 from app.modules.learning.schemas.answer import ExistingAnswerDTO
-from app.modules.learning.strategies import AnswerMappingRegistry, normalize_answer_type
+from app.modules.learning.strategies import AnswerMappingRegistry
 
 
 def answer_to_dto(
@@ -10,4 +12,26 @@ def answer_to_dto(
     registry: AnswerMappingRegistry,
 ) -> ExistingAnswerDTO:
     """Convert Answer model to ExistingAnswerDTO."""
-    return registry.get(normalize_answer_type(answer.type)).to_dto(answer)
+    return registry.get_for(answer.type).to_dto(answer)
+
+
+def answers_to_dtos(
+    answers: list[Answer],
+    registry: AnswerMappingRegistry,
+) -> list[ExistingAnswerDTO]:
+    """
+    Convert a list of Answer models to DTOs, preserving their order.
+
+    Answers are grouped by type so each mapping strategy is resolved once per
+    type instead of once per answer.
+    """
+    positions: defaultdict[AnswerType, list[int]] = defaultdict(list)
+    for index, answer in enumerate(answers):
+        positions[answer.type].append(index)
+
+    dtos: list[ExistingAnswerDTO] = [None] * len(answers)  # type: ignore[list-item]
+    for answer_type, indices in positions.items():
+        to_dto = registry.get_for(answer_type).to_dto
+        for index in indices:
+            dtos[index] = to_dto(answers[index])
+    return dtos
@@ -14,21 +14,21 @@ Architecture:
 
 import enum
 import uuid
-from decimal import Decimal
 
 from sqlalchemy import (
+    SmallInteger,
     String,
     Text,
     Boolean,
     ForeignKey,
     Index,
     UniqueConstraint,
-    Numeric,
     Enum as SQLEnum,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
+from app.shared.utils import uuid7
 
 
 class AnswerType(str, enum.Enum):
@@ -50,7 +50,7 @@ class Answer(Base):
         attempt_id: UUID foreign key to attempt
         task_id: UUID reference to task (no FK - cross-module reference)
         type: Answer type discriminator (multiple_choice/free_text/cloze)
-        percentage_correct: Score as percentage (0-100, nullable until evaluated)
+        percentage_correct: Score in basis points (0-10000, nullable until evaluated)
 
     Relationships:
         attempt: Many-to-one relationship to Attempt
@@ -60,7 +60,7 @@ class Answer(Base):
 
     answer_id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         comment="UUID primary key",
     )
 
@@ -76,15 +76,15 @@ class Answer(Base):
     )
 
     type: Mapped[AnswerType] = mapped_column(
-        SQLEnum(AnswerType, native_enum=False, length=20),
+        SQLEnum(AnswerType, name="answer_type"),
         nullable=False,
         comment="Answer type discriminator",
     )
 
-    percentage_correct: Mapped[Decimal | None] = mapped_column(
-        Numeric(5, 2),
+    percentage_correct: Mapped[int | None] = mapped_column(
+        SmallInteger,
         nullable=True,
-        comment="Score as percentage (0-100)",
+        comment="Score in basis points (0-10000 = 0-100%)",
     )
 
     # Polymorphic setup for joined table inheritance
@@ -102,7 +102,14 @@ class Answer(Base):
     # Constraints and indexes
     __table_args__ = (
         UniqueConstraint("attempt_id", "task_id", name="uq_answer_attempt_task"),
-        Index("ix_answer_attempt_id", "attempt_id"),
+        # Covers list-by-attempt reads of the base table, so they can be
+        # answered from the index alone.
+        Index(
+            "ix_answer_attempt_type",
+            "attempt_id",
+            "type",
+            postgresql_include=("answer_id", "task_id", "percentage_correct"),
+        ),
         Index("ix_answer_task_id", "task_id"),
     )
 
@@ -141,10 +148,13 @@ class MultipleChoiceAnswer(Answer):
     )
 
     def __repr__(self) -> str:
+        # Read the instance dict so repr never triggers a lazy load.
+        selections = self.__dict__.get("selections")
+        selections_count = len(selections) if selections is not None else "?"
         return (
             f"<MultipleChoiceAnswer(answer_id={self.answer_id}, "
             f"task_id={self.task_id}, "
-            f"selections_count={len(self.selections) if self.selections else 0})>"
+            f"selections_count={selections_count})>"
         )
 
 
@@ -246,10 +256,13 @@ class ClozeAnswer(Answer):
     )
 
     def __repr__(self) -> str:
+        # Read the instance dict so repr never triggers a lazy load.
+        items = self.__dict__.get("items")
+        items_count = len(items) if items is not None else "?"
         return (
             f"<ClozeAnswer(answer_id={self.answer_id}, "
             f"task_id={self.task_id}, "
-            f"items_count={len(self.items) if self.items else 0})>"
+            f"items_count={items_count})>"
         )
 
 
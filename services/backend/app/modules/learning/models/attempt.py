@@ -10,12 +10,12 @@ Based on Wiki Specification:
 import enum
 import uuid
 from datetime import datetime, timezone
-from decimal import Decimal
 
-from sqlalchemy import String, Index, DateTime, Numeric, Enum as SQLEnum
+from sqlalchemy import SmallInteger, String, Index, DateTime, Enum as SQLEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
+from app.shared.utils import uuid7
 
 
 class AttemptStatus(str, enum.Enum):
@@ -39,7 +39,8 @@ class Attempt(Base):
         status: Attempt status (in_progress/evaluated)
         started_at: Timestamp when attempt was started
         evaluated_at: Timestamp when attempt was evaluated (nullable)
-        total_percentage: Overall score as percentage (0-100, nullable until evaluated)
+        total_percentage: Overall score in basis points (0-10000, nullable until
+            evaluated)
 
     Relationships:
         answers: One-to-many relationship to Answer (within learning module)
@@ -49,7 +50,7 @@ class Attempt(Base):
 
     attempt_id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         comment="UUID primary key",
     )
 
@@ -64,7 +65,7 @@ class Attempt(Base):
     )
 
     status: Mapped[AttemptStatus] = mapped_column(
-        SQLEnum(AttemptStatus, native_enum=False, length=20),
+        SQLEnum(AttemptStatus, name="attempt_status"),
         nullable=False,
         default=AttemptStatus.IN_PROGRESS,
         comment="Attempt status (in_progress/evaluated)",
@@ -83,10 +84,10 @@ class Attempt(Base):
         comment="Timestamp when attempt was evaluated",
     )
 
-    total_percentage: Mapped[Decimal | None] = mapped_column(
-        Numeric(5, 2),
+    total_percentage: Mapped[int | None] = mapped_column(
+        SmallInteger,
         nullable=True,
-        comment="Overall score as percentage (0-100)",
+        comment="Overall score in basis points (0-10000 = 0-100%)",
     )
 
     # Relationships
@@ -98,7 +99,9 @@ class Attempt(Base):
 
     # Indexes for efficient queries
     __table_args__ = (
-        Index("ix_attempt_user_id", "user_id"),
+        # Serves the user's attempt list in started_at order, including the
+        # keyset pagination tie-break on attempt_id
+        Index("ix_attempt_user_started", "user_id", "started_at", "attempt_id"),
         Index("ix_attempt_quiz_id", "quiz_id"),
         Index("ix_attempt_status", "status"),
     )
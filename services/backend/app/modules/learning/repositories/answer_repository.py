@@ -4,11 +4,18 @@ Encapsulates DB operations for all answer types and keeps services slim.
 """
 
 from uuid import UUID
-from decimal import Decimal
 
-from sqlalchemy import select, delete
+from sqlalchemy import case, select, delete, insert, inspect, literal, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import with_polymorphic, selectinload
+from sqlalchemy.orm import (
+    joinedload,
+    make_transient_to_detached,
+    selectinload,
+    with_polymorphic,
+)
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.core.database import upsert_insert
 
 from app.modules.learning.models import (
     Answer,
@@ -20,14 +27,55 @@ from app.modules.learning.models import (
     AnswerClozeItem,
 )
 from app.modules.learning.exceptions import (
+    AnswerNotFoundException,
     AnswerTypeMismatchException,
     InvalidAnswerTypeException,
 )
+from app.shared.utils import uuid7
+
+# All answer subtypes in one polymorphic entity, with their child collections
+# loaded by one SELECT ... IN per collection instead of a refresh per answer.
+ANSWER_POLYMORPHIC = with_polymorphic(
+    Answer,
+    [MultipleChoiceAnswer, FreeTextAnswer, ClozeAnswer],
+)
+ANSWER_COLLECTION_LOADERS = (
+    selectinload(ANSWER_POLYMORPHIC.MultipleChoiceAnswer.selections),
+    selectinload(ANSWER_POLYMORPHIC.ClozeAnswer.items),
+)
+# Single-answer lookups join the collections into the same SELECT instead.
+# An answer has exactly one type, so at most one of the joins returns rows.
+_SINGLE_ANSWER_LOADERS = (
+    joinedload(ANSWER_POLYMORPHIC.MultipleChoiceAnswer.selections),
+    joinedload(ANSWER_POLYMORPHIC.ClozeAnswer.items),
+)
+
+# Collection loaders for single-answer lookups of one specific subtype
+_SUBTYPE_COLLECTION_LOADERS = {
+    AnswerType.MULTIPLE_CHOICE: (joinedload(MultipleChoiceAnswer.selections),),
+    AnswerType.CLOZE: (joinedload(ClozeAnswer.items),),
+}
+
+# Subtype class and subtype column values of a new, empty answer per type
+_NEW_ANSWER_VALUES: dict[AnswerType, tuple[type[Answer], dict[str, str]]] = {
+    AnswerType.MULTIPLE_CHOICE: (MultipleChoiceAnswer, {}),
+    AnswerType.FREE_TEXT: (FreeTextAnswer, {"text_response": ""}),
+    AnswerType.CLOZE: (ClozeAnswer, {}),
+}
+
+# percentage_correct of a fully correct answer (100%)
+_FULL_SCORE_BASIS_POINTS = 10_000
+
+# Inserts tried when the conflicting answer is deleted before it is read back
+_INSERT_ATTEMPTS = 2
 
 
 class AnswerRepository:
     """Repository for Answer database operations (all types)."""
 
+    # One instance is built per request; slots avoid a per-instance __dict__
+    __slots__ = ("db",)
+
     def __init__(self, db: AsyncSession):
         """
         Initialize repository with database session.
@@ -39,22 +87,7 @@ class AnswerRepository:
 
     def _get_polymorphic_entity(self):
         """Get polymorphic entity for Answer queries with all subtypes."""
-        return with_polymorphic(
-            Answer,
-            [MultipleChoiceAnswer, FreeTextAnswer, ClozeAnswer],
-        )
-
-    async def _load_answer_relationships(self, answer: Answer) -> None:
-        """
-        Load nested relationships for an answer based on its type.
-
-        Args:
-            answer: Answer instance (may be MultipleChoiceAnswer or ClozeAnswer)
-        """
-        if isinstance(answer, MultipleChoiceAnswer):
-            await self.db.refresh(answer, ["selections"])
-        elif isinstance(answer, ClozeAnswer):
-            await self.db.refresh(answer, ["items"])
+        return ANSWER_POLYMORPHIC
 
     async def get_by_attempt_task(
         self,
@@ -81,19 +114,18 @@ class AnswerRepository:
         # Use with_polymorphic to eagerly load all subclass columns
         # This is required for async SQLAlchemy to avoid lazy loading issues
         poly = self._get_polymorphic_entity()
-        stmt = select(poly).where(
-            poly.attempt_id == attempt_id,
-            poly.task_id == task_id,
+        stmt = (
+            select(poly)
+            .where(
+                poly.attempt_id == attempt_id,
+                poly.task_id == task_id,
+            )
+            .options(*_SINGLE_ANSWER_LOADERS)
+            # Reload collections of answers already in the session as well
+            .execution_options(populate_existing=True)
         )
         result = await self.db.execute(stmt)
-        answer = result.scalar_one_or_none()
-
-        if answer:
-            # Explicitly load nested relationships based on answer type
-            # This ensures compatibility with async SQLite (aiosqlite)
-            await self._load_answer_relationships(answer)
-
-        return answer
+        return result.unique().scalar_one_or_none()
 
     async def list_by_attempt(self, attempt_id: UUID) -> list[Answer]:
         """
@@ -109,15 +141,15 @@ class AnswerRepository:
         """
         # Use with_polymorphic to eagerly load all subclass columns
         poly = self._get_polymorphic_entity()
-        stmt = select(poly).where(poly.attempt_id == attempt_id)
+        stmt = (
+            select(poly)
+            .where(poly.attempt_id == attempt_id)
+            .options(*ANSWER_COLLECTION_LOADERS)
+            # Reload collections of answers already in the session as well
+            .execution_options(populate_existing=True)
+        )
         result = await self.db.execute(stmt)
-        answers = list(result.scalars().all())
-
-        # Explicitly load nested relationships for each answer
-        for answer in answers:
-            await self._load_answer_relationships(answer)
-
-        return answers
+        return list(result.scalars().all())
 
     async def upsert_multiple_choice(
         self,
@@ -159,29 +191,42 @@ class AnswerRepository:
                 "free_text" if isinstance(existing, FreeTextAnswer) else "cloze",
             )
 
-        # Get current selections
-        await self.db.refresh(existing, ["selections"])
         current_option_ids = {s.option_id for s in existing.selections}
         new_option_ids = set(selected_option_ids)
+        selections = [s for s in existing.selections if s.option_id in new_option_ids]
 
-        # Remove deselected options
+        # Remove deselected options in one statement
         to_remove = current_option_ids - new_option_ids
         if to_remove:
-            for selection in list(existing.selections):
-                if selection.option_id in to_remove:
-                    await self.db.delete(selection)
+            await self.db.execute(
+                delete(AnswerMultipleChoiceSelection).where(
+                    AnswerMultipleChoiceSelection.answer_id == existing.answer_id,
+                    AnswerMultipleChoiceSelection.option_id.in_(to_remove),
+                ),
+            )
 
-        # Add newly selected options
+        # Add newly selected options in one multi-row INSERT; a selection
+        # written by a concurrent autosave in the meantime is skipped
         to_add = new_option_ids - current_option_ids
-        for option_id in to_add:
-            selection = AnswerMultipleChoiceSelection(
-                answer_id=existing.answer_id,
-                option_id=option_id,
+        if to_add:
+            result = await self.db.scalars(
+                upsert_insert(self.db, AnswerMultipleChoiceSelection)
+                .on_conflict_do_nothing(
+                    index_elements=[
+                        AnswerMultipleChoiceSelection.answer_id,
+                        AnswerMultipleChoiceSelection.option_id,
+                    ],
+                )
+                .returning(AnswerMultipleChoiceSelection),
+                [
+                    {"answer_id": existing.answer_id, "option_id": option_id}
+                    for option_id in to_add
+                ],
             )
-            self.db.add(selection)
+            selections.extend(result.all())
 
-        await self.db.flush()
-        await self.db.refresh(existing, ["selections"])
+        # The collection now matches the table, so no refresh is needed
+        set_committed_value(existing, "selections", selections)
         return existing
 
     async def upsert_free_text(
@@ -277,29 +322,35 @@ class AnswerRepository:
                 ),
             )
 
-        # Load existing items
-        await self.db.refresh(existing, ["items"])
         existing_items = {item.blank_id: item for item in existing.items}
 
-        # Upsert each provided value
+        # Update existing items in place; collect new ones for one INSERT
+        new_items: dict[UUID, dict] = {}
         for pv in provided_values:
             blank_id = pv["blank_id"]
             value = pv["value"]
 
             if blank_id in existing_items:
-                # Update existing item
                 existing_items[blank_id].provided_value = value
             else:
-                # Create new item
-                item = AnswerClozeItem(
-                    answer_id=existing.answer_id,
-                    blank_id=blank_id,
-                    provided_value=value,
-                )
-                self.db.add(item)
+                # Later values for the same blank win, as with in-place updates
+                new_items[blank_id] = {
+                    "answer_id": existing.answer_id,
+                    "blank_id": blank_id,
+                    "provided_value": value,
+                }
 
         await self.db.flush()
-        await self.db.refresh(existing, ["items"])
+        items = list(existing.items)
+        if new_items:
+            result = await self.db.scalars(
+                insert(AnswerClozeItem).returning(AnswerClozeItem),
+                list(new_items.values()),
+            )
+            items.extend(result.all())
+
+        # The collection now matches the table, so no refresh is needed
+        set_committed_value(existing, "items", items)
         return existing
 
     async def _get_or_create_answer(
@@ -323,41 +374,146 @@ class AnswerRepository:
 
         Raises:
             InvalidAnswerTypeException: If unknown answer_type provided
+            AnswerTypeMismatchException: If the answer exists with another type
+            AnswerNotFoundException: If a conflicting answer keeps vanishing
+                before it can be read back
         """
-        # Check for existing answer
-        poly = self._get_polymorphic_entity()
-        stmt = select(poly).where(
-            poly.attempt_id == attempt_id,
-            poly.task_id == task_id,
+        if answer_type not in _NEW_ANSWER_VALUES:
+            raise InvalidAnswerTypeException(str(answer_type), str(answer_type))
+        answer_cls, _ = _NEW_ANSWER_VALUES[answer_type]
+
+        # Check for existing answer first: most autosaves update an answer
+        # that already exists. Selecting the expected subtype joins only its
+        # own table instead of all three, and its collection is joined into
+        # the same SELECT so the upserts can diff without another query
+        stmt = (
+            select(answer_cls)
+            .where(
+                answer_cls.attempt_id == attempt_id,
+                answer_cls.task_id == task_id,
+            )
+            .options(*_SUBTYPE_COLLECTION_LOADERS.get(answer_type, ()))
+            .execution_options(populate_existing=True)
         )
         result = await self.db.execute(stmt)
-        existing = result.scalar_one_or_none()
+        existing = result.unique().scalar_one_or_none()
 
         if existing:
             return existing
 
-        # Create new answer based on type
-        if answer_type == AnswerType.MULTIPLE_CHOICE:
-            answer = MultipleChoiceAnswer(
-                attempt_id=attempt_id,
-                task_id=task_id,
+        # An insert that hits an existing row means a concurrent request
+        # inserted the answer first, or it exists with another type. If that
+        # row is deleted again before it can be read back, insert once more
+        for _ in range(_INSERT_ATTEMPTS):
+            created = await self._insert_answer(attempt_id, task_id, answer_type)
+            if created is not None:
+                return created
+
+            result = await self.db.execute(stmt)
+            existing = result.unique().scalar_one_or_none()
+            if existing:
+                return existing
+
+            existing_type = await self.db.scalar(
+                select(Answer.type).where(
+                    Answer.attempt_id == attempt_id,
+                    Answer.task_id == task_id,
+                ),
             )
-        elif answer_type == AnswerType.FREE_TEXT:
-            answer = FreeTextAnswer(
+            if existing_type is not None:
+                raise AnswerTypeMismatchException(
+                    answer_type.value,
+                    existing_type.value,
+                )
+
+        raise AnswerNotFoundException(str(task_id))
+
+    async def _insert_answer(
+        self,
+        attempt_id: UUID,
+        task_id: UUID,
+        answer_type: AnswerType,
+    ) -> Answer | None:
+        """
+        Insert a new, empty answer of the given type.
+
+        The base row is inserted with ON CONFLICT DO NOTHING, so a concurrent
+        insert for the same (attempt_id, task_id) is not an error. On
+        PostgreSQL the base and subtype rows are written by one statement.
+
+        Args:
+            attempt_id: UUID of the attempt
+            task_id: UUID of the task
+            answer_type: Type of answer to create
+
+        Returns:
+            The new Answer instance, or None if the answer already existed
+
+        Raises:
+            InvalidAnswerTypeException: If unknown answer_type provided
+        """
+        if answer_type not in _NEW_ANSWER_VALUES:
+            raise InvalidAnswerTypeException(str(answer_type), str(answer_type))
+        answer_cls, subtype_values = _NEW_ANSWER_VALUES[answer_type]
+        base_table = Answer.__table__
+        subtype_table = answer_cls.__table__
+
+        base_insert = (
+            upsert_insert(self.db, base_table)
+            .values(
+                answer_id=uuid7(),
                 attempt_id=attempt_id,
                 task_id=task_id,
-                text_response="",  # Will be updated immediately after
+                type=answer_type,
             )
-        elif answer_type == AnswerType.CLOZE:
-            answer = ClozeAnswer(
-                attempt_id=attempt_id,
-                task_id=task_id,
+            .on_conflict_do_nothing(index_elements=["attempt_id", "task_id"])
+            .returning(base_table.c.answer_id)
+        )
+
+        if self.db.get_bind().dialect.name == "postgresql":
+            # Chain the subtype INSERT onto the base INSERT's RETURNING
+            new_answer = base_insert.cte("new_answer")
+            stmt = (
+                insert(subtype_table)
+                .from_select(
+                    ["answer_id", *subtype_values],
+                    select(
+                        new_answer.c.answer_id,
+                        *(literal(value) for value in subtype_values.values()),
+                    ),
+                )
+                .returning(subtype_table.c.answer_id)
             )
+            answer_id = (await self.db.execute(stmt)).scalar_one_or_none()
         else:
-            raise InvalidAnswerTypeException(str(answer_type), str(answer_type))
+            # SQLite does not allow INSERT inside a WITH clause
+            answer_id = (await self.db.execute(base_insert)).scalar_one_or_none()
+            if answer_id is not None:
+                await self.db.execute(
+                    insert(subtype_table).values(
+                        answer_id=answer_id,
+                        **subtype_values,
+                    ),
+                )
 
+        if answer_id is None:
+            return None
+
+        # The rows are already written; attach a matching instance to the
+        # session as persistent, so no SELECT is needed to load it back
+        answer = answer_cls(
+            answer_id=answer_id,
+            attempt_id=attempt_id,
+            task_id=task_id,
+            type=answer_type,
+            percentage_correct=None,
+            **subtype_values,
+        )
+        make_transient_to_detached(answer)
         self.db.add(answer)
-        await self.db.flush()
+        for relationship in inspect(answer_cls).relationships:
+            if relationship.uselist:
+                set_committed_value(answer, relationship.key, [])
         return answer
 
     async def set_free_text_correctness(
@@ -367,7 +523,7 @@ class AnswerRepository:
         is_correct: bool,
     ) -> None:
         """
-        Set percentage_correct for free text answer (0.0 or 100.0).
+        Set percentage_correct for free text answer (0% or 100%).
 
         Used by evaluation service after LLM evaluation.
 
@@ -376,52 +532,84 @@ class AnswerRepository:
             task_id: UUID of the task
             is_correct: Whether the answer is correct
         """
-        answer = await self.get_by_attempt_task(attempt_id, task_id)
-        if answer and isinstance(answer, FreeTextAnswer):
-            answer.percentage_correct = (
-                Decimal("100.0") if is_correct else Decimal("0.0")
+        # Single UPDATE; RETURNING refreshes any copy already in the session,
+        # including attributes it never loaded.
+        await self.db.execute(
+            update(Answer)
+            .where(
+                Answer.attempt_id == attempt_id,
+                Answer.task_id == task_id,
+                Answer.type == AnswerType.FREE_TEXT,
+            )
+            .values(
+                percentage_correct=_FULL_SCORE_BASIS_POINTS if is_correct else 0,
             )
-            await self.db.flush()
+            .returning(Answer)
+            .execution_options(populate_existing=True),
+        )
 
-    async def set_answer_percentage(self, answer_id: UUID, percentage: Decimal) -> None:
+    async def set_answer_percentages(
+        self,
+        percentages: list[tuple[UUID, int]],
+    ) -> None:
         """
-        Set percentage_correct on any answer.
+        Set percentage_correct on several answers of any type.
 
-        Generic method for setting evaluation result.
+        Generic method for persisting evaluation results in a single UPDATE.
 
         Args:
-            answer_id: UUID of the answer
-            percentage: Percentage correct (0-100)
+            percentages: (answer_id, basis points) pairs, 0-10000
         """
-        stmt = select(Answer).where(Answer.answer_id == answer_id)
-        result = await self.db.execute(stmt)
-        answer = result.scalar_one_or_none()
-        if answer:
-            answer.percentage_correct = percentage
-            await self.db.flush()
+        if not percentages:
+            return
+
+        await self.db.execute(
+            update(Answer)
+            .where(Answer.answer_id.in_([answer_id for answer_id, _ in percentages]))
+            .values(
+                percentage_correct=case(
+                    {
+                        answer_id: basis_points
+                        for answer_id, basis_points in percentages
+                    },
+                    value=Answer.answer_id,
+                ),
+            )
+            .returning(Answer)
+            .execution_options(populate_existing=True),
+        )
 
-    async def set_cloze_item_correct(
+    async def set_cloze_items_correct(
         self,
         answer_id: UUID,
-        blank_id: UUID,
-        is_correct: bool,
+        results: list[tuple[UUID, bool]],
     ) -> None:
         """
-        Set is_correct on a specific cloze item.
+        Set is_correct on several cloze items of one answer.
 
-        Used by evaluation service to mark individual blanks as correct/incorrect.
+        Used by evaluation service to mark all graded blanks of an answer as
+        correct/incorrect in a single UPDATE.
 
         Args:
             answer_id: UUID of the answer
-            blank_id: UUID of the blank
-            is_correct: Whether the provided value is correct
+            results: (blank_id, is_correct) pairs
         """
-        stmt = select(AnswerClozeItem).where(
-            AnswerClozeItem.answer_id == answer_id,
-            AnswerClozeItem.blank_id == blank_id,
+        if not results:
+            return
+
+        correct_blank_ids = [blank_id for blank_id, is_correct in results if is_correct]
+        await self.db.execute(
+            update(AnswerClozeItem)
+            .where(
+                AnswerClozeItem.answer_id == answer_id,
+                AnswerClozeItem.blank_id.in_([blank_id for blank_id, _ in results]),
+            )
+            .values(
+                is_correct=case(
+                    (AnswerClozeItem.blank_id.in_(correct_blank_ids), True),
+                    else_=False,
+                ),
+            )
+            .returning(AnswerClozeItem)
+            .execution_options(populate_existing=True),
         )
-        result = await self.db.execute(stmt)
-        item = result.scalar_one_or_none()
-        if item:
-            item.is_correct = is_correct
-            await self.db.flush()
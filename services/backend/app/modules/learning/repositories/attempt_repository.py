@@ -10,20 +10,27 @@ Handles attempt lifecycle:
 - Cleanup operations
 """
 
+from collections.abc import Sequence
 from datetime import datetime
-from decimal import Decimal
 from uuid import UUID
 
-from sqlalchemy import select, delete
+from sqlalchemy import Row, Select, and_, or_, select, delete, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.modules.learning.models import Attempt, AttemptStatus
+from app.modules.learning.repositories.answer_repository import (
+    ANSWER_COLLECTION_LOADERS,
+    ANSWER_POLYMORPHIC,
+)
 
 
 class AttemptRepository:
     """Repository for Attempt database operations."""
 
+    # One instance is built per request; slots avoid a per-instance __dict__
+    __slots__ = ("db",)
+
     def __init__(self, db: AsyncSession):
         """
         Initialize repository with database session.
@@ -53,6 +60,28 @@ class AttemptRepository:
         await self.db.flush()
         return attempt
 
+    async def lock_if_in_progress(self, attempt_id: UUID) -> bool:
+        """
+        Check that an attempt is still in progress and keep it that way.
+
+        Takes a shared row lock until the transaction ends, so a concurrent
+        evaluation cannot mark the attempt evaluated before answers written
+        in this transaction are committed. SQLite ignores the lock; its write
+        transactions are serialized anyway.
+
+        Args:
+            attempt_id: UUID of the attempt
+
+        Returns:
+            True if the attempt exists and is in progress, False otherwise
+        """
+        status = await self.db.scalar(
+            select(Attempt.status)
+            .where(Attempt.attempt_id == attempt_id)
+            .with_for_update(read=True),
+        )
+        return status == AttemptStatus.IN_PROGRESS
+
     async def get_open_attempt(self, user_id: UUID, quiz_id: UUID) -> Attempt | None:
         """
         Get an open (in_progress) attempt for user and quiz, if exists.
@@ -90,6 +119,9 @@ class AttemptRepository:
         """
         Get attempt by ID with all answers eagerly loaded.
 
+        Answers are loaded with their subtype columns, selections and cloze
+        items in a fixed number of queries, independent of the answer count.
+
         Used when evaluation needs access to all answers.
 
         Args:
@@ -101,7 +133,11 @@ class AttemptRepository:
         stmt = (
             select(Attempt)
             .where(Attempt.attempt_id == attempt_id)
-            .options(selectinload(Attempt.answers))
+            .options(
+                selectinload(Attempt.answers.of_type(ANSWER_POLYMORPHIC)).options(
+                    *ANSWER_COLLECTION_LOADERS,
+                ),
+            )
         )
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
@@ -109,56 +145,87 @@ class AttemptRepository:
     async def mark_evaluated(
         self,
         attempt_id: UUID,
-        total_percentage: Decimal,
+        total_percentage: int,
         evaluated_at: datetime,
-    ) -> None:
+    ) -> bool:
         """
-        Mark attempt as evaluated with result.
+        Mark an in-progress attempt as evaluated with result.
 
-        Updates attempt status to EVALUATED and sets evaluation data.
+        Updates attempt status to EVALUATED and sets evaluation data. The
+        status check is part of the UPDATE, so of two concurrent evaluations
+        only one can succeed.
 
         Args:
             attempt_id: UUID of the attempt
-            total_percentage: Overall score as percentage (0-100)
+            total_percentage: Overall score in basis points (0-10000)
             evaluated_at: Timestamp when evaluation was completed
+
+        Returns:
+            True if the attempt was updated, False if it does not exist or
+            was already evaluated
         """
-        stmt = select(Attempt).where(Attempt.attempt_id == attempt_id)
-        result = await self.db.execute(stmt)
-        attempt = result.scalar_one_or_none()
-        if attempt:
-            attempt.status = AttemptStatus.EVALUATED
-            attempt.total_percentage = total_percentage
-            attempt.evaluated_at = evaluated_at
-            await self.db.flush()
-
-    async def list_by_user(
+        # Single UPDATE; RETURNING refreshes any copy already in the session,
+        # including attributes it never loaded.
+        result = await self.db.execute(
+            update(Attempt)
+            .where(
+                Attempt.attempt_id == attempt_id,
+                Attempt.status == AttemptStatus.IN_PROGRESS,
+            )
+            .values(
+                status=AttemptStatus.EVALUATED,
+                total_percentage=total_percentage,
+                evaluated_at=evaluated_at,
+            )
+            .returning(Attempt)
+            .execution_options(populate_existing=True),
+        )
+        return result.scalar_one_or_none() is not None
+
+    async def list_rows_by_user(
         self,
         user_id: UUID,
         quiz_id: UUID | None = None,
         status: AttemptStatus | None = None,
-    ) -> list[Attempt]:
+        limit: int | None = None,
+        cursor: UUID | None = None,
+    ) -> Sequence[Row]:
         """
-        Get all attempts for a user with optional filters.
+        Get one page of a user's attempts as plain rows for listing.
+
+        Pages are keyset-based: `cursor` is the last attempt of the previous
+        page, and the page continues strictly after it in
+        (started_at, attempt_id) descending order. Only the listed columns
+        are selected, so no ORM instances are built.
 
         Args:
             user_id: UUID of the user
             quiz_id: Optional UUID to filter by quiz
             status: Optional status to filter by
+            limit: Maximum number of attempts to return; None for all
+            cursor: Optional attempt_id to continue after
 
         Returns:
-            List of Attempt instances ordered by started_at descending
+            Rows with attempt_id, quiz_id, status, started_at, evaluated_at
+            and total_percentage, ordered by started_at descending
         """
-        stmt = select(Attempt).where(Attempt.user_id == user_id)
-
-        if quiz_id is not None:
-            stmt = stmt.where(Attempt.quiz_id == quiz_id)
-
-        if status is not None:
-            stmt = stmt.where(Attempt.status == status)
-
-        stmt = stmt.order_by(Attempt.started_at.desc())
+        stmt = _page_by_user(
+            select(
+                Attempt.attempt_id,
+                Attempt.quiz_id,
+                Attempt.status,
+                Attempt.started_at,
+                Attempt.evaluated_at,
+                Attempt.total_percentage,
+            ),
+            user_id,
+            quiz_id,
+            status,
+            limit,
+            cursor,
+        )
         result = await self.db.execute(stmt)
-        return list(result.scalars().all())
+        return result.all()
 
     async def delete_by_quiz_id(self, quiz_id: UUID) -> int:
         """
@@ -173,10 +240,52 @@ class AttemptRepository:
         Returns:
             Count of deleted attempts
         """
+        # Cleanup never reads the deleted attempts back, so the session is
+        # not searched for matching objects to expire
         result = await self.db.execute(
-            delete(Attempt).where(Attempt.quiz_id == quiz_id),
+            delete(Attempt)
+            .where(Attempt.quiz_id == quiz_id)
+            .execution_options(synchronize_session=False),
         )
         # result.rowcount can be None depending on backend; coerce to int
         deleted = result.rowcount if result.rowcount is not None else 0
-        await self.db.flush()
         return int(deleted)
+
+
+def _page_by_user(
+    stmt: Select,
+    user_id: UUID,
+    quiz_id: UUID | None,
+    status: AttemptStatus | None,
+    limit: int | None,
+    cursor: UUID | None,
+) -> Select:
+    """Restrict an attempt query to one keyset page of a user's attempts."""
+    stmt = stmt.where(Attempt.user_id == user_id)
+
+    if quiz_id is not None:
+        stmt = stmt.where(Attempt.quiz_id == quiz_id)
+
+    if status is not None:
+        stmt = stmt.where(Attempt.status == status)
+
+    if cursor is not None:
+        cursor_started_at = (
+            select(Attempt.started_at)
+            .where(Attempt.attempt_id == cursor)
+            .scalar_subquery()
+        )
+        stmt = stmt.where(
+            or_(
+                Attempt.started_at < cursor_started_at,
+                and_(
+                    Attempt.started_at == cursor_started_at,
+                    Attempt.attempt_id < cursor,
+                ),
+            ),
+        )
+
+    return stmt.order_by(
+        Attempt.started_at.desc(),
+        Attempt.attempt_id.desc(),
+    ).limit(limit)
@@ -1,23 +1,27 @@
 """Learning module router - Attempts, Answers, and Evaluation endpoints."""
 
-from urllib.parse import urlencode
+from functools import lru_cache
 from uuid import UUID
 
-from fastapi import APIRouter, Query, Request, Response, status
+from fastapi import APIRouter, FastAPI, Query, Request, Response, status
+from starlette.datastructures import URLPath
 
 from app.shared.dependencies import CurrentUserId
 from app.modules.learning.dependencies import (
+    AnswerUpsertPayloadDep,
     AttemptAnswerServiceDep,
+    AttemptReadServiceDep,
+    AutosaveServiceDep,
     EvaluationServiceDep,
 )
 from app.modules.learning.schemas import (
     AttemptListItem,
     AttemptDetailResponse,
     AttemptSummaryResponse,
-    AnswerUpsertRequest,
     AnswerSavedResponse,
     FreeTextCorrectnessRequest,
     EvaluationResponse,
+    answer_upsert_request_schema,
 )
 from app.modules.learning.schemas.attempt import AttemptLinks
 from app.modules.learning.models.attempt import AttemptStatus
@@ -25,6 +29,12 @@ from app.modules.learning.models.attempt import AttemptStatus
 router = APIRouter(prefix="/learning", tags=["learning"])
 
 
+@lru_cache(maxsize=1)
+def _tasks_batch_path(app: FastAPI) -> URLPath:
+    """Resolve the batch task endpoint's path once instead of per request."""
+    return app.url_path_for("get_tasks_batch")
+
+
 @router.post(
     "/quizzes/{quiz_id}/attempts",
     response_model=AttemptSummaryResponse,
@@ -62,20 +72,40 @@ async def start_or_resume_attempt(
 )
 async def list_attempts(
     user_id: CurrentUserId,
-    service: AttemptAnswerServiceDep,
+    service: AttemptReadServiceDep,
+    request: Request,
+    response: Response,
     quiz_id: UUID | None = Query(default=None, description="Filter by quiz ID"),
     status: AttemptStatus | None = Query(default=None, description="Filter by status"),
+    limit: int | None = Query(
+        default=None,
+        ge=1,
+        le=200,
+        description="Page size; all attempts are returned when omitted",
+    ),
+    cursor: UUID | None = Query(
+        default=None,
+        description="attempt_id of the last item of the previous page",
+    ),
 ) -> list[AttemptListItem]:
     """
-    Get all attempts for the current user.
+    Get attempts for the current user.
 
     Optional filters:
     - quiz_id: Filter by specific quiz
     - status: Filter by attempt status (in_progress, evaluated)
 
-    Returns attempts ordered by started_at descending (newest first).
+    Returns attempts ordered by started_at descending (newest first). All
+    attempts are returned unless `limit` is given; then, when the page is
+    full, a `Link: <...>; rel="next"` header points to the next page.
     """
-    return await service.list_attempts(user_id, quiz_id, status)
+    attempts = await service.list_attempts(user_id, quiz_id, status, limit, cursor)
+    if limit is not None and len(attempts) == limit:
+        next_url = request.url.include_query_params(
+            cursor=str(attempts[-1].attempt_id),
+        )
+        response.headers["Link"] = f'<{next_url}>; rel="next"'
+    return attempts
 
 
 @router.get(
@@ -90,7 +120,7 @@ async def list_attempts(
 async def get_attempt(
     attempt_id: UUID,
     user_id: CurrentUserId,
-    service: AttemptAnswerServiceDep,
+    service: AttemptReadServiceDep,
     request: Request,
 ) -> AttemptDetailResponse:
     """Get a single attempt with its answers."""
@@ -99,8 +129,11 @@ async def get_attempt(
     # Construct HAL-links
     if result.answers:
         task_ids = [a.task_id for a in result.answers]
-        base_url = request.url_for("get_tasks_batch")
-        query_string = urlencode([("task_id", str(tid)) for tid in task_ids])
+        base_url = _tasks_batch_path(request.app).make_absolute_url(
+            request.base_url,
+        )
+        # UUIDs contain only URL-safe characters, so no quoting is needed
+        query_string = "&".join(f"task_id={tid}" for tid in task_ids)
         result.links = AttemptLinks(tasks=f"{base_url}?{query_string}")
 
     return result
@@ -116,13 +149,22 @@ async def get_attempt(
         404: {"description": "Attempt or task not found"},
         409: {"description": "Attempt is locked (already evaluated)"},
     },
+    # The body is parsed by AnswerUpsertPayloadDep, so document it here
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {"schema": answer_upsert_request_schema()},
+            },
+        },
+    },
 )
 async def save_answer(
     attempt_id: UUID,
     task_id: UUID,
-    payload: AnswerUpsertRequest,
+    payload: AnswerUpsertPayloadDep,
     user_id: CurrentUserId,
-    service: AttemptAnswerServiceDep,
+    service: AutosaveServiceDep,
 ) -> AnswerSavedResponse:
     """
     Save or update an answer for a task (idempotent upsert).
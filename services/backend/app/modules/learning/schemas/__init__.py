@@ -2,6 +2,7 @@
 
 from app.modules.learning.schemas.answer import (
     AnswerSavedResponse,
+    AnswerUpsertAdapter,
     AnswerUpsertRequest,
     ClozeAnswerData,
     ClozeItemData,
@@ -9,6 +10,7 @@ from app.modules.learning.schemas.answer import (
     FreeTextAnswerData,
     FreeTextCorrectnessRequest,
     MultipleChoiceAnswerData,
+    answer_upsert_request_schema,
 )
 from app.modules.learning.schemas.attempt import (
     AttemptLinks,
@@ -31,6 +33,8 @@ __all__ = [
     "AttemptStatus",
     # Answer schemas
     "AnswerUpsertRequest",
+    "AnswerUpsertAdapter",
+    "answer_upsert_request_schema",
     "AnswerSavedResponse",
     "FreeTextCorrectnessRequest",
     "MultipleChoiceAnswerData",
@@ -5,10 +5,10 @@ Uses discriminated unions to handle polymorphic answer types.
 """
 
 from datetime import datetime
-from typing import Annotated, Literal, Union
+from typing import Annotated, Any, Literal, Union
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 # === Data Payloads for Request/Response ===
@@ -71,6 +71,34 @@ AnswerUpsertRequest = Annotated[
     Field(discriminator="type"),
 ]
 
+# Compiled once; validates raw request bytes without an intermediate dict.
+AnswerUpsertAdapter: TypeAdapter[AnswerUpsertRequest] = TypeAdapter(
+    AnswerUpsertRequest,
+)
+
+
+def _inline_refs(node: Any, defs: dict[str, Any]) -> Any:
+    """Replace local `$ref`s in a JSON schema with the referenced definitions."""
+    if isinstance(node, list):
+        return [_inline_refs(item, defs) for item in node]
+    if not isinstance(node, dict):
+        return node
+    if "$ref" in node:
+        return _inline_refs(defs[node["$ref"].rsplit("/", 1)[-1]], defs)
+    # Discriminator mappings point at `$defs` entries that no longer exist
+    return {
+        key: _inline_refs(value, defs)
+        for key, value in node.items()
+        if key != "mapping"
+    }
+
+
+def answer_upsert_request_schema() -> dict[str, Any]:
+    """Self-contained JSON schema of AnswerUpsertRequest for OpenAPI docs."""
+    schema = AnswerUpsertAdapter.json_schema()
+    defs = schema.pop("$defs", {})
+    return _inline_refs(schema, defs)
+
 
 # === Response for Saved Answer ===
 
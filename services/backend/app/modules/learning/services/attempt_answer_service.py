@@ -6,6 +6,7 @@ from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.modules.learning.exceptions import (
+    NOT_YOUR_ATTEMPT,
     AttemptNotFoundException,
     AttemptLockedException,
     QuizNotCompletedException,
@@ -16,8 +17,9 @@ from app.modules.learning.exceptions import (
     InvalidAnswerTypeException,
 )
 from app.modules.learning.models import AttemptStatus, FreeTextAnswer
-from app.modules.learning.mappers import answer_to_dto
+from app.modules.learning.mappers import answers_to_dtos
 from app.modules.learning.repositories import AttemptRepository, AnswerRepository
+from app.modules.learning.services.autosave_batcher import AutosaveBatcher
 from app.modules.learning.schemas import (
     AttemptListItem,
     AttemptDetailResponse,
@@ -26,7 +28,7 @@ from app.modules.learning.schemas import (
     AnswerSavedResponse,
 )
 from app.modules.learning.strategies import AnswerMappingRegistry, AnswerUpsertRegistry
-from app.shared.utils import quantize_percent
+from app.shared.utils import basis_points_to_percent
 from app.shared.strategy_registry import StrategyNotFoundError
 
 from app.shared.ports.quiz_read import QuizReadPort, TaskDetailView
@@ -51,7 +53,11 @@ def _validate_answer_type(
 
 
 class AttemptAnswerService:
-    """Service for Attempt and Answer business logic."""
+    """Service for Attempt and Answer business logic.
+
+    Response DTOs are assembled from database rows and already-built answer
+    DTOs, so they are created with `model_construct` and not revalidated.
+    """
 
     def __init__(
         self,
@@ -61,6 +67,7 @@ class AttemptAnswerService:
         mapping_registry: AnswerMappingRegistry,
         attempt_repo: AttemptRepository,
         answer_repo: AnswerRepository,
+        autosave_batcher: AutosaveBatcher | None = None,
     ) -> None:
         """
         Initialize service with database session and repositories.
@@ -72,6 +79,8 @@ class AttemptAnswerService:
             mapping_registry: Strategy registry for answer DTO mapping
             attempt_repo: AttemptRepository instance
             answer_repo: AnswerRepository instance
+            autosave_batcher: Writes saved answers in shared transactions;
+                without it, answers are written on `db`
         """
         self.db = db
         self.attempt_repo = attempt_repo
@@ -79,6 +88,7 @@ class AttemptAnswerService:
         self.quiz_read_port = quiz_read_port
         self.answer_upsert_registry = upsert_registry
         self.answer_mapping_registry = mapping_registry
+        self.autosave_batcher = autosave_batcher
 
     async def start_or_resume_attempt(
         self,
@@ -117,11 +127,12 @@ class AttemptAnswerService:
         if existing:
             # Resume: load answers and return
             answers = await self.answer_repo.list_by_attempt(existing.attempt_id)
-            existing_answers = [
-                answer_to_dto(a, self.answer_mapping_registry) for a in answers
-            ]
+            existing_answers = answers_to_dtos(
+                answers,
+                self.answer_mapping_registry,
+            )
             return (
-                AttemptSummaryResponse(
+                AttemptSummaryResponse.model_construct(
                     attempt_id=existing.attempt_id,
                     quiz_id=existing.quiz_id,
                     status=AttemptStatus(existing.status.value),
@@ -136,7 +147,7 @@ class AttemptAnswerService:
         await self.db.commit()
 
         return (
-            AttemptSummaryResponse(
+            AttemptSummaryResponse.model_construct(
                 attempt_id=attempt.attempt_id,
                 quiz_id=attempt.quiz_id,
                 status=AttemptStatus(attempt.status.value),
@@ -151,35 +162,43 @@ class AttemptAnswerService:
         user_id: UUID,
         quiz_id: UUID | None = None,
         status: AttemptStatus | None = None,
+        limit: int | None = None,
+        cursor: UUID | None = None,
     ) -> list[AttemptListItem]:
         """
-        List all attempts for a user with optional filters.
+        List one page of a user's attempts with optional filters.
 
         Args:
             user_id: UUID of the user
             quiz_id: Optional UUID to filter by quiz
             status: Optional status to filter by
+            limit: Maximum number of attempts to return; None for all
+            cursor: attempt_id of the previous page's last item
 
         Returns:
             List of AttemptListItem ordered by started_at descending
         """
-        attempts = await self.attempt_repo.list_by_user(user_id, quiz_id, status)
-
-        return [
-            AttemptListItem(
-                attempt_id=a.attempt_id,
-                quiz_id=a.quiz_id,
-                status=AttemptStatus(a.status.value),
-                started_at=a.started_at,
-                evaluated_at=a.evaluated_at,
-                total_percentage=(
-                    float(quantize_percent(a.total_percentage))
-                    if a.total_percentage is not None
-                    else None
+        attempts = await self.attempt_repo.list_rows_by_user(
+            user_id,
+            quiz_id,
+            status,
+            limit,
+            cursor,
+        )
+
+        items: list[AttemptListItem] = []
+        for a in attempts:
+            items.append(
+                AttemptListItem.model_construct(
+                    attempt_id=a.attempt_id,
+                    quiz_id=a.quiz_id,
+                    status=AttemptStatus(a.status.value),
+                    started_at=a.started_at,
+                    evaluated_at=a.evaluated_at,
+                    total_percentage=basis_points_to_percent(a.total_percentage),
                 ),
             )
-            for a in attempts
-        ]
+        return items
 
     async def get_attempt_with_answers(
         self,
@@ -205,24 +224,18 @@ class AttemptAnswerService:
             raise AttemptNotFoundException(str(attempt_id))
 
         if attempt.user_id != user_id:
-            raise AccessDeniedException("Not your attempt")
+            raise AccessDeniedException(NOT_YOUR_ATTEMPT)
 
         answers = await self.answer_repo.list_by_attempt(attempt_id)
-        existing_answers = [
-            answer_to_dto(a, self.answer_mapping_registry) for a in answers
-        ]
+        existing_answers = answers_to_dtos(answers, self.answer_mapping_registry)
 
-        return AttemptDetailResponse(
+        return AttemptDetailResponse.model_construct(
             attempt_id=attempt.attempt_id,
             quiz_id=attempt.quiz_id,
             status=AttemptStatus(attempt.status.value),
             started_at=attempt.started_at,
             evaluated_at=attempt.evaluated_at,
-            total_percentage=(
-                float(quantize_percent(attempt.total_percentage))
-                if attempt.total_percentage is not None
-                else None
-            ),
+            total_percentage=basis_points_to_percent(attempt.total_percentage),
             answers=existing_answers,
         )
 
@@ -258,7 +271,7 @@ class AttemptAnswerService:
             raise AttemptNotFoundException(str(attempt_id))
 
         if attempt.user_id != user_id:
-            raise AccessDeniedException("Not your attempt")
+            raise AccessDeniedException(NOT_YOUR_ATTEMPT)
 
         # 2. Check attempt is still in_progress
         if attempt.status != AttemptStatus.IN_PROGRESS:
@@ -273,25 +286,82 @@ class AttemptAnswerService:
         _validate_answer_type(payload, task)
 
         # 5. Upsert answer based on type
-        try:
-            strategy = self.answer_upsert_registry.get(payload.type)
-            answer = await strategy.upsert(
+        if self.autosave_batcher is None:
+            answer_id = await self._upsert_answer(
                 self.answer_repo,
                 attempt_id,
                 task_id,
                 payload,
             )
-        except (StrategyNotFoundError, ValueError) as exc:
-            raise AnswerTypeMismatchException("unknown", payload.type) from exc
-
-        await self.db.commit()
+            await self.db.commit()
+        else:
+            # Nothing was written on the request session; end its transaction
+            # so the connection is not held while waiting for the batch
+            await self.db.commit()
+            answer_id = await self.autosave_batcher.submit(
+                attempt_id,
+                lambda db: self._write_autosave(db, attempt_id, task_id, payload),
+            )
 
         return AnswerSavedResponse(
-            answer_id=answer.answer_id,
+            answer_id=answer_id,
             task_id=task_id,
             saved_at=datetime.now(timezone.utc),
         )
 
+    async def _write_autosave(
+        self,
+        db: AsyncSession,
+        attempt_id: UUID,
+        task_id: UUID,
+        payload: AnswerUpsertRequest,
+    ) -> UUID:
+        """
+        Upsert an answer inside an autosave batch transaction.
+
+        The attempt may have been evaluated since `save_answer` checked it,
+        so its status is checked again in the transaction that writes.
+
+        Raises:
+            AttemptLockedException: If attempt is no longer in progress
+        """
+        if not await AttemptRepository(db).lock_if_in_progress(attempt_id):
+            raise AttemptLockedException(str(attempt_id))
+        return await self._upsert_answer(
+            AnswerRepository(db),
+            attempt_id,
+            task_id,
+            payload,
+        )
+
+    async def _upsert_answer(
+        self,
+        answer_repo: AnswerRepository,
+        attempt_id: UUID,
+        task_id: UUID,
+        payload: AnswerUpsertRequest,
+    ) -> UUID:
+        """
+        Upsert an answer through its type's strategy, without committing.
+
+        Returns:
+            UUID of the saved answer
+
+        Raises:
+            AnswerTypeMismatchException: If no strategy handles the payload
+        """
+        try:
+            strategy = self.answer_upsert_registry.get(payload.type)
+            answer = await strategy.upsert(
+                answer_repo,
+                attempt_id,
+                task_id,
+                payload,
+            )
+        except (StrategyNotFoundError, ValueError) as exc:
+            raise AnswerTypeMismatchException("unknown", payload.type) from exc
+        return answer.answer_id
+
     async def set_free_text_correctness(
         self,
         user_id: UUID,
@@ -321,7 +391,7 @@ class AttemptAnswerService:
             raise AttemptNotFoundException(str(attempt_id))
 
         if attempt.user_id != user_id:
-            raise AccessDeniedException("Not your attempt")
+            raise AccessDeniedException(NOT_YOUR_ATTEMPT)
 
         # 2. Check attempt is still in_progress
         if attempt.status != AttemptStatus.IN_PROGRESS:
@@ -0,0 +1,129 @@
+"""Group commit for answer autosaves.
+
+Autosaves for the same attempt that arrive while an earlier batch is being
+written queue up and are written together by the next batch: one transaction
+and one commit per batch instead of one per request. A lone save is written
+immediately; there is no waiting window.
+
+Each save runs in its own SAVEPOINT, so one failing save does not roll back
+the others in its batch. Saves for one attempt are applied in arrival order.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+T = TypeVar("T")
+
+AutosaveWrite = Callable[[AsyncSession], Awaitable[Any]]
+
+
+class AutosaveBatcher:
+    """Writes queued autosaves per attempt in shared transactions."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        max_batch: int = 32,
+    ) -> None:
+        """
+        Initialize the batcher.
+
+        Args:
+            session_factory: Opens a new session for each batch
+            max_batch: Maximum number of saves written in one transaction
+        """
+        self._session_factory = session_factory
+        self._max_batch = max_batch
+        self._queues: dict[UUID, list[tuple[AutosaveWrite, asyncio.Future]]] = {}
+        # Strong references, so running workers are not garbage collected
+        self._workers: set[asyncio.Task] = set()
+
+    async def submit(
+        self,
+        attempt_id: UUID,
+        write: Callable[[AsyncSession], Awaitable[T]],
+    ) -> T:
+        """
+        Queue a write for an attempt and wait until it is committed.
+
+        Args:
+            attempt_id: UUID of the attempt the write belongs to
+            write: Performs the write on the batch session; must not commit
+
+        Returns:
+            The value returned by `write`
+
+        Raises:
+            Exception: Whatever `write` raised, or the commit error
+        """
+        future = asyncio.get_running_loop().create_future()
+        queue = self._queues.get(attempt_id)
+        if queue is None:
+            queue = self._queues[attempt_id] = []
+            worker = asyncio.create_task(self._drain(attempt_id, queue))
+            self._workers.add(worker)
+            worker.add_done_callback(self._workers.discard)
+        queue.append((write, future))
+        return await future
+
+    async def _drain(
+        self,
+        attempt_id: UUID,
+        queue: list[tuple[AutosaveWrite, asyncio.Future]],
+    ) -> None:
+        """Write batches until the attempt's queue is empty."""
+        batch: list[tuple[AutosaveWrite, asyncio.Future]] = []
+        try:
+            while queue:
+                batch = queue[: self._max_batch]
+                del queue[: self._max_batch]
+                await self._write_batch(batch)
+        finally:
+            del self._queues[attempt_id]
+            # Waiters are only left over if the worker was cancelled
+            stopped = RuntimeError("Autosave worker stopped before writing")
+            for _, future in batch + queue:
+                _resolve(future, exception=stopped)
+
+    async def _write_batch(
+        self,
+        batch: list[tuple[AutosaveWrite, asyncio.Future]],
+    ) -> None:
+        """Run a batch of writes in one transaction and resolve their futures."""
+        written: list[tuple[asyncio.Future, Any]] = []
+        try:
+            async with self._session_factory() as db:
+                for write, future in batch:
+                    try:
+                        async with db.begin_nested():
+                            result = await write(db)
+                    except Exception as exc:
+                        _resolve(future, exception=exc)
+                    else:
+                        written.append((future, result))
+                await db.commit()
+        except Exception as exc:
+            for future, _ in written:
+                _resolve(future, exception=exc)
+            return
+
+        for future, result in written:
+            _resolve(future, result=result)
+
+
+def _resolve(
+    future: asyncio.Future,
+    result: Any = None,
+    exception: BaseException | None = None,
+) -> None:
+    """Complete a future unless its waiter has already gone away."""
+    if future.done():
+        return
+    if exception is not None:
+        future.set_exception(exception)
+    else:
+        future.set_result(result)
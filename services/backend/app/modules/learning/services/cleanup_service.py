@@ -7,6 +7,8 @@ all related learning data (attempts and answers).
 
 from uuid import UUID
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from app.modules.learning.repositories import AttemptRepository
 
 
@@ -27,6 +29,19 @@ class LearningCleanupService:
         """
         self.attempt_repo = attempt_repo
 
+    @classmethod
+    def for_session(cls, db: AsyncSession) -> "LearningCleanupService":
+        """
+        Build a cleanup service bound to the given session.
+
+        Used where only a session is at hand, e.g. event subscribers and the
+        DI factory, so the repository wiring lives in one place.
+
+        Args:
+            db: Async SQLAlchemy session of the calling transaction
+        """
+        return cls(AttemptRepository(db))
+
     async def delete_attempts_for_quiz(self, quiz_id: UUID) -> int:
         """
         Delete all attempts (and cascading answers) for a quiz.
@@ -11,6 +11,7 @@ from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.modules.learning.exceptions import (
+    NOT_YOUR_ATTEMPT,
     AttemptNotFoundException,
     AttemptLockedException,
     AccessDeniedException,
@@ -33,13 +34,34 @@ from app.modules.learning.services.evaluation_strategies import (
     normalize_answer_type,
 )
 from app.shared.strategy_registry import StrategyNotFoundError
-from app.shared.utils import quantize_percent
+from app.shared.utils import percent_to_basis_points, quantize_percent
 
 from app.shared.ports.quiz_read import QuizReadPort, TaskDetailView
 
+_ZERO = Decimal("0.0")
+# Fallback for quantize_percent, already at two decimal places
+_ZERO_PERCENT = Decimal("0.00")
+
+_AnswerDetailClass = type[
+    MultipleChoiceAnswerDetail | FreeTextAnswerDetail | ClozeAnswerDetail
+]
+
+_FALLBACK_ANSWER_DETAIL = ("multiple_choice", MultipleChoiceAnswerDetail)
+
+# Task type -> (detail type, detail class) for the evaluation response
+_ANSWER_DETAIL_CLASSES: dict[str, tuple[str, _AnswerDetailClass]] = {
+    "multiple_choice": _FALLBACK_ANSWER_DETAIL,
+    "free_text": ("free_text", FreeTextAnswerDetail),
+    "cloze": ("cloze", ClozeAnswerDetail),
+}
+
 
 class EvaluationService:
-    """Service for Attempt evaluation business logic."""
+    """Service for Attempt evaluation business logic.
+
+    Evaluation results are computed here from database rows, so response DTOs
+    are created with `model_construct` and not revalidated.
+    """
 
     def __init__(
         self,
@@ -91,7 +113,7 @@ class EvaluationService:
             raise AttemptNotFoundException(str(attempt_id))
 
         if attempt.user_id != user_id:
-            raise AccessDeniedException("Not your attempt")
+            raise AccessDeniedException(NOT_YOUR_ATTEMPT)
 
         # 2. Check attempt is still in_progress
         if attempt.status != AttemptStatus.IN_PROGRESS:
@@ -102,29 +124,27 @@ class EvaluationService:
             attempt.quiz_id,
             user_id,
         )
-        task_map = {t.task_id: t for t in tasks}
 
-        # 4. Load all answers
-        answers = await self.answer_repo.list_by_attempt(attempt_id)
+        # 4. Load all answers; a quiz without tasks has nothing to score
+        answers = await self.answer_repo.list_by_attempt(attempt_id) if tasks else []
         answer_map = {a.task_id: a for a in answers}
 
         # 5. Evaluate each task
         answer_details: list[AnswerDetailDTO] = []
-        total_score = Decimal("0.0")
+        percentages: list[tuple[UUID, int]] = []
+        total_score = _ZERO
 
         for task in tasks:
             answer = answer_map.get(task.task_id)
 
             if answer is None:
                 # No answer = 0%
-                percentage = Decimal("0.0")
+                percentage = _ZERO
             else:
                 # Evaluate based on type
                 percentage = await self._evaluate_answer(answer, task)
-                # Persist percentage on answer
-                await self.answer_repo.set_answer_percentage(
-                    answer.answer_id,
-                    percentage,
+                percentages.append(
+                    (answer.answer_id, percent_to_basis_points(percentage)),
                 )
 
             total_score += percentage
@@ -133,23 +153,28 @@ class EvaluationService:
             detail = self._create_answer_detail(task, percentage)
             answer_details.append(detail)
 
-        # 6. Calculate total percentage
+        # 6. Persist all answer percentages at once
+        await self.answer_repo.set_answer_percentages(percentages)
+
+        # 7. Calculate total percentage
         if len(tasks) > 0:
             total_percentage = total_score / len(tasks)
         else:
-            total_percentage = Decimal("0.0")
+            total_percentage = _ZERO
 
-        # 7. Quantize and mark attempt as evaluated
+        # 8. Quantize and mark attempt as evaluated
         evaluated_at = datetime.now(timezone.utc)
-        total_percentage = quantize_percent(total_percentage) or Decimal("0.00")
-        await self.attempt_repo.mark_evaluated(
+        total_percentage = quantize_percent(total_percentage) or _ZERO_PERCENT
+        if not await self.attempt_repo.mark_evaluated(
             attempt_id,
-            total_percentage,
+            percent_to_basis_points(total_percentage),
             evaluated_at,
-        )
+        ):
+            # A concurrent evaluation finished first
+            raise AttemptLockedException(str(attempt_id))
         await self.db.commit()
 
-        return EvaluationResponse(
+        return EvaluationResponse.model_construct(
             attempt_id=attempt_id,
             quiz_id=attempt.quiz_id,
             total_percentage=total_percentage,
@@ -199,28 +224,13 @@ class EvaluationService:
         Returns:
             AnswerDetailDTO (discriminated union)
         """
-        if task.type == "multiple_choice":
-            return MultipleChoiceAnswerDetail(
-                task_id=task.task_id,
-                type="multiple_choice",
-                percentage_correct=quantize_percent(percentage) or Decimal("0.00"),
-            )
-        elif task.type == "free_text":
-            return FreeTextAnswerDetail(
-                task_id=task.task_id,
-                type="free_text",
-                percentage_correct=quantize_percent(percentage) or Decimal("0.00"),
-            )
-        elif task.type == "cloze":
-            return ClozeAnswerDetail(
-                task_id=task.task_id,
-                type="cloze",
-                percentage_correct=quantize_percent(percentage) or Decimal("0.00"),
-            )
-        else:  # ToDo: throw exception no fallback to MultipleChoice AnswerDetail!!!
-            # Fallback
-            return MultipleChoiceAnswerDetail(
-                task_id=task.task_id,
-                type="multiple_choice",
-                percentage_correct=quantize_percent(percentage) or Decimal("0.00"),
-            )
+        # ToDo: throw exception no fallback to MultipleChoice AnswerDetail!!!
+        detail_type, detail_cls = _ANSWER_DETAIL_CLASSES.get(
+            task.type,
+            _FALLBACK_ANSWER_DETAIL,
+        )
+        return detail_cls.model_construct(
+            task_id=task.task_id,
+            type=detail_type,
+            percentage_correct=quantize_percent(percentage) or _ZERO_PERCENT,
+        )
@@ -3,16 +3,13 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from decimal import Decimal
 from typing import Protocol
+from uuid import UUID
 
 from app.shared.strategy_registry import StrategyRegistry
-from app.modules.learning.models import (
-    Answer,
-    MultipleChoiceAnswer,
-    FreeTextAnswer,
-    ClozeAnswer,
-)
+from app.modules.learning.models import Answer, AnswerType
 from app.modules.learning.repositories import AnswerRepository
 from app.modules.learning.strategies.answer_types import (
     AnswerTypeKey,
@@ -20,9 +17,30 @@ from app.modules.learning.strategies.answer_types import (
 )
 from app.shared.ports.quiz_read import TaskDetailView
 
+# Scores are immutable, so every evaluation shares the same instances.
+_ZERO = Decimal("0.0")
+_HUNDRED = Decimal("100.0")
+
+
+@lru_cache(maxsize=4096)
+def _compile_pattern(pattern: str) -> re.Pattern[str] | None:
+    """Compile a cloze blank pattern, or None if it is not a valid regex.
+
+    Invalid patterns are cached too, so they are not re-parsed on every
+    evaluation; such blanks fall back to an exact string comparison.
+    """
+    try:
+        return re.compile(pattern)
+    except re.error:
+        return None
+
 
 class AnswerEvaluationStrategy(Protocol):
-    """Strategy interface for evaluating answers."""
+    """Strategy interface for evaluating answers.
+
+    Strategies guard on the answer's `type` discriminator, which the ORM
+    loads as an AnswerType member, rather than on its mapped class.
+    """
 
     answer_type: AnswerTypeKey
 
@@ -47,18 +65,23 @@ class MultipleChoiceEvaluationStrategy(AnswerEvaluationStrategy):
         answer_repo: AnswerRepository,
     ) -> Decimal:
         del answer_repo
-        if not isinstance(answer, MultipleChoiceAnswer):
-            return Decimal("0.0")
+        if answer.type is not AnswerType.MULTIPLE_CHOICE:
+            return _ZERO
 
         if task.type != "multiple_choice":
-            return Decimal("0.0")
+            return _ZERO
 
+        # Task views are rebuilt for every evaluation, so there is nothing to
+        # cache across calls; instead skip building the selected set when the
+        # counts already differ. Selections are unique per answer.
         correct_ids = {opt.option_id for opt in task.options if opt.is_correct}
-        selected_ids = {sel.option_id for sel in answer.selections}
+        selections = answer.selections
+        if len(selections) != len(correct_ids):
+            return _ZERO
 
-        if correct_ids == selected_ids:
-            return Decimal("100.0")
-        return Decimal("0.0")
+        if correct_ids.issuperset(sel.option_id for sel in selections):
+            return _HUNDRED
+        return _ZERO
 
 
 class FreeTextEvaluationStrategy(AnswerEvaluationStrategy):
@@ -73,12 +96,13 @@ class FreeTextEvaluationStrategy(AnswerEvaluationStrategy):
         answer_repo: AnswerRepository,
     ) -> Decimal:
         del answer_repo
-        if not isinstance(answer, FreeTextAnswer):
-            return Decimal("0.0")
+        if answer.type is not AnswerType.FREE_TEXT:
+            return _ZERO
 
         if answer.percentage_correct is not None:
-            return Decimal(str(answer.percentage_correct))
-        return Decimal("0.0")
+            # Stored in basis points
+            return Decimal(answer.percentage_correct).scaleb(-2)
+        return _ZERO
 
 
 class ClozeEvaluationStrategy(AnswerEvaluationStrategy):
@@ -92,39 +116,42 @@ class ClozeEvaluationStrategy(AnswerEvaluationStrategy):
         task: TaskDetailView,
         answer_repo: AnswerRepository,
     ) -> Decimal:
-        if not isinstance(answer, ClozeAnswer):
-            return Decimal("0.0")
+        if answer.type is not AnswerType.CLOZE:
+            return _ZERO
 
         if task.type != "cloze":
-            return Decimal("0.0")
+            return _ZERO
 
         if not task.blanks:
-            return Decimal("100.0")
+            return _HUNDRED
 
         blank_patterns = {b.blank_id: b.expected_value for b in task.blanks}
         correct_count = 0
         total_count = len(blank_patterns)
+        results: list[tuple[UUID, bool]] = []
+
+        compiled = {
+            blank_id: _compile_pattern(pattern)
+            for blank_id, pattern in blank_patterns.items()
+            if pattern
+        }
 
         for item in answer.items:
             expected_pattern = blank_patterns.get(item.blank_id)
             if expected_pattern:
-                try:
-                    is_correct = bool(
-                        re.fullmatch(expected_pattern, item.provided_value),
-                    )
-                except re.error:
+                regex = compiled[item.blank_id]
+                if regex is None:
                     is_correct = expected_pattern == item.provided_value
+                else:
+                    is_correct = regex.fullmatch(item.provided_value) is not None
 
                 if is_correct:
                     correct_count += 1
+                results.append((item.blank_id, is_correct))
 
-                await answer_repo.set_cloze_item_correct(
-                    answer.answer_id,
-                    item.blank_id,
-                    is_correct,
-                )
+        await answer_repo.set_cloze_items_correct(answer.answer_id, results)
 
-        percentage = Decimal(correct_count) / Decimal(total_count) * Decimal("100.0")
+        percentage = Decimal(correct_count) / Decimal(total_count) * _HUNDRED
         return percentage
 
 
@@ -12,6 +12,7 @@ from app.modules.learning.strategies.answer_upsert_strategy import (
     ClozeAnswerUpsertStrategy,
 )
 from app.modules.learning.strategies.answer_mapping_strategy import (
+    AnswerMappingRegistry,
     AnswerMappingStrategy,
     MultipleChoiceAnswerMappingStrategy,
     FreeTextAnswerMappingStrategy,
@@ -19,7 +20,6 @@ from app.modules.learning.strategies.answer_mapping_strategy import (
 )
 
 AnswerUpsertRegistry = StrategyRegistry[AnswerTypeKey, AnswerUpsertStrategy]
-AnswerMappingRegistry = StrategyRegistry[AnswerTypeKey, AnswerMappingStrategy]
 
 
 def answer_upsert_registry() -> AnswerUpsertRegistry:
@@ -34,7 +34,7 @@ def answer_upsert_registry() -> AnswerUpsertRegistry:
 
 
 def answer_mapping_registry() -> AnswerMappingRegistry:
-    return StrategyRegistry.from_strategies(
+    return AnswerMappingRegistry.from_strategies(
         strategies=[
             MultipleChoiceAnswerMappingStrategy(),
             FreeTextAnswerMappingStrategy(),
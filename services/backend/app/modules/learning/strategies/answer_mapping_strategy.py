@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from decimal import Decimal
+from dataclasses import dataclass, field
 from typing import Protocol
 
 from app.modules.learning.models import (
     Answer,
+    AnswerType,
     MultipleChoiceAnswer,
     FreeTextAnswer,
     ClozeAnswer,
@@ -21,13 +22,12 @@ from app.modules.learning.schemas.answer import (
     ClozeAnswerData,
     ClozeItemData,
 )
-from app.modules.learning.strategies.answer_types import AnswerTypeKey
-from app.shared.utils import quantize_percent
-
-
-def _to_percentage(value: Decimal | None) -> float | None:
-    quantized = quantize_percent(value)
-    return float(quantized) if quantized is not None else None
+from app.modules.learning.strategies.answer_types import (
+    AnswerTypeKey,
+    normalize_answer_type,
+)
+from app.shared.strategy_registry import StrategyRegistry
+from app.shared.utils import basis_points_to_percent
 
 
 class AnswerMappingStrategy(Protocol):
@@ -49,7 +49,7 @@ class MultipleChoiceAnswerMappingStrategy:
         return ExistingMultipleChoiceAnswer(
             task_id=answer.task_id,
             type="multiple_choice",
-            percentage_correct=_to_percentage(answer.percentage_correct),
+            percentage_correct=basis_points_to_percent(answer.percentage_correct),
             data=MultipleChoiceAnswerData(
                 selected_option_ids=[s.option_id for s in answer.selections],
             ),
@@ -66,7 +66,7 @@ class FreeTextAnswerMappingStrategy:
         return ExistingFreeTextAnswer(
             task_id=answer.task_id,
             type="free_text",
-            percentage_correct=_to_percentage(answer.percentage_correct),
+            percentage_correct=basis_points_to_percent(answer.percentage_correct),
             data=FreeTextAnswerData(text_response=answer.text_response),
         )
 
@@ -81,7 +81,7 @@ class ClozeAnswerMappingStrategy:
         return ExistingClozeAnswer(
             task_id=answer.task_id,
             type="cloze",
-            percentage_correct=_to_percentage(answer.percentage_correct),
+            percentage_correct=basis_points_to_percent(answer.percentage_correct),
             data=ClozeAnswerData(
                 provided_values=[
                     ClozeItemData(blank_id=item.blank_id, value=item.provided_value)
@@ -89,3 +89,30 @@ class ClozeAnswerMappingStrategy:
                 ],
             ),
         )
+
+
+@dataclass(slots=True)
+class AnswerMappingRegistry(StrategyRegistry[AnswerTypeKey, AnswerMappingStrategy]):
+    """Mapping strategy registry with a direct lookup by AnswerType."""
+
+    _by_type: dict[AnswerType, AnswerMappingStrategy] = field(
+        init=False,
+        repr=False,
+    )
+
+    def __post_init__(self) -> None:
+        self._by_type = {
+            AnswerType(key): strategy for key, strategy in self._strategies.items()
+        }
+
+    def get_for(self, answer_type: AnswerType | str) -> AnswerMappingStrategy:
+        """
+        Get the strategy for an answer's type discriminator.
+
+        Loaded answers carry an AnswerType, which resolves with a single dict
+        hit; plain string keys fall back to the regular lookup.
+        """
+        try:
+            return self._by_type[answer_type]
+        except KeyError:
+            return self.get(normalize_answer_type(answer_type))
@@ -1,6 +1,6 @@
 """Quiz module dependencies for FastAPI dependency injection."""
 
-from functools import lru_cache
+from functools import cache
 from typing import Annotated
 
 from fastapi import Depends
@@ -34,19 +34,19 @@ from app.shared.ports.quiz_generation import QuizGenerationPortDep
 
 
 # Registry Dependencies
-@lru_cache
+@cache
 def get_task_mapping_registry() -> TaskMappingRegistry:
     """Factory for task mapping strategy registry."""
     return task_mapping_registry()
 
 
-@lru_cache
+@cache
 def get_task_update_registry() -> TaskUpdateRegistry:
     """Factory for task update strategy registry."""
     return task_update_registry()
 
 
-@lru_cache
+@cache
 def get_task_clone_registry() -> TaskCloneRegistry:
     """Factory for task clone strategy registry."""
     return task_clone_registry()
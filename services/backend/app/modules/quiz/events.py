@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from functools import lru_cache
+from functools import cache
 
 from app.shared.ports.quiz_events import (
     QuizDeletedEvent,
@@ -25,7 +25,7 @@ class InMemoryQuizEventPublisher(QuizEventPublisher):
             await handler(event)
 
 
-@lru_cache
+@cache
 def get_quiz_event_publisher() -> QuizEventPublisher:
     """Singleton publisher for quiz lifecycle events."""
     return InMemoryQuizEventPublisher()
@@ -16,6 +16,7 @@ from app.modules.quiz.exceptions import (
     EditSessionRequiredException,
     EditSessionNotFoundException,
     EditSessionInactiveException,
+    EditSessionConflictException,
     EditSessionTaskMismatchException,
 )
 
@@ -70,6 +71,13 @@ def register_exception_handlers(app: FastAPI) -> None:
     ):
         return JSONResponse(status_code=409, content={"detail": exc.message})
 
+    @app.exception_handler(EditSessionConflictException)
+    async def edit_session_conflict_handler(
+        request: Request,
+        exc: EditSessionConflictException,
+    ):
+        return JSONResponse(status_code=409, content={"detail": exc.message})
+
     @app.exception_handler(EditSessionTaskMismatchException)
     async def edit_session_task_mismatch_handler(
         request: Request,
@@ -72,6 +72,16 @@ class EditSessionInactiveException(QuizModuleException):
         super().__init__(message)
 
 
+class EditSessionConflictException(QuizModuleException):
+    """Raised when another edit session became active for the quiz first."""
+
+    def __init__(
+        self,
+        message: str = "Another edit session is already active for this quiz",
+    ):
+        super().__init__(message)
+
+
 class EditSessionTaskMismatchException(QuizModuleException):
     """Raised when a task is not part of the active draft session."""
 
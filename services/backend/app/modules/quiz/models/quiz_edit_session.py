@@ -6,7 +6,7 @@ import enum
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, Enum as SQLEnum, ForeignKey
+from sqlalchemy import DateTime, Enum as SQLEnum, ForeignKey, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -83,6 +83,17 @@ class QuizEditSession(Base):
         foreign_keys=[draft_version_id],
     )
 
+    # At most one active session per quiz; also serves the active-session lookup
+    __table_args__ = (
+        Index(
+            "uq_quiz_edit_session_active",
+            "quiz_id",
+            unique=True,
+            postgresql_where=text("status = 'ACTIVE'"),
+            sqlite_where=text("status = 'ACTIVE'"),
+        ),
+    )
+
     def __repr__(self) -> str:
         return (
             f"<QuizEditSession(edit_session_id={self.edit_session_id}, "
@@ -57,10 +57,8 @@ class QuizVersionRepository:
         return version
 
     async def get_by_id(self, quiz_version_id: uuid.UUID) -> Optional[QuizVersion]:
-        result = await self.db.execute(
-            select(QuizVersion).where(QuizVersion.quiz_version_id == quiz_version_id),
-        )
-        return result.scalar_one_or_none()
+        # Identity-map lookup first: no query if the version is already loaded
+        return await self.db.get(QuizVersion, quiz_version_id)
 
     async def get_current_version_id(self, quiz_id: uuid.UUID) -> uuid.UUID | None:
         result = await self.db.execute(
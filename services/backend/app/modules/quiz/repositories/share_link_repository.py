@@ -86,9 +86,8 @@ class ShareLinkRepository:
         Returns:
             ShareLink instance if found, None otherwise
         """
-        query = select(ShareLink).where(ShareLink.share_link_id == share_link_id)
-        result = await self.db.execute(query)
-        return result.scalar_one_or_none()
+        # Identity-map lookup first: no query if the link is already loaded
+        return await self.db.get(ShareLink, share_link_id)
 
     async def get_by_quiz_id(self, quiz_id: uuid.UUID) -> List[ShareLink]:
         """
@@ -23,6 +23,13 @@ from app.modules.quiz.models.task import (
     ClozeTask,
 )
 
+# Built once and reused by every query, like the learning module's
+# ANSWER_POLYMORPHIC, so the polymorphic join is not rebuilt per call.
+TASK_POLYMORPHIC = with_polymorphic(
+    Task,
+    [MultipleChoiceTask, FreeTextTask, ClozeTask],
+)
+
 
 class TaskRepository:
     """Repository for Task database operations (all types)."""
@@ -38,7 +45,7 @@ class TaskRepository:
 
     def _get_polymorphic_entity(self):
         """Get polymorphic entity for Task queries with all subtypes."""
-        return with_polymorphic(Task, [MultipleChoiceTask, FreeTextTask, ClozeTask])
+        return TASK_POLYMORPHIC
 
     async def _load_task_relationships(self, task: Task) -> None:
         """
@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import uuid
 
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.modules.quiz.exceptions import (
     AccessDeniedException,
+    EditSessionConflictException,
     EditSessionInactiveException,
     EditSessionNotFoundException,
     EditSessionTaskMismatchException,
@@ -91,13 +93,18 @@ class QuizEditSessionService:
             draft_version.quiz_version_id,
         )
 
-        session = await self.session_repo.create(
-            quiz_id=quiz_id,
-            draft_version_id=draft_version.quiz_version_id,
-            started_by=user_id,
-        )
-
-        await self.db.commit()
+        # uq_quiz_edit_session_active rejects the second of two concurrent
+        # starts; report it as a conflict instead of a server error
+        try:
+            session = await self.session_repo.create(
+                quiz_id=quiz_id,
+                draft_version_id=draft_version.quiz_version_id,
+                started_by=user_id,
+            )
+            await self.db.commit()
+        except IntegrityError:
+            await self.db.rollback()
+            raise EditSessionConflictException() from None
 
         task_dtos = [self._task_to_dto(task) for task in draft_tasks]
 
@@ -5,16 +5,24 @@ from typing import Annotated
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import JWTError
+import jwt
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db_session
+from app.core.database import (
+    get_db_session,
+    get_read_db_session,
+    get_write_db_session,
+)
 from app.core.security import verify_jwt_token
 from app.shared.schemas import TokenPayload
 from app.core.email import MailService
 
 # Database session dependency
 DBSessionDep = Annotated[AsyncSession, Depends(get_db_session)]
+# Session dependency for read-then-write paths (BEGIN IMMEDIATE on SQLite)
+WriteDBSessionDep = Annotated[AsyncSession, Depends(get_write_db_session)]
+# Read-only session dependency (read replica when configured)
+ReadDBSessionDep = Annotated[AsyncSession, Depends(get_read_db_session)]
 
 # HTTP Bearer security scheme for Swagger UI integration
 http_bearer = HTTPBearer()
@@ -40,7 +48,7 @@ async def get_current_user(
     """
     try:
         return verify_jwt_token(credentials.credentials)
-    except (JWTError, KeyError, ValueError):
+    except (jwt.PyJWTError, KeyError, ValueError):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired token",
@@ -70,6 +78,14 @@ async def get_mailer():
     return _mailer
 
 
+async def close_mailer() -> None:
+    """Close the shared mail service's SMTP connection on shutdown."""
+    global _mailer
+    mailer, _mailer = _mailer, None
+    if mailer is not None:
+        await mailer.close()
+
+
 # Type aliases for dependency injection
 CurrentUser = Annotated[TokenPayload, Depends(get_current_user)]
 CurrentUserId = Annotated[uuid.UUID, Depends(get_current_user_id)]
@@ -44,5 +44,9 @@ class TokenPayload(BaseModel):
         Raises:
             KeyError: If required claim 'user_id' is missing
             ValueError: If 'user_id' is not a valid UUID
+
+        Note:
+            Claims come from a token whose signature was already verified and
+            'user_id' is parsed explicitly, so model validation is skipped.
         """
-        return cls(user_id=uuid.UUID(claims["user_id"]))
+        return cls.model_construct(user_id=uuid.UUID(claims["user_id"]))
@@ -1,5 +1,8 @@
 """Utility functions used across the application."""
 
+import os
+import time
+import uuid
 from datetime import datetime
 from decimal import Decimal
 from typing import Any
@@ -10,6 +13,23 @@ def now_utc() -> datetime:
     return datetime.utcnow()
 
 
+def uuid7() -> uuid.UUID:
+    """Generate a time-ordered UUID version 7 (RFC 9562).
+
+    The leading 48 bits hold the Unix time in milliseconds, so primary keys
+    generated close together land on neighbouring B-tree pages instead of
+    random ones.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76  # version
+    value |= ((rand >> 62) & 0xFFF) << 64  # rand_a
+    value |= 0b10 << 62  # RFC 9562 variant
+    value |= rand & ((1 << 62) - 1)  # rand_b
+    return uuid.UUID(int=value)
+
+
 def generate_slug(text: str) -> str:
     """Generate URL-friendly slug from text."""
     import re
@@ -34,6 +54,9 @@ def paginate_query_params(page: int = 1, page_size: int = 20) -> dict[str, int]:
     return {"offset": offset, "limit": page_size}
 
 
+_PERCENT_STEP = Decimal("0.01")
+
+
 def quantize_percent(value: Decimal | None) -> Decimal | None:
     """Quantize a percentage value to two decimal places.
 
@@ -41,4 +64,22 @@ def quantize_percent(value: Decimal | None) -> Decimal | None:
     """
     if value is None:
         return None
-    return value.quantize(Decimal("0.01"))
+    return value.quantize(_PERCENT_STEP)
+
+
+def percent_to_basis_points(value: Decimal) -> int:
+    """Convert a 0-100 percentage to integer basis points (0-10000).
+
+    The value is quantized to two decimal places first.
+    """
+    return int(value.quantize(_PERCENT_STEP).scaleb(2))
+
+
+def basis_points_to_percent(value: int | None) -> float | None:
+    """Convert stored basis points to a float percentage for responses.
+
+    Returns None when input is None.
+    """
+    if value is None:
+        return None
+    return value / 100
@@ -7,7 +7,7 @@ import uuid
 import pytest
 from httpx import ASGITransport, AsyncClient
 
-from app.core.config import get_settings
+from app.core.config import reset_settings
 from app.core.security import create_jwt_token
 from app.shared.schemas import TokenPayload
 from tests.integration.helpers import build_default_quiz_output, build_expired_token
@@ -47,7 +47,7 @@ async def app(monkeypatch, tmp_path_factory):
     monkeypatch.setenv("LLM_OLLAMA_UTILITY_MODEL", "llama3")
     monkeypatch.setenv("LLM_LITELLM_GENERATION_MODEL", "gpt-4o")
     monkeypatch.setenv("LLM_LITELLM_UTILITY_MODEL", "gpt-4o-mini")
-    get_settings.cache_clear()
+    reset_settings()
 
     import app.core.database as database
     import app.modules.quiz.services.quiz_service as quiz_service
@@ -82,7 +82,7 @@ async def app(monkeypatch, tmp_path_factory):
     database.sessionmanager = original_sessionmanager
     quiz_service.sessionmanager = original_quiz_sessionmanager
     fastapi_app.dependency_overrides.clear()
-    get_settings.cache_clear()
+    reset_settings()
 
 
 @pytest.fixture
@@ -6,7 +6,7 @@ from datetime import datetime, timedelta, timezone
 from typing import Any
 from uuid import UUID
 
-from jose import jwt
+import jwt
 
 from app.core.config import get_settings
 from app.modules.quiz.schemas import (
@@ -0,0 +1,74 @@
+"""Integration tests for GET /learning/attempts pagination.
+
+Tests cover:
+- Link header pointing to the next page when a page is full
+- No Link header when no limit is given
+- Link header exposed to the cross-origin frontend
+"""
+
+import pytest
+
+
+pytestmark = pytest.mark.integration
+
+
+async def _start_attempts(authed_client, count: int) -> list[str]:
+    """Create `count` quizzes and start one attempt on each, oldest first."""
+    attempt_ids = []
+    for index in range(count):
+        create = await authed_client.post(
+            "/quiz/quizzes",
+            data={"user_description": f"Attempt list {index}"},
+        )
+        assert create.status_code == 202
+        quiz_id = create.json()["quiz_id"]
+
+        attempt = await authed_client.post(f"/learning/quizzes/{quiz_id}/attempts")
+        assert attempt.status_code in (200, 201)
+        attempt_ids.append(attempt.json()["attempt_id"])
+    return attempt_ids
+
+
+async def test_attempt_list_follows_link_header(authed_client, mock_llm):
+    """Following rel="next" links walks all attempts newest first."""
+    attempt_ids = await _start_attempts(authed_client, 2)
+
+    first = await authed_client.get("/learning/attempts", params={"limit": 1})
+    assert first.status_code == 200
+    assert first.links["next"]["url"]
+
+    second = await authed_client.get(first.links["next"]["url"])
+    assert second.status_code == 200
+
+    listed = [item["attempt_id"] for item in first.json() + second.json()]
+    assert listed == list(reversed(attempt_ids))
+
+
+async def test_attempt_list_without_limit_has_no_link(authed_client, mock_llm):
+    """Without a limit all attempts are returned and no next page is linked."""
+    attempt_ids = await _start_attempts(authed_client, 2)
+
+    resp = await authed_client.get("/learning/attempts")
+
+    assert resp.status_code == 200
+    assert len(resp.json()) == len(attempt_ids)
+    assert "link" not in resp.headers
+
+
+async def test_attempt_list_exposes_link_header_to_frontend(
+    authed_client,
+    mock_llm,
+):
+    """CORS responses let the frontend read the Link header."""
+    await _start_attempts(authed_client, 1)
+
+    resp = await authed_client.get(
+        "/learning/attempts",
+        params={"limit": 1},
+        headers={"Origin": "http://localhost:3000"},
+    )
+
+    assert resp.status_code == 200
+    assert "link" in resp.headers
+    exposed = resp.headers["access-control-expose-headers"]
+    assert "link" in exposed.lower()
@@ -12,7 +12,7 @@ async def test_delete_account_success(authed_client, test_user_id):
 
     # Create a user record that matches the JWT subject
     async with sessionmanager.session() as s:
-        user = User(user_id=test_user_id, email_hash="delete_account_hash")
+        user = User(user_id=test_user_id, email_hash=b"delete_account_hash")
         s.add(user)
         await s.flush()
         await s.commit()
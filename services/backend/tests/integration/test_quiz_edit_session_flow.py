@@ -1,11 +1,14 @@
 import pytest
-from uuid import UUID
+from unittest.mock import AsyncMock, patch
+from uuid import UUID, uuid4
 from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
 
 import app.core.database as database
 from app.modules.quiz.models import QuizEditSession, QuizVersion, Task
 from app.modules.quiz.models.quiz_edit_session import QuizEditSessionStatus
 from app.modules.quiz.models.quiz_version import QuizVersionStatus
+from app.modules.quiz.repositories import QuizEditSessionRepository
 
 pytestmark = pytest.mark.integration
 
@@ -279,6 +282,55 @@ async def test_start_edit_aborts_existing_session(authed_client, mock_llm):
     assert task_count == 0
 
 
+async def test_second_active_session_for_quiz_is_rejected(authed_client, mock_llm):
+    quiz_id, _ = await _create_quiz_and_tasks(authed_client)
+    first_session_id, _ = await _start_edit_session(authed_client, quiz_id)
+
+    async with database.sessionmanager.session() as db:
+        first_session = await db.get(QuizEditSession, first_session_id)
+        db.add(
+            QuizEditSession(
+                quiz_id=quiz_id,
+                draft_version_id=first_session.draft_version_id,
+                started_by=uuid4(),
+                status=QuizEditSessionStatus.ACTIVE,
+            ),
+        )
+        with pytest.raises(IntegrityError):
+            await db.flush()
+
+
+async def test_concurrent_start_edit_returns_conflict(authed_client, mock_llm):
+    quiz_id, _ = await _create_quiz_and_tasks(authed_client)
+    first_session_id, _ = await _start_edit_session(authed_client, quiz_id)
+
+    # Simulate a concurrent start that missed the first session's row
+    with patch.object(
+        QuizEditSessionRepository,
+        "get_active_for_quiz",
+        AsyncMock(return_value=None),
+    ):
+        second = await authed_client.post(f"/quiz/quizzes/{quiz_id}/edit/start")
+
+    assert second.status_code == 409
+
+    async with database.sessionmanager.session() as db:
+        active_ids = (
+            (
+                await db.execute(
+                    select(QuizEditSession.edit_session_id).where(
+                        QuizEditSession.quiz_id == quiz_id,
+                        QuizEditSession.status == QuizEditSessionStatus.ACTIVE,
+                    ),
+                )
+            )
+            .scalars()
+            .all()
+        )
+
+    assert active_ids == [first_session_id]
+
+
 async def test_update_requires_edit_session_header(authed_client, mock_llm):
     quiz_id, tasks = await _create_quiz_and_tasks(authed_client)
     _, draft_tasks = await _start_edit_session(authed_client, quiz_id)
@@ -2,10 +2,13 @@
 
 import uuid
 from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from app.core.cache import TTLCache
+from app.core.rate_limit import SlidingWindowRateLimiter
 from app.modules.auth.models import MagicLinkToken, User
 from app.modules.auth.exceptions import (
     MagicLinkTokenExpiredError,
@@ -49,7 +52,7 @@ class TestMagicLinkServiceHashFunction:
         assert hash1 != hash2
 
     def test_hash_length(self):
-        """Test that hash is 64 characters (SHA-256 in hex)."""
+        """Test that hash is the 32-byte raw SHA-256 digest."""
         # Arrange
         input_data = "test@example.com"
 
@@ -57,8 +60,8 @@ class TestMagicLinkServiceHashFunction:
         result = MagicLinkService._hash(input_data)
 
         # Assert
-        assert len(result) == 64
-        assert all(c in "0123456789abcdef" for c in result)
+        assert isinstance(result, bytes)
+        assert len(result) == 32
 
 
 class TestMagicLinkServiceRequestMagicLink:
@@ -75,7 +78,7 @@ class TestMagicLinkServiceRequestMagicLink:
     def mock_token_repo(self):
         """Mock MagicLinkTokenRepository."""
         repo = AsyncMock()
-        repo.create = AsyncMock()
+        repo.upsert = AsyncMock()
         return repo
 
     @pytest.fixture
@@ -83,7 +86,7 @@ class TestMagicLinkServiceRequestMagicLink:
         """Mock UserRepository."""
         repo = AsyncMock()
         repo.get_by_email_hash = AsyncMock(return_value=None)
-        repo.create = AsyncMock()
+        repo.create_if_absent = AsyncMock(return_value=True)
         return repo
 
     @pytest.fixture
@@ -138,9 +141,59 @@ class TestMagicLinkServiceRequestMagicLink:
         assert isinstance(response, MagicLinkResult)
         assert response.expires_in == 300
         mock_db.commit.assert_not_called()
-        mock_token_repo.create.assert_not_called()
+        mock_token_repo.upsert.assert_not_called()
         service.send_magic_link.assert_not_called()
 
+    async def test_request_magic_link_uses_registered_users_cache(
+        self,
+        mock_db,
+        mock_user_repo,
+        mock_token_repo,
+    ):
+        """Test that a cached registered email skips the user lookup."""
+        # Arrange
+        email = "cached@example.com"
+        cache = TTLCache(ttl_seconds=60, max_size=10)
+        cache.set(MagicLinkService._hash(email), True)
+        service = MagicLinkService(
+            db=mock_db,
+            user_repo=mock_user_repo,
+            token_repo=mock_token_repo,
+            registered_users=cache,
+        )
+        service.send_magic_link = AsyncMock()
+
+        # Act
+        await service.request_magic_link(email)
+
+        # Assert
+        mock_user_repo.get_by_email_hash.assert_not_called()
+        mock_token_repo.upsert.assert_called_once()
+
+    async def test_request_magic_link_throttled(
+        self,
+        mock_db,
+        mock_user_repo,
+        mock_token_repo,
+    ):
+        """Test that throttled requests get the generic response without DB work."""
+        # Arrange
+        email = "test@example.com"
+        service = MagicLinkService(
+            db=mock_db,
+            user_repo=mock_user_repo,
+            token_repo=mock_token_repo,
+            rate_limiter=SlidingWindowRateLimiter(max_hits=0, window_seconds=60),
+        )
+
+        # Act
+        response = await service.request_magic_link(email)
+
+        # Assert
+        assert response.expires_in == 300
+        mock_user_repo.get_by_email_hash.assert_not_called()
+        mock_token_repo.upsert.assert_not_called()
+
     async def test_register_user_and_request_magic_link_success(
         self,
         service,
@@ -149,7 +202,7 @@ class TestMagicLinkServiceRequestMagicLink:
         """Test registration creates a user and sends a magic link."""
         # Arrange
         email = "new-user@example.com"
-        mock_user_repo.get_by_email_hash.return_value = None
+        mock_user_repo.create_if_absent.return_value = True
 
         # Act
         response = await service.register_user_and_request_magic_link(email)
@@ -158,20 +211,20 @@ class TestMagicLinkServiceRequestMagicLink:
         assert isinstance(response, MagicLinkResult)
         assert response.expires_in == 300
         assert response.already_registered is False
-        mock_user_repo.create.assert_called_once_with(
-            email_hash=MagicLinkService._hash(email),
+        mock_user_repo.create_if_absent.assert_called_once_with(
+            MagicLinkService._hash(email),
         )
 
     async def test_register_user_and_request_magic_link_existing_user_raises(
         self,
         service,
         mock_user_repo,
-        existing_user,
+        mock_token_repo,
     ):
         """Test registration returns generic response for existing user."""
         # Arrange
         email = "test@example.com"
-        mock_user_repo.get_by_email_hash.return_value = existing_user
+        mock_user_repo.create_if_absent.return_value = False
 
         # Act & Assert
         response = await service.register_user_and_request_magic_link(email)
@@ -179,7 +232,90 @@ class TestMagicLinkServiceRequestMagicLink:
         assert isinstance(response, MagicLinkResult)
         assert response.expires_in == 300
         assert response.already_registered is True
-        mock_user_repo.create.assert_not_called()
+        mock_token_repo.upsert.assert_not_called()
+
+    @pytest.mark.parametrize("registered", [True, False])
+    async def test_register_throttled_reports_registration_status(
+        self,
+        mock_db,
+        mock_user_repo,
+        mock_token_repo,
+        registered,
+    ):
+        """Test that throttled registrations answer like unthrottled ones."""
+        # Arrange
+        email = "test@example.com"
+        mock_user_repo.get_by_email_hash.return_value = (
+            User(user_id=uuid.uuid4(), email_hash=MagicLinkService._hash(email))
+            if registered
+            else None
+        )
+        service = MagicLinkService(
+            db=mock_db,
+            user_repo=mock_user_repo,
+            token_repo=mock_token_repo,
+            rate_limiter=SlidingWindowRateLimiter(max_hits=0, window_seconds=60),
+        )
+
+        # Act
+        response = await service.register_user_and_request_magic_link(email)
+
+        # Assert
+        assert response.already_registered is registered
+        mock_user_repo.create_if_absent.assert_not_called()
+        mock_token_repo.upsert.assert_not_called()
+
+    async def test_register_does_not_cache_user_when_commit_fails(
+        self,
+        mock_db,
+        mock_user_repo,
+        mock_token_repo,
+    ):
+        """Test that a failed registration leaves the email uncached."""
+        # Arrange
+        email = "new-user@example.com"
+        cache = TTLCache(ttl_seconds=60, max_size=10)
+        mock_user_repo.create_if_absent.return_value = True
+        mock_db.commit.side_effect = RuntimeError("commit failed")
+        service = MagicLinkService(
+            db=mock_db,
+            user_repo=mock_user_repo,
+            token_repo=mock_token_repo,
+            registered_users=cache,
+        )
+
+        # Act
+        with pytest.raises(RuntimeError):
+            await service.register_user_and_request_magic_link(email)
+
+        # Assert
+        assert cache.get(MagicLinkService._hash(email)) is None
+
+    async def test_register_caches_user_after_commit(
+        self,
+        mock_db,
+        mock_user_repo,
+        mock_token_repo,
+    ):
+        """Test that a committed registration is cached as registered."""
+        # Arrange
+        email = "new-user@example.com"
+        cache = TTLCache(ttl_seconds=60, max_size=10)
+        mock_user_repo.create_if_absent.return_value = True
+        service = MagicLinkService(
+            db=mock_db,
+            user_repo=mock_user_repo,
+            token_repo=mock_token_repo,
+            registered_users=cache,
+        )
+        service.send_magic_link = AsyncMock()
+
+        # Act
+        await service.register_user_and_request_magic_link(email)
+
+        # Assert
+        mock_db.commit.assert_awaited_once()
+        assert cache.get(MagicLinkService._hash(email)) is True
 
     async def test_request_magic_link_creates_token_hash(
         self,
@@ -194,10 +330,28 @@ class TestMagicLinkServiceRequestMagicLink:
         await service.request_magic_link(email)
 
         # Assert
-        mock_token_repo.create.assert_called_once()
-        call_kwargs = mock_token_repo.create.call_args.kwargs
+        mock_token_repo.upsert.assert_called_once()
+        call_kwargs = mock_token_repo.upsert.call_args.kwargs
         assert "token_hash" in call_kwargs
-        assert len(call_kwargs["token_hash"]) == 64  # SHA-256 hex
+        assert len(call_kwargs["token_hash"]) == 32  # Raw SHA-256 digest
+
+    async def test_request_magic_link_token_hash_matches_link(
+        self,
+        service,
+        mock_token_repo,
+    ):
+        """Test that the stored hash is the one verification derives from the link."""
+        # Arrange
+        email = "test@example.com"
+
+        # Act
+        await service.request_magic_link(email)
+
+        # Assert
+        magic_link = service.send_magic_link.call_args.args[1]
+        token = magic_link.split("token=", 1)[1]
+        stored_hash = mock_token_repo.upsert.call_args.kwargs["token_hash"]
+        assert MagicLinkService._hash_token(token) == stored_hash
 
     async def test_request_magic_link_creates_email_hash(
         self,
@@ -213,7 +367,7 @@ class TestMagicLinkServiceRequestMagicLink:
         await service.request_magic_link(email)
 
         # Assert
-        call_kwargs = mock_token_repo.create.call_args.kwargs
+        call_kwargs = mock_token_repo.upsert.call_args.kwargs
         assert call_kwargs["email_hash"] == expected_email_hash
 
     @patch("app.modules.auth.services.magic_link_service.datetime")
@@ -233,7 +387,7 @@ class TestMagicLinkServiceRequestMagicLink:
         await service.request_magic_link(email)
 
         # Assert
-        call_kwargs = mock_token_repo.create.call_args.kwargs
+        call_kwargs = mock_token_repo.upsert.call_args.kwargs
         expected_expiration = now + timedelta(minutes=5)
         assert call_kwargs["expires_at"] == expected_expiration
 
@@ -248,6 +402,26 @@ class TestMagicLinkServiceRequestMagicLink:
         # Assert
         mock_db.commit.assert_called_once()
 
+    async def test_request_magic_link_sends_inline_when_backlog_full(
+        self,
+        service,
+    ):
+        """Test that the email is sent in-request once the send backlog is full."""
+        # Arrange
+        email = "test@example.com"
+
+        # Act
+        with patch(
+            "app.modules.auth.services.magic_link_service."
+            "_MAX_PENDING_MAGIC_LINK_SENDS",
+            0,
+        ):
+            await service.request_magic_link(email)
+
+        # Assert
+        service.send_magic_link.assert_awaited_once()
+        assert service.send_magic_link.call_args.args[0] == email
+
     async def test_request_magic_link_returns_correct_response(self, service):
         """Test that the response structure is correct."""
         # Arrange
@@ -277,8 +451,7 @@ class TestMagicLinkServiceVerifyMagicLink:
     def mock_token_repo(self):
         """Mock MagicLinkTokenRepository."""
         repo = AsyncMock()
-        repo.get_by_token_hash = AsyncMock()
-        repo.delete = AsyncMock()
+        repo.claim_by_token_hash = AsyncMock()
         return repo
 
     @pytest.fixture
@@ -298,26 +471,25 @@ class TestMagicLinkServiceVerifyMagicLink:
             token_repo=mock_token_repo,
         )
 
-    @pytest.fixture
-    def valid_token(self):
-        """Create a valid magic link token."""
-        return MagicLinkToken(
-            id=uuid.uuid4(),
-            token_hash="valid_token_hash",
-            email_hash="email_hash_123",
-            expires_at=datetime.now(timezone.utc) + timedelta(minutes=5),
-            created_at=datetime.now(timezone.utc),
-        )
-
     @pytest.fixture
     def existing_user(self):
         """Create an existing user."""
         return User(
             user_id=uuid.uuid4(),
-            email_hash="email_hash_123",
+            email_hash=b"email_hash_123",
             created_at=datetime.now(timezone.utc),
         )
 
+    @pytest.fixture
+    def valid_token(self, existing_user):
+        """Create a claimed, valid magic link token of an existing user."""
+        return SimpleNamespace(
+            id=uuid.uuid4(),
+            email_hash=existing_user.email_hash,
+            expires_at=datetime.now(timezone.utc) + timedelta(minutes=5),
+            user_id=existing_user.user_id,
+        )
+
     @patch("app.modules.auth.services.magic_link_service.create_jwt_token")
     async def test_verify_valid_token_existing_user(
         self,
@@ -331,8 +503,7 @@ class TestMagicLinkServiceVerifyMagicLink:
         """Test verification with valid token and existing user (login)."""
         # Arrange
         token_string = "valid_token"
-        mock_token_repo.get_by_token_hash.return_value = valid_token
-        mock_user_repo.get_by_email_hash.return_value = existing_user
+        mock_token_repo.claim_by_token_hash.return_value = valid_token
         mock_create_jwt.return_value = "jwt_token_123"
 
         # Act
@@ -342,7 +513,9 @@ class TestMagicLinkServiceVerifyMagicLink:
         assert isinstance(response, TokenResult)
         assert response.access_token == "jwt_token_123"
         assert response.token_type == "bearer"
-        mock_token_repo.delete.assert_called_once_with(valid_token.id)
+        mock_token_repo.claim_by_token_hash.assert_called_once_with(
+            MagicLinkService._hash_token(token_string),
+        )
         mock_user_repo.create.assert_not_called()  # User already exists
 
     async def test_verify_valid_token_missing_user_raises(
@@ -356,13 +529,15 @@ class TestMagicLinkServiceVerifyMagicLink:
         """Test verification fails when user does not exist."""
         # Arrange
         token_string = "valid_token"
-        mock_token_repo.get_by_token_hash.return_value = valid_token
-        mock_user_repo.get_by_email_hash.return_value = None
+        valid_token.user_id = None
+        mock_token_repo.claim_by_token_hash.return_value = valid_token
 
         # Act & Assert
         with pytest.raises(UserNotRegisteredError):
             await service.verify_magic_link(token_string)
-        mock_token_repo.delete.assert_called_once_with(valid_token.id)
+        mock_token_repo.claim_by_token_hash.assert_called_once_with(
+            MagicLinkService._hash_token(token_string),
+        )
         mock_user_repo.create.assert_not_called()
         mock_db.commit.assert_called_once()
 
@@ -379,8 +554,7 @@ class TestMagicLinkServiceVerifyMagicLink:
         """Test that JWT token is generated and returned."""
         # Arrange
         token_string = "valid_token"
-        mock_token_repo.get_by_token_hash.return_value = valid_token
-        mock_user_repo.get_by_email_hash.return_value = existing_user
+        mock_token_repo.claim_by_token_hash.return_value = valid_token
         mock_create_jwt.return_value = "generated_jwt_token"
 
         # Act
@@ -406,8 +580,7 @@ class TestMagicLinkServiceVerifyMagicLink:
         """Test that TokenResult is returned with correct structure."""
         # Arrange
         token_string = "valid_token"
-        mock_token_repo.get_by_token_hash.return_value = valid_token
-        mock_user_repo.get_by_email_hash.return_value = existing_user
+        mock_token_repo.claim_by_token_hash.return_value = valid_token
         mock_create_jwt.return_value = "jwt_token"
 
         # Act
@@ -421,30 +594,42 @@ class TestMagicLinkServiceVerifyMagicLink:
     async def test_verify_token_not_found(self, service, mock_token_repo):
         """Test that MagicLinkTokenInvalidError is raised when token not found."""
         # Arrange
-        token_string = "invalid_token"
-        mock_token_repo.get_by_token_hash.return_value = None
+        token_string = "unknown_token0"
+        mock_token_repo.claim_by_token_hash.return_value = None
+
+        # Act & Assert
+        with pytest.raises(MagicLinkTokenInvalidError):
+            await service.verify_magic_link(token_string)
+
+    async def test_verify_malformed_token(self, service, mock_token_repo):
+        """Test that a token that is not URL-safe base64 is rejected up front."""
+        # Arrange
+        token_string = "not a token!"
 
         # Act & Assert
         with pytest.raises(MagicLinkTokenInvalidError):
             await service.verify_magic_link(token_string)
+        mock_token_repo.claim_by_token_hash.assert_not_called()
 
     async def test_verify_token_expired(self, service, mock_token_repo, mock_db):
         """Test that MagicLinkTokenExpiredError is raised when token is expired."""
         # Arrange
-        token_string = "expired_token"
+        token_string = "expired_token0"
         expired_token = MagicLinkToken(
             id=uuid.uuid4(),
-            token_hash="expired_token_hash",
-            email_hash="email_hash",
+            token_hash=b"expired_token_hash",
+            email_hash=b"email_hash",
             expires_at=datetime.now(timezone.utc) - timedelta(minutes=1),  # Expired
             created_at=datetime.now(timezone.utc) - timedelta(minutes=6),
         )
-        mock_token_repo.get_by_token_hash.return_value = expired_token
+        mock_token_repo.claim_by_token_hash.return_value = expired_token
 
         # Act & Assert
         with pytest.raises(MagicLinkTokenExpiredError):
             await service.verify_magic_link(token_string)
-        mock_token_repo.delete.assert_called_once_with(expired_token.id)
+        mock_token_repo.claim_by_token_hash.assert_called_once_with(
+            MagicLinkService._hash_token(token_string),
+        )
 
     async def test_verify_expired_token_gets_deleted(
         self,
@@ -454,21 +639,23 @@ class TestMagicLinkServiceVerifyMagicLink:
     ):
         """Test that expired tokens are deleted from database."""
         # Arrange
-        token_string = "expired_token"
+        token_string = "expired_token0"
         expired_token = MagicLinkToken(
             id=uuid.uuid4(),
-            token_hash="expired_token_hash",
-            email_hash="email_hash",
+            token_hash=b"expired_token_hash",
+            email_hash=b"email_hash",
             expires_at=datetime.now(timezone.utc) - timedelta(minutes=1),
             created_at=datetime.now(timezone.utc) - timedelta(minutes=6),
         )
-        mock_token_repo.get_by_token_hash.return_value = expired_token
+        mock_token_repo.claim_by_token_hash.return_value = expired_token
 
         # Act & Assert
         with pytest.raises(MagicLinkTokenExpiredError):
             await service.verify_magic_link(token_string)
 
-        mock_token_repo.delete.assert_called_once_with(expired_token.id)
+        mock_token_repo.claim_by_token_hash.assert_called_once_with(
+            MagicLinkService._hash_token(token_string),
+        )
         mock_db.commit.assert_called_once()
 
     @patch("app.modules.auth.services.magic_link_service.create_jwt_token")
@@ -484,15 +671,16 @@ class TestMagicLinkServiceVerifyMagicLink:
         """Test that token is deleted after successful verification (single-use)."""
         # Arrange
         token_string = "valid_token"
-        mock_token_repo.get_by_token_hash.return_value = valid_token
-        mock_user_repo.get_by_email_hash.return_value = existing_user
+        mock_token_repo.claim_by_token_hash.return_value = valid_token
         mock_create_jwt.return_value = "jwt_token"
 
         # Act
         await service.verify_magic_link(token_string)
 
         # Assert
-        mock_token_repo.delete.assert_called_once_with(valid_token.id)
+        mock_token_repo.claim_by_token_hash.assert_called_once_with(
+            MagicLinkService._hash_token(token_string),
+        )
 
     @patch("app.modules.auth.services.magic_link_service.create_jwt_token")
     async def test_verify_commits_transaction(
@@ -508,8 +696,7 @@ class TestMagicLinkServiceVerifyMagicLink:
         """Test that db.commit() is called."""
         # Arrange
         token_string = "valid_token"
-        mock_token_repo.get_by_token_hash.return_value = valid_token
-        mock_user_repo.get_by_email_hash.return_value = existing_user
+        mock_token_repo.claim_by_token_hash.return_value = valid_token
         mock_create_jwt.return_value = "jwt_token"
 
         # Act
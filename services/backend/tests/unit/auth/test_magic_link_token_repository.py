@@ -6,7 +6,7 @@ from datetime import datetime, timedelta
 import pytest
 from sqlalchemy.exc import IntegrityError
 
-from app.modules.auth.models import MagicLinkToken
+from app.modules.auth.models import MagicLinkToken, User
 from app.modules.auth.repositories.magic_link_token_repository import (
     MagicLinkTokenRepository,
 )
@@ -26,8 +26,8 @@ class TestMagicLinkTokenRepository:
     async def test_create_token_success(self, repository, db_session):
         """Test successful creation of a magic link token."""
         # Arrange
-        token_hash = "abc123hash"
-        email_hash = "xyz789hash"
+        token_hash = b"abc123hash"
+        email_hash = b"xyz789hash"
         expires_at = datetime.now() + timedelta(minutes=5)
 
         # Act
@@ -46,18 +46,16 @@ class TestMagicLinkTokenRepository:
         assert token.expires_at == expires_at
         assert isinstance(token.created_at, datetime)
 
-    async def test_create_token_duplicate_token_hash(self, repository, db_session):
-        """Test that creating a token with duplicate token_hash raises IntegrityError."""
+    async def test_create_token_duplicate_email_hash(self, repository, db_session):
+        """Test that creating a token with duplicate email_hash raises IntegrityError."""
         # Arrange
-        token_hash = "duplicate_hash"
-        email_hash_1 = "email1_hash"
-        email_hash_2 = "email2_hash"
+        email_hash = b"duplicate_email_hash"
         expires_at = datetime.now() + timedelta(minutes=5)
 
         # Create first token
         await repository.create(
-            token_hash=token_hash,
-            email_hash=email_hash_1,
+            token_hash=b"token1_hash",
+            email_hash=email_hash,
             expires_at=expires_at,
         )
         await db_session.commit()
@@ -65,8 +63,8 @@ class TestMagicLinkTokenRepository:
         # Act & Assert
         with pytest.raises(IntegrityError):
             await repository.create(
-                token_hash=token_hash,  # Same token_hash
-                email_hash=email_hash_2,
+                token_hash=b"token2_hash",
+                email_hash=email_hash,  # Same email_hash
                 expires_at=expires_at,
             )
             await db_session.commit()
@@ -74,8 +72,8 @@ class TestMagicLinkTokenRepository:
     async def test_get_by_token_hash_exists(self, repository, db_session):
         """Test retrieving a token by token_hash when it exists."""
         # Arrange
-        token_hash = "find_me_hash"
-        email_hash = "email_hash"
+        token_hash = b"find_me_hash"
+        email_hash = b"email_hash"
         expires_at = datetime.now() + timedelta(minutes=5)
 
         created_token = await repository.create(
@@ -97,7 +95,7 @@ class TestMagicLinkTokenRepository:
     async def test_get_by_token_hash_not_found(self, repository):
         """Test that get_by_token_hash returns None when token doesn't exist."""
         # Act
-        found_token = await repository.get_by_token_hash("nonexistent_hash")
+        found_token = await repository.get_by_token_hash(b"nonexistent_hash")
 
         # Assert
         assert found_token is None
@@ -105,8 +103,8 @@ class TestMagicLinkTokenRepository:
     async def test_delete_token_success(self, repository, db_session):
         """Test successful deletion of a token."""
         # Arrange
-        token_hash = "delete_me_hash"
-        email_hash = "email_hash"
+        token_hash = b"delete_me_hash"
+        email_hash = b"email_hash"
         expires_at = datetime.now() + timedelta(minutes=5)
 
         created_token = await repository.create(
@@ -137,3 +135,138 @@ class TestMagicLinkTokenRepository:
 
         # Assert
         assert result is False
+
+    async def test_claim_by_token_hash_deletes_and_returns_token(
+        self,
+        repository,
+        db_session,
+    ):
+        """Test that claiming a token deletes it and returns its data."""
+        # Arrange
+        token_hash = b"claim_me_hash"
+        email_hash = b"email_hash"
+        expires_at = datetime.now() + timedelta(minutes=5)
+
+        created_token = await repository.create(
+            token_hash=token_hash,
+            email_hash=email_hash,
+            expires_at=expires_at,
+        )
+        await db_session.commit()
+
+        # Act
+        claimed = await repository.claim_by_token_hash(token_hash)
+        await db_session.commit()
+
+        # Assert
+        assert claimed is not None
+        assert claimed.id == created_token.id
+        assert claimed.email_hash == email_hash
+        assert claimed.user_id is None  # No user registered for the email
+        assert await repository.claim_by_token_hash(token_hash) is None
+
+    async def test_claim_by_token_hash_resolves_user(self, repository, db_session):
+        """Test that claiming a token returns the id of the owning user."""
+        # Arrange
+        email_hash = b"registered_email_hash"
+        user = User(email_hash=email_hash)
+        db_session.add(user)
+        await repository.create(
+            token_hash=b"user_token_hash",
+            email_hash=email_hash,
+            expires_at=datetime.now() + timedelta(minutes=5),
+        )
+        await db_session.commit()
+
+        # Act
+        claimed = await repository.claim_by_token_hash(b"user_token_hash")
+
+        # Assert
+        assert claimed is not None
+        assert claimed.user_id == user.user_id
+
+    async def test_claim_by_token_hash_not_found(self, repository):
+        """Test that claiming a non-existent token returns None."""
+        # Act
+        claimed = await repository.claim_by_token_hash(b"nonexistent_hash")
+
+        # Assert
+        assert claimed is None
+
+    async def test_delete_by_email_hash(self, repository, db_session):
+        """Test deleting a token by email hash."""
+        # Arrange
+        email_hash = b"email_hash"
+        await repository.create(
+            token_hash=b"token_hash",
+            email_hash=email_hash,
+            expires_at=datetime.now() + timedelta(minutes=5),
+        )
+        await db_session.commit()
+
+        # Act
+        deleted = await repository.delete_by_email_hash(email_hash)
+        deleted_again = await repository.delete_by_email_hash(email_hash)
+
+        # Assert
+        assert deleted is True
+        assert deleted_again is False
+
+    async def test_delete_expired_only_removes_expired_tokens(
+        self,
+        repository,
+        db_session,
+    ):
+        """Test that delete_expired keeps tokens that are still valid."""
+        # Arrange
+        now = datetime.now()
+        await repository.create(
+            token_hash=b"expired_hash",
+            email_hash=b"expired_email_hash",
+            expires_at=now - timedelta(minutes=1),
+        )
+        await repository.create(
+            token_hash=b"valid_hash",
+            email_hash=b"valid_email_hash",
+            expires_at=now + timedelta(minutes=5),
+        )
+        await db_session.commit()
+
+        # Act
+        deleted = await repository.delete_expired(now)
+        await db_session.commit()
+
+        # Assert
+        assert deleted == 1
+        assert await repository.get_by_token_hash(b"expired_hash") is None
+        assert await repository.get_by_token_hash(b"valid_hash") is not None
+
+    async def test_upsert_replaces_existing_token_for_email(
+        self,
+        repository,
+        db_session,
+    ):
+        """Test that upsert swaps the token of an email that already has one."""
+        # Arrange
+        email_hash = b"email_hash"
+        expires_at = datetime.now() + timedelta(minutes=5)
+        await repository.upsert(
+            token_hash=b"old_token_hash",
+            email_hash=email_hash,
+            expires_at=expires_at,
+        )
+        await db_session.commit()
+
+        # Act
+        await repository.upsert(
+            token_hash=b"new_token_hash",
+            email_hash=email_hash,
+            expires_at=expires_at,
+        )
+        await db_session.commit()
+
+        # Assert
+        assert await repository.get_by_token_hash(b"old_token_hash") is None
+        new_token = await repository.get_by_token_hash(b"new_token_hash")
+        assert new_token is not None
+        assert new_token.email_hash == email_hash
@@ -23,7 +23,7 @@ class TestUserRepository:
     async def test_create_user_success(self, repository, db_session):
         """Test successful creation of a user."""
         # Arrange
-        email_hash = "user_email_hash_123"
+        email_hash = b"user_email_hash_123"
 
         # Act
         user = await repository.create(email_hash=email_hash)
@@ -38,7 +38,7 @@ class TestUserRepository:
     async def test_create_user_duplicate_email_hash(self, repository, db_session):
         """Test that creating a user with duplicate email_hash raises IntegrityError."""
         # Arrange
-        email_hash = "duplicate_email_hash"
+        email_hash = b"duplicate_email_hash"
 
         # Create first user
         await repository.create(email_hash=email_hash)
@@ -52,7 +52,7 @@ class TestUserRepository:
     async def test_get_by_id_exists(self, repository, db_session):
         """Test retrieving a user by ID when it exists."""
         # Arrange
-        email_hash = "test_email_hash"
+        email_hash = b"test_email_hash"
         created_user = await repository.create(email_hash=email_hash)
         await db_session.commit()
 
@@ -78,7 +78,7 @@ class TestUserRepository:
     async def test_get_by_email_hash_exists(self, repository, db_session):
         """Test retrieving a user by email_hash when it exists."""
         # Arrange
-        email_hash = "find_by_email_hash"
+        email_hash = b"find_by_email_hash"
         created_user = await repository.create(email_hash=email_hash)
         await db_session.commit()
 
@@ -93,7 +93,7 @@ class TestUserRepository:
     async def test_get_by_email_hash_not_found(self, repository):
         """Test that get_by_email_hash returns None when user doesn't exist."""
         # Act
-        found_user = await repository.get_by_email_hash("nonexistent_email_hash")
+        found_user = await repository.get_by_email_hash(b"nonexistent_email_hash")
 
         # Assert
         assert found_user is None
@@ -101,7 +101,7 @@ class TestUserRepository:
     async def test_exists_by_email_hash_true(self, repository, db_session):
         """Test that exists_by_email_hash returns True when user exists."""
         # Arrange
-        email_hash = "existing_user_hash"
+        email_hash = b"existing_user_hash"
         await repository.create(email_hash=email_hash)
         await db_session.commit()
 
@@ -114,7 +114,7 @@ class TestUserRepository:
     async def test_exists_by_email_hash_false(self, repository):
         """Test that exists_by_email_hash returns False when user doesn't exist."""
         # Act
-        exists = await repository.exists_by_email_hash("nonexistent_hash")
+        exists = await repository.exists_by_email_hash(b"nonexistent_hash")
 
         # Assert
         assert exists is False
@@ -122,7 +122,7 @@ class TestUserRepository:
     async def test_delete_user_success(self, repository, db_session):
         """Test successful deletion of a user."""
         # Arrange
-        email_hash = "delete_me_hash"
+        email_hash = b"delete_me_hash"
         created_user = await repository.create(email_hash=email_hash)
         await db_session.commit()
 
@@ -147,3 +147,31 @@ class TestUserRepository:
 
         # Assert
         assert result is False
+
+    async def test_create_if_absent_creates_new_user(self, repository, db_session):
+        """Test that create_if_absent inserts a user for an unknown hash."""
+        # Arrange
+        email_hash = b"new_user_hash"
+
+        # Act
+        created = await repository.create_if_absent(email_hash)
+        await db_session.commit()
+
+        # Assert
+        assert created is True
+        assert await repository.get_by_email_hash(email_hash) is not None
+
+    async def test_create_if_absent_existing_user(self, repository, db_session):
+        """Test that create_if_absent leaves an existing user untouched."""
+        # Arrange
+        email_hash = b"existing_hash"
+        existing_user = await repository.create(email_hash=email_hash)
+        await db_session.commit()
+
+        # Act
+        created = await repository.create_if_absent(email_hash)
+
+        # Assert
+        assert created is False
+        found_user = await repository.get_by_email_hash(email_hash)
+        assert found_user.user_id == existing_user.user_id
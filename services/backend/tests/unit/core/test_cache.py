@@ -0,0 +1,56 @@
+"""Unit tests for TTLCache."""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.core.cache import TTLCache
+
+
+pytestmark = pytest.mark.unit
+
+
+class TestTTLCache:
+    """Test suite for TTLCache."""
+
+    def test_get_returns_stored_value(self):
+        """Test that a stored value is returned before it expires."""
+        # Arrange
+        cache = TTLCache(ttl_seconds=60, max_size=10)
+
+        # Act
+        cache.set("key", "value")
+
+        # Assert
+        assert cache.get("key") == "value"
+        assert cache.get("missing") is None
+
+    def test_entry_expires_after_ttl(self):
+        """Test that entries are dropped once their TTL has passed."""
+        # Arrange
+        cache = TTLCache(ttl_seconds=60, max_size=10)
+        with patch("app.core.cache.time.monotonic", return_value=100.0):
+            cache.set("key", "value")
+
+        # Act
+        with patch("app.core.cache.time.monotonic", return_value=161.0):
+            value = cache.get("key")
+
+        # Assert
+        assert value is None
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test that the size bound evicts the least recently used entry."""
+        # Arrange
+        cache = TTLCache(ttl_seconds=60, max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+
+        # Act
+        cache.set("c", 3)
+
+        # Assert
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
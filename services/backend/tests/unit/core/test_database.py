@@ -0,0 +1,159 @@
+"""Unit tests for the database session manager."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import event, text
+
+from app.core import database
+from app.core.database import DatabaseSessionManager
+
+
+pytestmark = pytest.mark.unit
+
+
+class TestSqlitePragmas:
+    """Test suite for SQLite connection tuning."""
+
+    async def test_new_connections_use_wal(self, tmp_path):
+        """Test that SQLite connections are opened in WAL mode."""
+        # Arrange
+        manager = DatabaseSessionManager(
+            f"sqlite+aiosqlite:///{tmp_path / 'app.db'}",
+        )
+
+        # Act
+        async with manager.connect() as connection:
+            journal_mode = await connection.scalar(text("PRAGMA journal_mode"))
+            synchronous = await connection.scalar(text("PRAGMA synchronous"))
+        await manager.close()
+
+        # Assert
+        assert journal_mode == "wal"
+        assert synchronous == 1  # NORMAL
+
+    @pytest.mark.parametrize(
+        ("read_only", "expected"),
+        [(False, True), (True, False)],
+    )
+    async def test_write_transactions_begin_immediate(
+        self,
+        tmp_path,
+        read_only,
+        expected,
+    ):
+        """Test that only the write engine starts transactions IMMEDIATE."""
+        # Arrange
+        manager = DatabaseSessionManager(
+            f"sqlite+aiosqlite:///{tmp_path / 'app.db'}",
+            read_only=read_only,
+        )
+        statements: list[str] = []
+        event.listen(
+            manager._engine.sync_engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+
+        # Act
+        async with manager.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+        await manager.close()
+
+        # Assert
+        assert ("BEGIN IMMEDIATE" in statements) is expected
+
+    @pytest.mark.parametrize(
+        ("write_session", "expected_begin"),
+        [(True, "BEGIN IMMEDIATE"), (False, "BEGIN")],
+    )
+    async def test_only_write_sessions_begin_immediate(
+        self,
+        tmp_path,
+        write_session,
+        expected_begin,
+    ):
+        """Test that plain sessions begin deferred and skip the write lock."""
+        # Arrange
+        manager = DatabaseSessionManager(
+            f"sqlite+aiosqlite:///{tmp_path / 'app.db'}",
+        )
+        statements: list[str] = []
+        event.listen(
+            manager._engine.sync_engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+        session = (
+            manager.new_write_session() if write_session else manager.new_session()
+        )
+
+        # Act
+        async with session:
+            await session.execute(text("SELECT 1"))
+        await manager.close()
+
+        # Assert
+        assert statements[0] == expected_begin
+
+
+class TestGetReadDbSession:
+    """Test suite for the read-only session dependency."""
+
+    async def test_falls_back_to_primary_engine(self, monkeypatch):
+        """Test that reads use a primary read session without a read URL."""
+        # Arrange
+        session = AsyncMock()
+        primary = MagicMock()
+        primary.new_session.return_value = session
+        monkeypatch.setattr(database, "read_sessionmanager", None)
+        monkeypatch.setattr(database, "sessionmanager", primary)
+
+        # Act
+        dependency = database.get_read_db_session()
+        yielded = await anext(dependency)
+        await dependency.aclose()
+
+        # Assert
+        assert yielded is session
+        session.close.assert_awaited_once()
+
+    async def test_uses_read_engine_when_configured(self, monkeypatch):
+        """Test that reads use the read engine when one is configured."""
+        # Arrange
+        session = AsyncMock()
+        replica = MagicMock()
+        replica.new_session.return_value = session
+        monkeypatch.setattr(database, "read_sessionmanager", replica)
+        monkeypatch.setattr(database, "sessionmanager", MagicMock())
+
+        # Act
+        dependency = database.get_read_db_session()
+        yielded = await anext(dependency)
+        await dependency.aclose()
+
+        # Assert
+        assert yielded is session
+        database.sessionmanager.new_session.assert_not_called()
+
+
+class TestGetWriteDbSession:
+    """Test suite for the read-then-write session dependency."""
+
+    async def test_uses_write_session(self, monkeypatch):
+        """Test that the dependency yields a write session and closes it."""
+        # Arrange
+        session = AsyncMock()
+        primary = MagicMock()
+        primary.new_write_session.return_value = session
+        monkeypatch.setattr(database, "sessionmanager", primary)
+
+        # Act
+        dependency = database.get_write_db_session()
+        yielded = await anext(dependency)
+        await dependency.aclose()
+
+        # Assert
+        assert yielded is session
+        primary.new_session.assert_not_called()
+        session.close.assert_awaited_once()
@@ -0,0 +1,119 @@
+"""Unit tests for MailService (SMTP connection reuse)."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiosmtplib
+import pytest
+
+from app.core.email import MailService
+
+
+pytestmark = pytest.mark.unit
+
+
+def _make_client() -> MagicMock:
+    client = MagicMock()
+    client.is_connected = False
+
+    async def _connect():
+        client.is_connected = True
+
+    client.connect = AsyncMock(side_effect=_connect)
+    client.send_message = AsyncMock()
+    client.quit = AsyncMock()
+    return client
+
+
+@pytest.fixture
+def mailer() -> MailService:
+    return MailService(
+        host="localhost",
+        port=587,
+        username="user@example.com",
+        password="secret",
+        use_tls=True,
+        sender="noreply@example.com",
+    )
+
+
+class TestMailServiceSend:
+    """Test suite for MailService.send connection handling."""
+
+    async def test_send_reuses_connection(self, mailer):
+        """Test that consecutive sends share one SMTP connection."""
+        # Arrange
+        client = _make_client()
+
+        # Act
+        with patch("app.core.email.aiosmtplib.SMTP", return_value=client) as smtp:
+            await mailer.send("a@example.com", "Subject", "<p>one</p>")
+            await mailer.send("b@example.com", "Subject", "<p>two</p>")
+
+        # Assert
+        smtp.assert_called_once()
+        client.connect.assert_awaited_once()
+        assert client.send_message.await_count == 2
+
+    async def test_send_reconnects_after_disconnect(self, mailer):
+        """Test that a dropped connection is re-established and the send retried."""
+        # Arrange
+        stale = _make_client()
+        stale.send_message.side_effect = aiosmtplib.SMTPServerDisconnected("gone")
+        fresh = _make_client()
+
+        # Act
+        with patch("app.core.email.aiosmtplib.SMTP", side_effect=[stale, fresh]):
+            await mailer.send("a@example.com", "Subject", "<p>hi</p>")
+
+        # Assert
+        fresh.send_message.assert_awaited_once()
+        assert mailer._client is fresh
+
+    async def test_close_quits_connection(self, mailer):
+        """Test that close() quits the pooled connection."""
+        # Arrange
+        client = _make_client()
+        with patch("app.core.email.aiosmtplib.SMTP", return_value=client):
+            await mailer.send("a@example.com", "Subject", "<p>hi</p>")
+
+        # Act
+        await mailer.close()
+
+        # Assert
+        client.quit.assert_awaited_once()
+        assert mailer._client is None
+
+
+class TestBuildMagicLinkEmail:
+    """Test suite for MailService.build_magic_link_email."""
+
+    def test_link_is_rendered_in_both_bodies(self, mailer):
+        """Test that the magic link appears in the HTML and text bodies."""
+        # Arrange
+        link = "http://localhost:3000/auth/verify?token=abc"
+
+        # Act
+        subject, html_body, text_body = mailer.build_magic_link_email(
+            "user@example.com",
+            link,
+        )
+
+        # Assert
+        assert subject == "Ihr Login-Link"
+        assert f'href="{link}"' in html_body
+        assert link in text_body
+
+    def test_link_is_html_escaped(self, mailer):
+        """Test that the link is escaped inside the HTML attribute."""
+        # Arrange
+        link = 'http://localhost/verify?token=a&b="c"'
+
+        # Act
+        _, html_body, text_body = mailer.build_magic_link_email(
+            "user@example.com",
+            link,
+        )
+
+        # Assert
+        assert 'href="http://localhost/verify?token=a&amp;b=&quot;c&quot;"' in html_body
+        assert link in text_body
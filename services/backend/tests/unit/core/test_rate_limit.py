@@ -0,0 +1,40 @@
+"""Unit tests for SlidingWindowRateLimiter."""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.core.rate_limit import SlidingWindowRateLimiter
+
+
+pytestmark = pytest.mark.unit
+
+
+class TestSlidingWindowRateLimiter:
+    """Test suite for SlidingWindowRateLimiter."""
+
+    def test_hits_beyond_limit_are_rejected(self):
+        """Test that a key is throttled once it reaches the limit."""
+        # Arrange
+        limiter = SlidingWindowRateLimiter(max_hits=2, window_seconds=60)
+
+        # Act
+        results = [limiter.hit("key") for _ in range(3)]
+
+        # Assert
+        assert results == [True, True, False]
+        assert limiter.hit("other") is True
+
+    def test_hits_are_allowed_again_after_window(self):
+        """Test that hits older than the window no longer count."""
+        # Arrange
+        limiter = SlidingWindowRateLimiter(max_hits=1, window_seconds=60)
+        with patch("app.core.rate_limit.time.monotonic", return_value=100.0):
+            limiter.hit("key")
+
+        # Act
+        with patch("app.core.rate_limit.time.monotonic", return_value=161.0):
+            allowed = limiter.hit("key")
+
+        # Assert
+        assert allowed is True
@@ -5,7 +5,7 @@ from datetime import datetime, timedelta, timezone
 
 import pytest
 from freezegun import freeze_time
-from jose import JWTError, jwt
+import jwt
 
 from app.core.security import create_jwt_token, verify_jwt_token
 from app.shared.schemas import TokenPayload
@@ -139,7 +139,7 @@ class TestVerifyJwtToken:
         assert result.user_id == user_id
 
     def test_verify_expired_token_raises_error(self):
-        """Test that JWTError is raised for expired token."""
+        """Test that PyJWTError is raised for expired token."""
         # Arrange
         user_id = uuid.uuid4()
         payload = TokenPayload(user_id=user_id)
@@ -150,11 +150,11 @@ class TestVerifyJwtToken:
 
         # Act & Assert (6 hours later - token should be expired)
         with freeze_time("2024-01-01 18:01:00", tz_offset=0):
-            with pytest.raises(JWTError):
+            with pytest.raises(jwt.PyJWTError):
                 verify_jwt_token(token)
 
     def test_verify_invalid_signature_raises_error(self):
-        """Test that JWTError is raised when signature is invalid."""
+        """Test that PyJWTError is raised when signature is invalid."""
         # Arrange
         user_id = uuid.uuid4()
         payload = TokenPayload(user_id=user_id)
@@ -167,29 +167,29 @@ class TestVerifyJwtToken:
         tampered_token = token[:-2] + ("X" if token[-2] != "X" else "Y") + token[-1]
 
         # Act & Assert
-        with pytest.raises(JWTError):
+        with pytest.raises(jwt.PyJWTError):
             verify_jwt_token(tampered_token)
 
     def test_verify_malformed_token_raises_error(self):
-        """Test that JWTError is raised for malformed token."""
+        """Test that PyJWTError is raised for malformed token."""
         # Arrange
         malformed_token = "this.is.not.a.valid.jwt"
 
         # Act & Assert
-        with pytest.raises(JWTError):
+        with pytest.raises(jwt.PyJWTError):
             verify_jwt_token(malformed_token)
 
     def test_verify_empty_token_raises_error(self):
-        """Test that JWTError is raised for empty token."""
+        """Test that PyJWTError is raised for empty token."""
         # Arrange
         empty_token = ""
 
         # Act & Assert
-        with pytest.raises(JWTError):
+        with pytest.raises(jwt.PyJWTError):
             verify_jwt_token(empty_token)
 
     def test_verify_token_with_wrong_algorithm(self):
-        """Test that JWTError is raised when token uses wrong algorithm."""
+        """Test that PyJWTError is raised when token uses wrong algorithm."""
         # Arrange
         from app.core.config import get_settings
 
@@ -208,7 +208,7 @@ class TestVerifyJwtToken:
         )
 
         # Act & Assert
-        with pytest.raises(JWTError):
+        with pytest.raises(jwt.PyJWTError):
             verify_jwt_token(wrong_algo_token)
 
     def test_verify_token_missing_user_id_raises_error(self):
@@ -1,9 +1,10 @@
 """Tests for AnswerRepository."""
 
 import uuid
-from decimal import Decimal
+from unittest.mock import AsyncMock, patch
 
 import pytest
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.modules.learning.models import (
@@ -15,7 +16,10 @@ from app.modules.learning.models import (
     AnswerType,
 )
 from app.modules.learning.repositories.attempt_repository import AttemptRepository
-from app.modules.learning.exceptions import AnswerTypeMismatchException
+from app.modules.learning.exceptions import (
+    AnswerNotFoundException,
+    AnswerTypeMismatchException,
+)
 from app.modules.learning.repositories.answer_repository import AnswerRepository
 
 
@@ -51,6 +55,16 @@ class TestAnswerRepository:
         """Create a task ID for testing."""
         return uuid.uuid4()
 
+    def test_repositories_have_no_instance_dict(
+        self,
+        repository: AnswerRepository,
+        attempt_repo: AttemptRepository,
+    ):
+        """Test that repositories keep their session in a slot."""
+        # Act & Assert
+        assert not hasattr(repository, "__dict__")
+        assert not hasattr(attempt_repo, "__dict__")
+
     # ==================== Multiple Choice Tests ====================
 
     async def test_upsert_multiple_choice_create(
@@ -80,6 +94,103 @@ class TestAnswerRepository:
         selection_option_ids = {s.option_id for s in answer.selections}
         assert selection_option_ids == set(option_ids)
 
+    async def test_insert_answer_skips_existing_answer(
+        self,
+        repository: AnswerRepository,
+        sample_attempt: Attempt,
+        task_id: uuid.UUID,
+        db_session: AsyncSession,
+    ):
+        """Test that inserting an answer that already exists is a no-op."""
+        # Arrange
+        await repository.upsert_free_text(sample_attempt.attempt_id, task_id, "hi")
+        await db_session.commit()
+
+        # Act
+        created = await repository._insert_answer(
+            sample_attempt.attempt_id,
+            task_id,
+            AnswerType.FREE_TEXT,
+        )
+
+        # Assert
+        assert created is None
+        found = await repository.get_by_attempt_task(
+            sample_attempt.attempt_id,
+            task_id,
+        )
+        assert found.text_response == "hi"
+
+    async def test_upsert_retries_insert_when_conflicting_answer_vanishes(
+        self,
+        repository: AnswerRepository,
+        sample_attempt: Attempt,
+        task_id: uuid.UUID,
+    ):
+        """Test that an answer deleted between conflict and read is re-inserted."""
+        # Arrange - First insert reports a conflict whose row is already gone
+        real_insert = AnswerRepository._insert_answer
+        calls = []
+
+        async def conflicting_insert(self, *args):
+            calls.append(args)
+            if len(calls) == 1:
+                return None
+            return await real_insert(self, *args)
+
+        # Act
+        with patch.object(AnswerRepository, "_insert_answer", conflicting_insert):
+            answer = await repository.upsert_free_text(
+                sample_attempt.attempt_id,
+                task_id,
+                "retried",
+            )
+
+        # Assert
+        assert len(calls) == 2
+        assert answer.text_response == "retried"
+
+    async def test_upsert_raises_not_found_when_answer_keeps_vanishing(
+        self,
+        repository: AnswerRepository,
+        sample_attempt: Attempt,
+        task_id: uuid.UUID,
+    ):
+        """Test that repeated conflicts without a readable row raise not found."""
+        # Arrange
+        always_conflict = AsyncMock(return_value=None)
+
+        # Act & Assert
+        with patch.object(AnswerRepository, "_insert_answer", always_conflict):
+            with pytest.raises(AnswerNotFoundException):
+                await repository.upsert_free_text(
+                    sample_attempt.attempt_id,
+                    task_id,
+                    "lost",
+                )
+
+    async def test_insert_answer_returns_persistent_instance(
+        self,
+        repository: AnswerRepository,
+        sample_attempt: Attempt,
+        task_id: uuid.UUID,
+        db_session: AsyncSession,
+    ):
+        """Test that a new answer is usable without loading it back."""
+        # Act
+        created = await repository._insert_answer(
+            sample_attempt.attempt_id,
+            task_id,
+            AnswerType.CLOZE,
+        )
+
+        # Assert
+        assert isinstance(created, ClozeAnswer)
+        assert created in db_session
+        assert created not in db_session.dirty
+        assert created.items == []
+        assert created.percentage_correct is None
+
     async def test_upsert_multiple_choice_update(
         self,
         repository: AnswerRepository,
@@ -111,6 +222,40 @@ class TestAnswerRepository:
         selection_ids = {s.option_id for s in answer.selections}
         assert selection_ids == {opt2, opt3}
 
+    async def test_upsert_multiple_choice_does_not_reload_selections(
+        self,
+        repository: AnswerRepository,
+        sample_attempt: Attempt,
+        task_id: uuid.UUID,
+        db_session: AsyncSession,
+    ):
+        """Test that the returned selections come without a trailing SELECT."""
+        # Arrange
+        opt1, opt2, opt3 = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        await repository.upsert_multiple_choice(
+            sample_attempt.attempt_id,
+            task_id,
+            [opt1, opt2],
+        )
+        await db_session.commit()
+        statements: list[str] = []
+        event.listen(
+            db_session.bind.sync_engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+
+        # Act
+        answer = await repository.upsert_multiple_choice(
+            sample_attempt.attempt_id,
+            task_id,
+            [opt2, opt3],
+        )
+
+        # Assert
+        assert statements[-1].lstrip().startswith("INSERT")
+        assert {s.option_id for s in answer.selections} == {opt2, opt3}
+
     async def test_upsert_multiple_choice_remove_all(
         self,
         repository: AnswerRepository,
@@ -253,12 +398,14 @@ class TestAnswerRepository:
         await db_session.commit()
 
         # Act & Assert
-        with pytest.raises(AnswerTypeMismatchException):
+        with pytest.raises(AnswerTypeMismatchException) as exc_info:
             await repository.upsert_free_text(
                 sample_attempt.attempt_id,
                 task_id,
                 "text",
             )
+        assert exc_info.value.expected == "free_text"
+        assert exc_info.value.got == "multiple_choice"
 
     # ==================== Cloze Tests ====================
 
@@ -447,6 +594,39 @@ class TestAnswerRepository:
         assert isinstance(found, FreeTextAnswer)
         assert found.task_id == task_id
 
+    async def test_get_by_attempt_task_loads_collection_in_one_select(
+        self,
+        repository: AnswerRepository,
+        sample_attempt: Attempt,
+        task_id: uuid.UUID,
+        db_session: AsyncSession,
+    ):
+        """Test that a single answer and its selections take one query."""
+        # Arrange
+        option_ids = [uuid.uuid4(), uuid.uuid4()]
+        await repository.upsert_multiple_choice(
+            sample_attempt.attempt_id,
+            task_id,
+            option_ids,
+        )
+        await db_session.commit()
+        statements: list[str] = []
+        event.listen(
+            db_session.bind.sync_engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+
+        # Act
+        found = await repository.get_by_attempt_task(
+            sample_attempt.attempt_id,
+            task_id,
+        )
+
+        # Assert
+        assert len(statements) == 1
+        assert {s.option_id for s in found.selections} == set(option_ids)
+
     async def test_get_by_attempt_task_not_found(
         self,
         repository: AnswerRepository,
@@ -624,7 +804,7 @@ class TestAnswerRepository:
             sample_attempt.attempt_id,
             task_id,
         )
-        assert answer.percentage_correct == Decimal("100.0")
+        assert answer.percentage_correct == 10_000
 
     async def test_set_free_text_correctness_incorrect(
         self,
@@ -655,26 +835,37 @@ class TestAnswerRepository:
             sample_attempt.attempt_id,
             task_id,
         )
-        assert answer.percentage_correct == Decimal("0.0")
+        assert answer.percentage_correct == 0
 
-    async def test_set_answer_percentage(
+    async def test_set_answer_percentages(
         self,
         repository: AnswerRepository,
         sample_attempt: Attempt,
         task_id: uuid.UUID,
         db_session: AsyncSession,
     ):
-        """Test setting answer percentage."""
+        """Test setting percentages on answers of different types."""
         # Arrange
-        answer = await repository.upsert_free_text(
+        other_task_id = uuid.uuid4()
+        free_text = await repository.upsert_free_text(
             sample_attempt.attempt_id,
             task_id,
             "Test",
         )
+        cloze = await repository.upsert_cloze(
+            sample_attempt.attempt_id,
+            other_task_id,
+            [{"blank_id": uuid.uuid4(), "value": "x"}],
+        )
         await db_session.commit()
 
         # Act
-        await repository.set_answer_percentage(answer.answer_id, Decimal("75.5"))
+        await repository.set_answer_percentages(
+            [
+                (free_text.answer_id, 7550),
+                (cloze.answer_id, 0),
+            ],
+        )
         await db_session.commit()
 
         # Assert
@@ -682,9 +873,14 @@ class TestAnswerRepository:
             sample_attempt.attempt_id,
             task_id,
         )
-        assert found.percentage_correct == Decimal("75.5")
+        assert found.percentage_correct == 7550
+        found = await repository.get_by_attempt_task(
+            sample_attempt.attempt_id,
+            other_task_id,
+        )
+        assert found.percentage_correct == 0
 
-    async def test_set_cloze_item_correct(
+    async def test_set_cloze_items_correct(
         self,
         repository: AnswerRepository,
         sample_attempt: Attempt,
@@ -693,20 +889,23 @@ class TestAnswerRepository:
     ):
         """Test setting cloze item correctness."""
         # Arrange
-        blank1, blank2 = uuid.uuid4(), uuid.uuid4()
+        blank1, blank2, blank3 = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
         answer = await repository.upsert_cloze(
             sample_attempt.attempt_id,
             task_id,
             [
                 {"blank_id": blank1, "value": "correct"},
                 {"blank_id": blank2, "value": "wrong"},
+                {"blank_id": blank3, "value": "ungraded"},
             ],
         )
         await db_session.commit()
 
         # Act
-        await repository.set_cloze_item_correct(answer.answer_id, blank1, True)
-        await repository.set_cloze_item_correct(answer.answer_id, blank2, False)
+        await repository.set_cloze_items_correct(
+            answer.answer_id,
+            [(blank1, True), (blank2, False)],
+        )
         await db_session.commit()
 
         # Assert
@@ -717,3 +916,4 @@ class TestAnswerRepository:
         items_by_blank = {item.blank_id: item for item in found.items}
         assert items_by_blank[blank1].is_correct is True
         assert items_by_blank[blank2].is_correct is False
+        assert items_by_blank[blank3].is_correct is None
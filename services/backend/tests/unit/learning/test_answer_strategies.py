@@ -23,6 +23,8 @@ from app.modules.learning.schemas.answer import (
     ExistingFreeTextAnswer,
     ExistingClozeAnswer,
 )
+from app.modules.learning.mappers import answers_to_dtos
+from app.modules.learning.strategies import answer_mapping_registry
 from app.modules.learning.strategies.answer_mapping_strategy import (
     MultipleChoiceAnswerMappingStrategy,
     FreeTextAnswerMappingStrategy,
@@ -33,6 +35,7 @@ from app.modules.learning.strategies.answer_upsert_strategy import (
     FreeTextAnswerUpsertStrategy,
     ClozeAnswerUpsertStrategy,
 )
+from app.shared.strategy_registry import StrategyNotFoundError
 
 
 class TestAnswerMappingStrategies:
@@ -117,6 +120,62 @@ class TestAnswerMappingStrategies:
             strategy.to_dto(answer)
 
 
+class TestAnswerMappingRegistry:
+    """Mapping registry lookup tests."""
+
+    @pytest.mark.parametrize(
+        ("answer_type", "strategy_cls"),
+        [
+            (AnswerType.MULTIPLE_CHOICE, MultipleChoiceAnswerMappingStrategy),
+            (AnswerType.FREE_TEXT, FreeTextAnswerMappingStrategy),
+            (AnswerType.CLOZE, ClozeAnswerMappingStrategy),
+        ],
+    )
+    def test_get_for_resolves_enum_and_string(self, answer_type, strategy_cls) -> None:
+        registry = answer_mapping_registry()
+
+        assert isinstance(registry.get_for(answer_type), strategy_cls)
+        assert isinstance(registry.get_for(answer_type.value), strategy_cls)
+
+    def test_get_for_unknown_type_raises(self) -> None:
+        registry = answer_mapping_registry()
+
+        with pytest.raises(StrategyNotFoundError):
+            registry.get_for("unknown")
+
+
+class TestAnswersToDtos:
+    """Batched answer mapping tests."""
+
+    def test_preserves_input_order_across_types(self) -> None:
+        def free_text(text: str) -> FreeTextAnswer:
+            return FreeTextAnswer(
+                answer_id=uuid.uuid4(),
+                attempt_id=uuid.uuid4(),
+                task_id=uuid.uuid4(),
+                type=AnswerType.FREE_TEXT,
+                text_response=text,
+            )
+
+        cloze = ClozeAnswer(
+            answer_id=uuid.uuid4(),
+            attempt_id=uuid.uuid4(),
+            task_id=uuid.uuid4(),
+            type=AnswerType.CLOZE,
+        )
+        cloze.items = []
+        answers = [free_text("first"), cloze, free_text("second")]
+
+        dtos = answers_to_dtos(answers, answer_mapping_registry())
+
+        assert [dto.task_id for dto in dtos] == [a.task_id for a in answers]
+        assert isinstance(dtos[1], ExistingClozeAnswer)
+        assert dtos[2].data.text_response == "second"
+
+    def test_empty_list(self) -> None:
+        assert answers_to_dtos([], answer_mapping_registry()) == []
+
+
 class TestAnswerUpsertStrategies:
     """Upsert strategy tests."""
 
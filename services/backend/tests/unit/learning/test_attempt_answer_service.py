@@ -2,7 +2,6 @@
 
 import uuid
 from datetime import datetime, timezone
-from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -19,6 +18,7 @@ from app.modules.learning.exceptions import (
 from app.modules.learning.models import Attempt, AttemptStatus, FreeTextAnswer
 from app.modules.learning.repositories import AttemptRepository, AnswerRepository
 from app.modules.learning.services import AttemptAnswerService
+from app.modules.learning.services import attempt_answer_service
 from app.modules.learning.strategies import (
     answer_mapping_registry,
     answer_upsert_registry,
@@ -268,6 +268,88 @@ class TestSaveAnswer:
         assert result.answer_id == answer.answer_id
         service.answer_repo.upsert_multiple_choice.assert_called_once()
 
+    async def test_save_answer_writes_through_autosave_batcher(
+        self,
+        service: AttemptAnswerService,
+        sample_attempt: Attempt,
+        sample_task: MultipleChoiceTaskResponse,
+    ):
+        """Test that a configured batcher performs the write after the reads end."""
+        sample_task.quiz_id = sample_attempt.quiz_id
+        service.attempt_repo.get_by_id = AsyncMock(return_value=sample_attempt)
+        service.quiz_read_port.get_task = AsyncMock(return_value=sample_task)
+        answer_id = uuid.uuid4()
+        service.autosave_batcher = MagicMock()
+        service.autosave_batcher.submit = AsyncMock(return_value=answer_id)
+
+        payload = MultipleChoiceAnswerUpsert(
+            type="multiple_choice",
+            data=MultipleChoiceAnswerData(selected_option_ids=[uuid.uuid4()]),
+        )
+
+        result = await service.save_answer(
+            sample_attempt.user_id,
+            sample_attempt.attempt_id,
+            sample_task.task_id,
+            payload,
+        )
+
+        assert result.answer_id == answer_id
+        service.db.commit.assert_awaited_once()
+        service.autosave_batcher.submit.assert_awaited_once()
+        assert (
+            service.autosave_batcher.submit.await_args.args[0]
+            == sample_attempt.attempt_id
+        )
+        service.answer_repo.upsert_multiple_choice.assert_not_called()
+
+    async def test_batched_write_rejects_attempt_evaluated_meanwhile(
+        self,
+        service: AttemptAnswerService,
+        sample_attempt: Attempt,
+        sample_task: MultipleChoiceTaskResponse,
+    ):
+        """Test that the batched write re-checks the attempt status."""
+        sample_task.quiz_id = sample_attempt.quiz_id
+        service.attempt_repo.get_by_id = AsyncMock(return_value=sample_attempt)
+        service.quiz_read_port.get_task = AsyncMock(return_value=sample_task)
+        service.autosave_batcher = MagicMock()
+        service.autosave_batcher.submit = AsyncMock(return_value=uuid.uuid4())
+        payload = MultipleChoiceAnswerUpsert(
+            type="multiple_choice",
+            data=MultipleChoiceAnswerData(selected_option_ids=[uuid.uuid4()]),
+        )
+        await service.save_answer(
+            sample_attempt.user_id,
+            sample_attempt.attempt_id,
+            sample_task.task_id,
+            payload,
+        )
+        write = service.autosave_batcher.submit.await_args.args[1]
+        batch_attempt_repo = MagicMock(spec=AttemptRepository)
+        batch_attempt_repo.lock_if_in_progress = AsyncMock(return_value=False)
+        batch_answer_repo = MagicMock(spec=AnswerRepository)
+
+        with (
+            patch.object(
+                attempt_answer_service,
+                "AttemptRepository",
+                return_value=batch_attempt_repo,
+            ),
+            patch.object(
+                attempt_answer_service,
+                "AnswerRepository",
+                return_value=batch_answer_repo,
+            ),
+            pytest.raises(AttemptLockedException),
+        ):
+            await write(AsyncMock(spec=AsyncSession))
+
+        batch_attempt_repo.lock_if_in_progress.assert_awaited_once_with(
+            sample_attempt.attempt_id,
+        )
+        batch_answer_repo.upsert_multiple_choice.assert_not_called()
+
 
 class TestGetAttemptWithAnswers:
     """Tests for get_attempt_with_answers method."""
@@ -602,7 +684,7 @@ class TestListAttempts:
         attempt1.status = AttemptStatus.EVALUATED
         attempt1.started_at = datetime.now(timezone.utc)
         attempt1.evaluated_at = datetime.now(timezone.utc)
-        attempt1.total_percentage = Decimal("85.00")
+        attempt1.total_percentage = 8500
 
         attempt2 = MagicMock(spec=Attempt)
         attempt2.attempt_id = uuid.uuid4()
@@ -612,7 +694,7 @@ class TestListAttempts:
         attempt2.evaluated_at = None
         attempt2.total_percentage = None
 
-        service.attempt_repo.list_by_user = AsyncMock(
+        service.attempt_repo.list_rows_by_user = AsyncMock(
             return_value=[attempt1, attempt2],
         )
 
@@ -623,7 +705,13 @@ class TestListAttempts:
         assert result[0].total_percentage == 85.00
         assert result[1].attempt_id == attempt2.attempt_id
         assert result[1].total_percentage is None
-        service.attempt_repo.list_by_user.assert_called_once_with(user_id, None, None)
+        service.attempt_repo.list_rows_by_user.assert_called_once_with(
+            user_id,
+            None,
+            None,
+            None,
+            None,
+        )
 
     async def test_list_attempts_with_quiz_filter(
         self,
@@ -641,15 +729,17 @@ class TestListAttempts:
         attempt.evaluated_at = None
         attempt.total_percentage = None
 
-        service.attempt_repo.list_by_user = AsyncMock(return_value=[attempt])
+        service.attempt_repo.list_rows_by_user = AsyncMock(return_value=[attempt])
 
         result = await service.list_attempts(user_id, quiz_id=quiz_id)
 
         assert len(result) == 1
-        service.attempt_repo.list_by_user.assert_called_once_with(
+        service.attempt_repo.list_rows_by_user.assert_called_once_with(
             user_id,
             quiz_id,
             None,
+            None,
+            None,
         )
 
     async def test_list_attempts_with_status_filter(
@@ -665,17 +755,19 @@ class TestListAttempts:
         attempt.status = AttemptStatus.EVALUATED
         attempt.started_at = datetime.now(timezone.utc)
         attempt.evaluated_at = datetime.now(timezone.utc)
-        attempt.total_percentage = Decimal("90.00")
+        attempt.total_percentage = 9000
 
-        service.attempt_repo.list_by_user = AsyncMock(return_value=[attempt])
+        service.attempt_repo.list_rows_by_user = AsyncMock(return_value=[attempt])
 
         result = await service.list_attempts(user_id, status=AttemptStatus.EVALUATED)
 
         assert len(result) == 1
-        service.attempt_repo.list_by_user.assert_called_once_with(
+        service.attempt_repo.list_rows_by_user.assert_called_once_with(
             user_id,
             None,
             AttemptStatus.EVALUATED,
+            None,
+            None,
         )
 
     async def test_list_attempts_empty(
@@ -685,7 +777,7 @@ class TestListAttempts:
         """Test listing attempts when none exist."""
         user_id = uuid.uuid4()
 
-        service.attempt_repo.list_by_user = AsyncMock(return_value=[])
+        service.attempt_repo.list_rows_by_user = AsyncMock(return_value=[])
 
         result = await service.list_attempts(user_id)
 
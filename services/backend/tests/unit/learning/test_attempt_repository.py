@@ -2,12 +2,17 @@
 
 import uuid
 from datetime import datetime, timezone
-from decimal import Decimal
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.modules.learning.models import Attempt, AttemptStatus
+from app.modules.learning.models import (
+    Attempt,
+    AttemptStatus,
+    ClozeAnswer,
+    MultipleChoiceAnswer,
+)
+from app.modules.learning.repositories.answer_repository import AnswerRepository
 from app.modules.learning.repositories.attempt_repository import AttemptRepository
 
 
@@ -99,7 +104,7 @@ class TestAttemptRepository:
         attempt = await repository.create_attempt(user_id, quiz_id)
         await repository.mark_evaluated(
             attempt.attempt_id,
-            Decimal("75.00"),
+            7500,
             datetime.now(timezone.utc),
         )
         await db_session.commit()
@@ -201,6 +206,67 @@ class TestAttemptRepository:
         assert isinstance(found.answers, list)
         assert len(found.answers) == 0  # No answers yet
 
+    async def test_get_by_id_with_answers_loads_subtypes_and_collections(
+        self,
+        repository: AttemptRepository,
+        user_id: uuid.UUID,
+        quiz_id: uuid.UUID,
+        db_session: AsyncSession,
+    ):
+        """Test that answers come back as subtypes with collections loaded."""
+        # Arrange
+        created = await repository.create_attempt(user_id, quiz_id)
+        answer_repo = AnswerRepository(db_session)
+        await answer_repo.upsert_multiple_choice(
+            created.attempt_id,
+            uuid.uuid4(),
+            [uuid.uuid4(), uuid.uuid4()],
+        )
+        await answer_repo.upsert_cloze(
+            created.attempt_id,
+            uuid.uuid4(),
+            [{"blank_id": uuid.uuid4(), "value": "answer"}],
+        )
+        await db_session.commit()
+        db_session.expunge_all()
+
+        # Act
+        found = await repository.get_by_id_with_answers(created.attempt_id)
+
+        # Assert - accessing an unloaded collection would fail under asyncio
+        assert found is not None
+        mc_answer = next(
+            a for a in found.answers if isinstance(a, MultipleChoiceAnswer)
+        )
+        cloze_answer = next(a for a in found.answers if isinstance(a, ClozeAnswer))
+        assert len(mc_answer.selections) == 2
+        assert len(cloze_answer.items) == 1
+
+    # ==================== Lock Tests ====================
+
+    async def test_lock_if_in_progress(
+        self,
+        repository: AttemptRepository,
+        user_id: uuid.UUID,
+        quiz_id: uuid.UUID,
+        db_session: AsyncSession,
+    ):
+        """Test that only existing in-progress attempts pass the check."""
+        # Arrange
+        open_attempt = await repository.create_attempt(user_id, quiz_id)
+        evaluated = await repository.create_attempt(user_id, uuid.uuid4())
+        await repository.mark_evaluated(
+            evaluated.attempt_id,
+            1000,
+            datetime.now(timezone.utc),
+        )
+        await db_session.commit()
+
+        # Act & Assert
+        assert await repository.lock_if_in_progress(open_attempt.attempt_id)
+        assert not await repository.lock_if_in_progress(evaluated.attempt_id)
+        assert not await repository.lock_if_in_progress(uuid.uuid4())
+
     # ==================== Mark Evaluated Tests ====================
 
     async def test_mark_evaluated(
@@ -212,17 +278,22 @@ class TestAttemptRepository:
     ):
         """Test marking attempt as evaluated."""
         # Arrange
-        total = Decimal("85.50")
+        total = 8550
         evaluated_at = datetime.now(timezone.utc)
 
         attempt = await repository.create_attempt(user_id, quiz_id)
         await db_session.commit()
 
         # Act
-        await repository.mark_evaluated(attempt.attempt_id, total, evaluated_at)
+        updated = await repository.mark_evaluated(
+            attempt.attempt_id,
+            total,
+            evaluated_at,
+        )
         await db_session.commit()
 
         # Assert
+        assert updated is True
         found = await repository.get_by_id(attempt.attempt_id)
         assert found.status == AttemptStatus.EVALUATED
         assert found.total_percentage == total
@@ -235,14 +306,45 @@ class TestAttemptRepository:
     ):
         """Test marking non-existent attempt as evaluated does nothing."""
         # Act
-        await repository.mark_evaluated(
+        updated = await repository.mark_evaluated(
             uuid.uuid4(),
-            Decimal("100.0"),
+            10_000,
+            datetime.now(timezone.utc),
+        )
+        await db_session.commit()
+
+        # Assert
+        assert updated is False
+
+    async def test_mark_evaluated_already_evaluated(
+        self,
+        repository: AttemptRepository,
+        user_id: uuid.UUID,
+        quiz_id: uuid.UUID,
+        db_session: AsyncSession,
+    ):
+        """Test marking an evaluated attempt again keeps the first result."""
+        # Arrange
+        attempt = await repository.create_attempt(user_id, quiz_id)
+        await repository.mark_evaluated(
+            attempt.attempt_id,
+            4000,
             datetime.now(timezone.utc),
         )
         await db_session.commit()
 
-        # Assert - No error raised
+        # Act
+        updated = await repository.mark_evaluated(
+            attempt.attempt_id,
+            9000,
+            datetime.now(timezone.utc),
+        )
+        await db_session.commit()
+
+        # Assert
+        assert updated is False
+        found = await repository.get_by_id(attempt.attempt_id)
+        assert found.total_percentage == 4000
 
     # ==================== Delete Tests ====================
 
@@ -257,7 +359,7 @@ class TestAttemptRepository:
         user1_id = uuid.uuid4()
         user2_id = uuid.uuid4()
 
-        await repository.create_attempt(user1_id, quiz_id)
+        attempt1 = await repository.create_attempt(user1_id, quiz_id)
         await repository.create_attempt(user2_id, quiz_id)
         await db_session.commit()
 
@@ -317,7 +419,7 @@ class TestAttemptRepository:
 
     # ==================== List by User Tests ====================
 
-    async def test_list_by_user_returns_all_attempts(
+    async def test_list_rows_by_user_returns_all_attempts(
         self,
         repository: AttemptRepository,
         user_id: uuid.UUID,
@@ -332,7 +434,7 @@ class TestAttemptRepository:
         await db_session.commit()
 
         # Act
-        attempts = await repository.list_by_user(user_id)
+        attempts = await repository.list_rows_by_user(user_id)
 
         # Assert
         assert len(attempts) == 2
@@ -340,18 +442,18 @@ class TestAttemptRepository:
         assert attempt1.attempt_id in attempt_ids
         assert attempt2.attempt_id in attempt_ids
 
-    async def test_list_by_user_empty(
+    async def test_list_rows_by_user_empty(
         self,
         repository: AttemptRepository,
     ):
         """Test getting attempts when none exist returns empty list."""
         # Act
-        attempts = await repository.list_by_user(uuid.uuid4())
+        attempts = await repository.list_rows_by_user(uuid.uuid4())
 
         # Assert
         assert attempts == []
 
-    async def test_list_by_user_filter_by_quiz(
+    async def test_list_rows_by_user_filter_by_quiz(
         self,
         repository: AttemptRepository,
         user_id: uuid.UUID,
@@ -367,13 +469,13 @@ class TestAttemptRepository:
         await db_session.commit()
 
         # Act - Get only quiz1's attempts
-        attempts = await repository.list_by_user(user_id, quiz_id=quiz1_id)
+        attempts = await repository.list_rows_by_user(user_id, quiz_id=quiz1_id)
 
         # Assert
         assert len(attempts) == 1
         assert attempts[0].quiz_id == quiz1_id
 
-    async def test_list_by_user_filter_by_status(
+    async def test_list_rows_by_user_filter_by_status(
         self,
         repository: AttemptRepository,
         user_id: uuid.UUID,
@@ -385,14 +487,14 @@ class TestAttemptRepository:
         attempt1 = await repository.create_attempt(user_id, quiz_id)
         await repository.mark_evaluated(
             attempt1.attempt_id,
-            Decimal("80.00"),
+            8000,
             datetime.now(timezone.utc),
         )
         attempt2 = await repository.create_attempt(user_id, quiz_id)
         await db_session.commit()
 
         # Act - Get only in_progress attempts
-        attempts = await repository.list_by_user(
+        attempts = await repository.list_rows_by_user(
             user_id,
             status=AttemptStatus.IN_PROGRESS,
         )
@@ -402,7 +504,7 @@ class TestAttemptRepository:
         assert attempts[0].attempt_id == attempt2.attempt_id
         assert attempts[0].status == AttemptStatus.IN_PROGRESS
 
-    async def test_list_by_user_filter_by_quiz_and_status(
+    async def test_list_rows_by_user_filter_by_quiz_and_status(
         self,
         repository: AttemptRepository,
         user_id: uuid.UUID,
@@ -416,7 +518,7 @@ class TestAttemptRepository:
         attempt1 = await repository.create_attempt(user_id, quiz1_id)
         await repository.mark_evaluated(
             attempt1.attempt_id,
-            Decimal("90.00"),
+            9000,
             datetime.now(timezone.utc),
         )
         await repository.create_attempt(user_id, quiz1_id)  # in_progress
@@ -424,7 +526,7 @@ class TestAttemptRepository:
         await db_session.commit()
 
         # Act - Get only evaluated attempts for quiz1
-        attempts = await repository.list_by_user(
+        attempts = await repository.list_rows_by_user(
             user_id,
             quiz_id=quiz1_id,
             status=AttemptStatus.EVALUATED,
@@ -434,7 +536,7 @@ class TestAttemptRepository:
         assert len(attempts) == 1
         assert attempts[0].attempt_id == attempt1.attempt_id
 
-    async def test_list_by_user_ordered_by_date_desc(
+    async def test_list_rows_by_user_ordered_by_date_desc(
         self,
         repository: AttemptRepository,
         user_id: uuid.UUID,
@@ -446,7 +548,7 @@ class TestAttemptRepository:
         attempt1 = await repository.create_attempt(user_id, quiz_id)
         await repository.mark_evaluated(
             attempt1.attempt_id,
-            Decimal("50.00"),
+            5000,
             datetime.now(timezone.utc),
         )
         await db_session.commit()
@@ -455,14 +557,41 @@ class TestAttemptRepository:
         await db_session.commit()
 
         # Act
-        attempts = await repository.list_by_user(user_id)
+        attempts = await repository.list_rows_by_user(user_id)
 
         # Assert - Newest first
         assert len(attempts) == 2
         assert attempts[0].attempt_id == attempt2.attempt_id
         assert attempts[1].attempt_id == attempt1.attempt_id
 
-    async def test_list_by_user_ignores_other_users(
+    async def test_list_rows_by_user_keyset_pagination(
+        self,
+        repository: AttemptRepository,
+        user_id: uuid.UUID,
+        quiz_id: uuid.UUID,
+        db_session: AsyncSession,
+    ):
+        """Test that pages continue after the cursor without overlap."""
+        # Arrange
+        created = []
+        for _ in range(3):
+            created.append(await repository.create_attempt(user_id, quiz_id))
+            await db_session.commit()
+
+        # Act
+        first_page = await repository.list_rows_by_user(user_id, limit=2)
+        second_page = await repository.list_rows_by_user(
+            user_id,
+            limit=2,
+            cursor=first_page[-1].attempt_id,
+        )
+
+        # Assert
+        assert [a.attempt_id for a in first_page + second_page] == [
+            a.attempt_id for a in reversed(created)
+        ]
+
+    async def test_list_rows_by_user_ignores_other_users(
         self,
         repository: AttemptRepository,
         quiz_id: uuid.UUID,
@@ -473,13 +602,57 @@ class TestAttemptRepository:
         user1_id = uuid.uuid4()
         user2_id = uuid.uuid4()
 
-        await repository.create_attempt(user1_id, quiz_id)
+        attempt1 = await repository.create_attempt(user1_id, quiz_id)
         await repository.create_attempt(user2_id, quiz_id)
         await db_session.commit()
 
         # Act - Get only user1's attempts
-        attempts = await repository.list_by_user(user1_id)
+        attempts = await repository.list_rows_by_user(user1_id)
 
         # Assert
         assert len(attempts) == 1
-        assert attempts[0].user_id == user1_id
+        assert attempts[0].attempt_id == attempt1.attempt_id
+
+    async def test_list_rows_by_user_returns_listed_columns(
+        self,
+        repository: AttemptRepository,
+        user_id: uuid.UUID,
+        quiz_id: uuid.UUID,
+        db_session: AsyncSession,
+    ):
+        """Test that rows carry the list columns and follow the same paging."""
+        # Arrange
+        first = await repository.create_attempt(user_id, quiz_id)
+        await db_session.commit()
+        second = await repository.create_attempt(user_id, quiz_id)
+        await repository.mark_evaluated(
+            second.attempt_id,
+            5000,
+            datetime.now(timezone.utc),
+        )
+        await db_session.commit()
+
+        # Act
+        rows = await repository.list_rows_by_user(user_id, limit=1)
+        next_rows = await repository.list_rows_by_user(
+            user_id,
+            limit=1,
+            cursor=rows[-1].attempt_id,
+        )
+
+        # Assert
+        assert [row.attempt_id for row in rows + next_rows] == [
+            second.attempt_id,
+            first.attempt_id,
+        ]
+        assert rows[0]._fields == (
+            "attempt_id",
+            "quiz_id",
+            "status",
+            "started_at",
+            "evaluated_at",
+            "total_percentage",
+        )
+        assert rows[0].status == AttemptStatus.EVALUATED
+        assert rows[0].total_percentage == 5000
+        assert next_rows[0].evaluated_at is None
@@ -0,0 +1,130 @@
+"""Tests for AutosaveBatcher."""
+
+import asyncio
+import uuid
+
+import pytest
+from sqlalchemy import text
+
+from app.core.database import DatabaseSessionManager
+from app.modules.learning.services.autosave_batcher import AutosaveBatcher
+
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+async def manager(tmp_path):
+    """File-backed SQLite session manager with a scratch table."""
+    manager = DatabaseSessionManager(f"sqlite+aiosqlite:///{tmp_path / 'app.db'}")
+    async with manager.connect() as connection:
+        await connection.execute(text("CREATE TABLE saved (value TEXT)"))
+    yield manager
+    await manager.close()
+
+
+def _insert(value: str):
+    async def write(db):
+        await db.execute(text("INSERT INTO saved VALUES (:value)"), {"value": value})
+        return value
+
+    return write
+
+
+async def _saved_values(manager: DatabaseSessionManager) -> list[str]:
+    async with manager.session() as db:
+        result = await db.execute(text("SELECT value FROM saved ORDER BY rowid"))
+        return list(result.scalars())
+
+
+class TestAutosaveBatcher:
+    """Tests for AutosaveBatcher."""
+
+    async def test_concurrent_saves_share_one_transaction(self, manager):
+        # Arrange
+        sessions_opened = 0
+
+        def new_session():
+            nonlocal sessions_opened
+            sessions_opened += 1
+            return manager.new_session()
+
+        batcher = AutosaveBatcher(new_session)
+        attempt_id = uuid.uuid4()
+
+        # Act
+        results = await asyncio.gather(
+            *(batcher.submit(attempt_id, _insert(value)) for value in "abc"),
+        )
+
+        # Assert
+        assert results == ["a", "b", "c"]
+        assert sessions_opened == 1
+        assert await _saved_values(manager) == ["a", "b", "c"]
+
+    async def test_failing_save_does_not_roll_back_the_batch(self, manager):
+        # Arrange
+        batcher = AutosaveBatcher(manager.new_session)
+        attempt_id = uuid.uuid4()
+
+        async def failing_write(db):
+            await db.execute(text("INSERT INTO saved VALUES ('lost')"))
+            raise ValueError("boom")
+
+        # Act
+        results = await asyncio.gather(
+            batcher.submit(attempt_id, _insert("a")),
+            batcher.submit(attempt_id, failing_write),
+            batcher.submit(attempt_id, _insert("b")),
+            return_exceptions=True,
+        )
+
+        # Assert
+        assert results[0] == "a"
+        assert isinstance(results[1], ValueError)
+        assert results[2] == "b"
+        assert await _saved_values(manager) == ["a", "b"]
+
+    async def test_max_batch_splits_transactions(self, manager):
+        # Arrange
+        sessions_opened = 0
+
+        def new_session():
+            nonlocal sessions_opened
+            sessions_opened += 1
+            return manager.new_session()
+
+        batcher = AutosaveBatcher(new_session, max_batch=2)
+        attempt_id = uuid.uuid4()
+
+        # Act
+        await asyncio.gather(
+            *(batcher.submit(attempt_id, _insert(value)) for value in "abc"),
+        )
+
+        # Assert
+        assert sessions_opened == 2
+        assert await _saved_values(manager) == ["a", "b", "c"]
+
+    async def test_cancelled_worker_fails_pending_saves(self, manager):
+        # Arrange
+        batcher = AutosaveBatcher(manager.new_session)
+        attempt_id = uuid.uuid4()
+        started = asyncio.Event()
+
+        async def blocking_write(db):
+            started.set()
+            await asyncio.Event().wait()
+
+        first = asyncio.ensure_future(batcher.submit(attempt_id, blocking_write))
+        second = asyncio.ensure_future(batcher.submit(attempt_id, _insert("b")))
+        await started.wait()
+
+        # Act
+        for worker in list(batcher._workers):
+            worker.cancel()
+        results = await asyncio.gather(first, second, return_exceptions=True)
+
+        # Assert
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert await _saved_values(manager) == []
@@ -0,0 +1,72 @@
+"""Tests for learning module dependencies."""
+
+import json
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi.exceptions import RequestValidationError
+
+from app.modules.learning.dependencies import get_answer_upsert_payload
+from app.modules.learning.schemas import answer_upsert_request_schema
+from app.modules.learning.schemas.answer import MultipleChoiceAnswerUpsert
+
+
+pytestmark = pytest.mark.unit
+
+
+def _request(body: bytes) -> MagicMock:
+    request = MagicMock()
+    request.body = AsyncMock(return_value=body)
+    return request
+
+
+class TestGetAnswerUpsertPayload:
+    """Tests for parsing the answer upsert body."""
+
+    async def test_parses_discriminated_payload(self):
+        # Arrange
+        option_id = uuid.uuid4()
+        body = json.dumps(
+            {
+                "type": "multiple_choice",
+                "data": {"selected_option_ids": [str(option_id)]},
+            },
+        ).encode()
+
+        # Act
+        payload = await get_answer_upsert_payload(_request(body))
+
+        # Assert
+        assert isinstance(payload, MultipleChoiceAnswerUpsert)
+        assert payload.data.selected_option_ids == [option_id]
+
+    async def test_invalid_payload_reports_body_location(self):
+        # Arrange
+        body = json.dumps({"type": "free_text", "data": {}}).encode()
+
+        # Act & Assert
+        with pytest.raises(RequestValidationError) as exc_info:
+            await get_answer_upsert_payload(_request(body))
+        locations = [error["loc"] for error in exc_info.value.errors()]
+        assert ("body", "free_text", "data", "text_response") in locations
+
+    async def test_malformed_json_is_a_validation_error(self):
+        # Act & Assert
+        with pytest.raises(RequestValidationError) as exc_info:
+            await get_answer_upsert_payload(_request(b"{not json"))
+        assert exc_info.value.errors()[0]["type"] == "json_invalid"
+
+
+class TestAnswerUpsertRequestSchema:
+    """Tests for the documented request body schema."""
+
+    def test_schema_is_self_contained(self):
+        # Act
+        schema = answer_upsert_request_schema()
+
+        # Assert
+        assert "$defs" not in schema
+        assert "$ref" not in json.dumps(schema)
+        assert len(schema["oneOf"]) == 3
+        assert schema["discriminator"] == {"propertyName": "type"}
@@ -62,7 +62,7 @@ def mock_attempt_repo() -> MagicMock:
 def mock_answer_repo() -> MagicMock:
     """Create mock answer repository."""
     repo = MagicMock(spec=AnswerRepository)
-    repo.set_cloze_item_correct = AsyncMock()
+    repo.set_cloze_items_correct = AsyncMock()
     return repo
 
 
@@ -122,6 +122,8 @@ class TestEvaluateAttempt:
 
         assert result.total_percentage == Decimal("0.0")
         assert len(result.answer_details) == 0
+        service.answer_repo.list_by_attempt.assert_not_awaited()
+        service.attempt_repo.mark_evaluated.assert_awaited_once()
 
     async def test_evaluate_multiple_choice_correct(
         self,
@@ -161,7 +163,7 @@ class TestEvaluateAttempt:
         service.attempt_repo.get_by_id = AsyncMock(return_value=sample_attempt)
         service.quiz_read_port.get_tasks = AsyncMock(return_value=[task])
         service.answer_repo.list_by_attempt = AsyncMock(return_value=[answer])
-        service.answer_repo.set_answer_percentage = AsyncMock()
+        service.answer_repo.set_answer_percentages = AsyncMock()
         service.attempt_repo.mark_evaluated = AsyncMock()
 
         result = await service.evaluate_attempt(
@@ -171,6 +173,60 @@ class TestEvaluateAttempt:
 
         assert result.total_percentage == Decimal("100.0")
         assert result.answer_details[0].percentage_correct == Decimal("100.0")
+        service.answer_repo.set_answer_percentages.assert_awaited_once_with(
+            [(answer.answer_id, 10_000)],
+        )
+
+    async def test_evaluate_multiple_choice_extra_selection(
+        self,
+        service: EvaluationService,
+        sample_attempt: Attempt,
+    ):
+        """Test that selecting an extra option scores zero."""
+        correct_option_id = uuid.uuid4()
+
+        # Create MC task with correct option
+        task = MultipleChoiceTaskResponse(
+            task_id=uuid.uuid4(),
+            quiz_id=sample_attempt.quiz_id,
+            prompt="Prompt",
+            topic_detail="Topic",
+            order_index=0,
+            type="multiple_choice",
+            options=[
+                MultipleChoiceOptionResponse(
+                    option_id=correct_option_id,
+                    text="Option",
+                    is_correct=True,
+                    explanation=None,
+                ),
+            ],
+        )
+
+        # Create MC answer with correct selection
+        answer = MagicMock(spec=MultipleChoiceAnswer)
+        answer.answer_id = uuid.uuid4()
+        answer.task_id = task.task_id
+        answer.type = AnswerType.MULTIPLE_CHOICE
+        selection = MagicMock()
+        selection.option_id = correct_option_id
+        extra_selection = MagicMock()
+        extra_selection.option_id = uuid.uuid4()
+        answer.selections = [selection, extra_selection]
+
+        service.attempt_repo.get_by_id = AsyncMock(return_value=sample_attempt)
+        service.quiz_read_port.get_tasks = AsyncMock(return_value=[task])
+        service.answer_repo.list_by_attempt = AsyncMock(return_value=[answer])
+        service.answer_repo.set_answer_percentages = AsyncMock()
+        service.attempt_repo.mark_evaluated = AsyncMock()
+
+        result = await service.evaluate_attempt(
+            sample_attempt.user_id,
+            sample_attempt.attempt_id,
+        )
+
+        assert result.total_percentage == Decimal("0.0")
+        assert result.answer_details[0].percentage_correct == Decimal("0.0")
 
     async def test_evaluate_multiple_choice_incorrect(
         self,
@@ -209,7 +265,7 @@ class TestEvaluateAttempt:
         service.attempt_repo.get_by_id = AsyncMock(return_value=sample_attempt)
         service.quiz_read_port.get_tasks = AsyncMock(return_value=[task])
         service.answer_repo.list_by_attempt = AsyncMock(return_value=[answer])
-        service.answer_repo.set_answer_percentage = AsyncMock()
+        service.answer_repo.set_answer_percentages = AsyncMock()
         service.attempt_repo.mark_evaluated = AsyncMock()
 
         result = await service.evaluate_attempt(
@@ -239,12 +295,12 @@ class TestEvaluateAttempt:
         answer.answer_id = uuid.uuid4()
         answer.task_id = task.task_id
         answer.type = AnswerType.FREE_TEXT
-        answer.percentage_correct = Decimal("100.0")  # Pre-set via PATCH
+        answer.percentage_correct = 10_000  # Pre-set via PATCH (basis points)
 
         service.attempt_repo.get_by_id = AsyncMock(return_value=sample_attempt)
         service.quiz_read_port.get_tasks = AsyncMock(return_value=[task])
         service.answer_repo.list_by_attempt = AsyncMock(return_value=[answer])
-        service.answer_repo.set_answer_percentage = AsyncMock()
+        service.answer_repo.set_answer_percentages = AsyncMock()
         service.attempt_repo.mark_evaluated = AsyncMock()
 
         result = await service.evaluate_attempt(
@@ -279,7 +335,7 @@ class TestEvaluateAttempt:
         service.attempt_repo.get_by_id = AsyncMock(return_value=sample_attempt)
         service.quiz_read_port.get_tasks = AsyncMock(return_value=[task])
         service.answer_repo.list_by_attempt = AsyncMock(return_value=[answer])
-        service.answer_repo.set_answer_percentage = AsyncMock()
+        service.answer_repo.set_answer_percentages = AsyncMock()
         service.attempt_repo.mark_evaluated = AsyncMock()
 
         result = await service.evaluate_attempt(
@@ -335,8 +391,8 @@ class TestEvaluateAttempt:
         service.attempt_repo.get_by_id = AsyncMock(return_value=sample_attempt)
         service.quiz_read_port.get_tasks = AsyncMock(return_value=[task])
         service.answer_repo.list_by_attempt = AsyncMock(return_value=[answer])
-        service.answer_repo.set_answer_percentage = AsyncMock()
-        service.answer_repo.set_cloze_item_correct = AsyncMock()
+        service.answer_repo.set_answer_percentages = AsyncMock()
+        service.answer_repo.set_cloze_items_correct = AsyncMock()
         service.attempt_repo.mark_evaluated = AsyncMock()
 
         result = await service.evaluate_attempt(
@@ -392,8 +448,8 @@ class TestEvaluateAttempt:
         service.attempt_repo.get_by_id = AsyncMock(return_value=sample_attempt)
         service.quiz_read_port.get_tasks = AsyncMock(return_value=[task])
         service.answer_repo.list_by_attempt = AsyncMock(return_value=[answer])
-        service.answer_repo.set_answer_percentage = AsyncMock()
-        service.answer_repo.set_cloze_item_correct = AsyncMock()
+        service.answer_repo.set_answer_percentages = AsyncMock()
+        service.answer_repo.set_cloze_items_correct = AsyncMock()
         service.attempt_repo.mark_evaluated = AsyncMock()
 
         result = await service.evaluate_attempt(
@@ -402,6 +458,10 @@ class TestEvaluateAttempt:
         )
 
         assert result.total_percentage == Decimal("50.0")
+        service.answer_repo.set_cloze_items_correct.assert_awaited_once_with(
+            answer.answer_id,
+            [(blank1_id, True), (blank2_id, False)],
+        )
 
     async def test_evaluate_cloze_with_regex(
         self,
@@ -440,8 +500,56 @@ class TestEvaluateAttempt:
         service.attempt_repo.get_by_id = AsyncMock(return_value=sample_attempt)
         service.quiz_read_port.get_tasks = AsyncMock(return_value=[task])
         service.answer_repo.list_by_attempt = AsyncMock(return_value=[answer])
-        service.answer_repo.set_answer_percentage = AsyncMock()
-        service.answer_repo.set_cloze_item_correct = AsyncMock()
+        service.answer_repo.set_answer_percentages = AsyncMock()
+        service.answer_repo.set_cloze_items_correct = AsyncMock()
+        service.attempt_repo.mark_evaluated = AsyncMock()
+
+        result = await service.evaluate_attempt(
+            sample_attempt.user_id,
+            sample_attempt.attempt_id,
+        )
+
+        assert result.total_percentage == Decimal("100.0")
+
+    async def test_evaluate_cloze_with_invalid_regex(
+        self,
+        service: EvaluationService,
+        sample_attempt: Attempt,
+    ):
+        """Test that an invalid pattern falls back to exact comparison."""
+        blank_id = uuid.uuid4()
+
+        task = ClozeTaskResponse(
+            task_id=uuid.uuid4(),
+            quiz_id=sample_attempt.quiz_id,
+            prompt="Prompt",
+            topic_detail="Topic",
+            order_index=0,
+            type="cloze",
+            template_text="Template",
+            blanks=[
+                ClozeBlankResponse(
+                    blank_id=blank_id,
+                    position=0,
+                    expected_value="f(x",
+                ),
+            ],
+        )
+
+        answer = MagicMock(spec=ClozeAnswer)
+        answer.answer_id = uuid.uuid4()
+        answer.task_id = task.task_id
+        answer.type = AnswerType.CLOZE
+        item = MagicMock(spec=AnswerClozeItem)
+        item.blank_id = blank_id
+        item.provided_value = "f(x"  # Equals the pattern text
+        answer.items = [item]
+
+        service.attempt_repo.get_by_id = AsyncMock(return_value=sample_attempt)
+        service.quiz_read_port.get_tasks = AsyncMock(return_value=[task])
+        service.answer_repo.list_by_attempt = AsyncMock(return_value=[answer])
+        service.answer_repo.set_answer_percentages = AsyncMock()
+        service.answer_repo.set_cloze_items_correct = AsyncMock()
         service.attempt_repo.mark_evaluated = AsyncMock()
 
         result = await service.evaluate_attempt(
@@ -510,18 +618,18 @@ class TestEvaluateAttempt:
         answer1.answer_id = uuid.uuid4()
         answer1.task_id = task1.task_id
         answer1.type = AnswerType.FREE_TEXT
-        answer1.percentage_correct = Decimal("100.0")
+        answer1.percentage_correct = 10_000
 
         answer2 = MagicMock(spec=FreeTextAnswer)
         answer2.answer_id = uuid.uuid4()
         answer2.task_id = task2.task_id
         answer2.type = AnswerType.FREE_TEXT
-        answer2.percentage_correct = Decimal("0.0")
+        answer2.percentage_correct = 0
 
         service.attempt_repo.get_by_id = AsyncMock(return_value=sample_attempt)
         service.quiz_read_port.get_tasks = AsyncMock(return_value=[task1, task2])
         service.answer_repo.list_by_attempt = AsyncMock(return_value=[answer1, answer2])
-        service.answer_repo.set_answer_percentage = AsyncMock()
+        service.answer_repo.set_answer_percentages = AsyncMock()
         service.attempt_repo.mark_evaluated = AsyncMock()
 
         result = await service.evaluate_attempt(
@@ -556,6 +664,24 @@ class TestEvaluateAttempt:
                 sample_attempt.attempt_id,
             )
 
+    async def test_concurrent_evaluation_raises_exception(
+        self,
+        service: EvaluationService,
+        sample_attempt: Attempt,
+    ):
+        """Test that losing the race to mark the attempt raises without commit."""
+        service.attempt_repo.get_by_id = AsyncMock(return_value=sample_attempt)
+        service.quiz_read_port.get_tasks = AsyncMock(return_value=[])
+        service.answer_repo.list_by_attempt = AsyncMock(return_value=[])
+        service.attempt_repo.mark_evaluated = AsyncMock(return_value=False)
+
+        with pytest.raises(AttemptLockedException):
+            await service.evaluate_attempt(
+                sample_attempt.user_id,
+                sample_attempt.attempt_id,
+            )
+        service.db.commit.assert_not_awaited()
+
     async def test_access_denied_wrong_user(
         self,
         service: EvaluationService,
@@ -1,7 +1,11 @@
 """Tests for learning module exceptions."""
 
 import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
 
+from app.modules.learning.exception_handlers import register_exception_handlers
 from app.modules.learning.exceptions import (
     LearningModuleException,
     AttemptNotFoundException,
@@ -13,6 +17,7 @@ from app.modules.learning.exceptions import (
     AnswerTypeMismatchException,
     AnswerNotFoundException,
     InvalidAnswerTypeException,
+    NOT_YOUR_ATTEMPT,
 )
 
 
@@ -78,6 +83,11 @@ class TestLearningExceptions:
         assert exc.expected == "free_text"
         assert exc.actual == "multiple_choice"
 
+    def test_message_attribute_matches_str(self):
+        """Test that the formatted message is kept on the exception."""
+        exc = QuizNotFoundException("quiz-id")
+        assert exc.message == str(exc)
+
     def test_all_inherit_from_base(self):
         """Test that all exceptions inherit from LearningModuleException."""
         exceptions = [
@@ -95,3 +105,76 @@ class TestLearningExceptions:
         for exc in exceptions:
             assert isinstance(exc, LearningModuleException)
             assert isinstance(exc, Exception)
+
+    def test_attributes_live_in_slots(self):
+        """Test that exception attributes do not populate an instance dict."""
+        exceptions = [
+            AttemptNotFoundException("id"),
+            AttemptLockedException("id"),
+            QuizNotFoundException("id"),
+            QuizNotCompletedException("id"),
+            AccessDeniedException(),
+            TaskNotFoundException("id"),
+            AnswerTypeMismatchException("a", "b"),
+            AnswerNotFoundException("id"),
+            InvalidAnswerTypeException("a", "b"),
+        ]
+
+        for exc in exceptions:
+            assert exc.__dict__ == {}
+
+
+class TestExceptionHandlers:
+    """Tests for learning module FastAPI exception handlers."""
+
+    @pytest.fixture
+    def client(self):
+        """Create a test client for an app raising learning exceptions."""
+        app = FastAPI()
+        register_exception_handlers(app)
+
+        @app.get("/raise-attempt-not-found")
+        async def raise_attempt_not_found():
+            raise AttemptNotFoundException("abc-123")
+
+        @app.get("/raise-attempt-locked")
+        async def raise_attempt_locked():
+            raise AttemptLockedException("abc-123")
+
+        @app.get("/raise-access-denied")
+        async def raise_access_denied():
+            raise AccessDeniedException()
+
+        @app.get("/raise-not-your-attempt")
+        async def raise_not_your_attempt():
+            raise AccessDeniedException(NOT_YOUR_ATTEMPT)
+
+        @app.get("/raise-invalid-answer-type")
+        async def raise_invalid_answer_type():
+            raise InvalidAnswerTypeException("free_text", "cloze")
+
+        return TestClient(app)
+
+    def test_attempt_not_found_returns_404(self, client):
+        response = client.get("/raise-attempt-not-found")
+        assert response.status_code == 404
+        assert response.json() == {"detail": "Attempt not found: abc-123"}
+
+    def test_attempt_locked_returns_409(self, client):
+        response = client.get("/raise-attempt-locked")
+        assert response.status_code == 409
+
+    def test_access_denied_returns_403(self, client):
+        response = client.get("/raise-access-denied")
+        assert response.status_code == 403
+        assert response.json() == {"detail": "Access denied"}
+
+    def test_not_your_attempt_matches_json_response_encoding(self, client):
+        response = client.get("/raise-not-your-attempt")
+        assert response.status_code == 403
+        assert response.content == JSONResponse({"detail": NOT_YOUR_ATTEMPT}).body
+
+    def test_invalid_answer_type_returns_422(self, client):
+        response = client.get("/raise-invalid-answer-type")
+        assert response.status_code == 422
+        assert response.headers["content-type"] == "application/json"
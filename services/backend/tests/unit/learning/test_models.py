@@ -0,0 +1,57 @@
+"""Tests for learning module models."""
+
+import uuid
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.modules.learning.models import (
+    AnswerType,
+    ClozeAnswer,
+    MultipleChoiceAnswer,
+)
+
+
+pytestmark = pytest.mark.unit
+
+
+class TestAnswerRepr:
+    """Answer __repr__ tests."""
+
+    def test_repr_does_not_load_unloaded_collections(self) -> None:
+        # Arrange
+        mc_answer = MultipleChoiceAnswer(
+            answer_id=uuid.uuid4(),
+            task_id=uuid.uuid4(),
+            type=AnswerType.MULTIPLE_CHOICE,
+        )
+        cloze_answer = ClozeAnswer(
+            answer_id=uuid.uuid4(),
+            task_id=uuid.uuid4(),
+            type=AnswerType.CLOZE,
+        )
+
+        # Act & Assert
+        assert "selections_count=?" in repr(mc_answer)
+        assert "items_count=?" in repr(cloze_answer)
+        assert "selections" not in mc_answer.__dict__
+        assert "items" not in cloze_answer.__dict__
+
+    def test_repr_counts_loaded_collections(self) -> None:
+        # Arrange
+        mc_answer = MultipleChoiceAnswer(
+            answer_id=uuid.uuid4(),
+            task_id=uuid.uuid4(),
+            type=AnswerType.MULTIPLE_CHOICE,
+        )
+        mc_answer.selections = [MagicMock(), MagicMock()]
+        cloze_answer = ClozeAnswer(
+            answer_id=uuid.uuid4(),
+            task_id=uuid.uuid4(),
+            type=AnswerType.CLOZE,
+        )
+        cloze_answer.items = []
+
+        # Act & Assert
+        assert "selections_count=2" in repr(mc_answer)
+        assert "items_count=0" in repr(cloze_answer)
@@ -18,24 +18,16 @@ async def test_handle_quiz_deleted_calls_cleanup():
     db = AsyncMock(spec=AsyncSession)
     event = QuizDeletedEvent(quiz_id=quiz_id, db=db)
 
-    mock_repo = MagicMock()
     mock_service = MagicMock()
     mock_service.delete_attempts_for_quiz = AsyncMock()
 
-    with (
-        patch(
-            "app.modules.learning.public.subscribers.AttemptRepository",
-            return_value=mock_repo,
-        ) as repo_cls,
-        patch(
-            "app.modules.learning.public.subscribers.LearningCleanupService",
-            return_value=mock_service,
-        ) as service_cls,
-    ):
+    with patch(
+        "app.modules.learning.public.subscribers.LearningCleanupService.for_session",
+        return_value=mock_service,
+    ) as for_session:
         await handle_quiz_deleted(event)
 
-    repo_cls.assert_called_once_with(db)
-    service_cls.assert_called_once_with(mock_repo)
+    for_session.assert_called_once_with(db)
     mock_service.delete_attempts_for_quiz.assert_awaited_once_with(quiz_id)
 
 
@@ -1,15 +1,19 @@
 """Unit tests for shared dependencies (authentication)."""
 
 import uuid
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi import HTTPException
 from fastapi.security import HTTPAuthorizationCredentials
-from jose import JWTError
 
 from app.core.security import create_jwt_token
-from app.shared.dependencies import get_current_user, get_current_user_id
+from app.shared import dependencies
+from app.shared.dependencies import (
+    close_mailer,
+    get_current_user,
+    get_current_user_id,
+)
 from app.shared.schemas import TokenPayload
 
 
@@ -80,7 +84,7 @@ class TestGetCurrentUser:
         """Test that token without user_id raises HTTPException 401."""
         from datetime import datetime, timedelta, timezone
 
-        from jose import jwt
+        import jwt
 
         from app.core.config import get_settings
 
@@ -107,7 +111,7 @@ class TestGetCurrentUser:
         """Test that token with invalid UUID format raises HTTPException 401."""
         from datetime import datetime, timedelta, timezone
 
-        from jose import jwt
+        import jwt
 
         from app.core.config import get_settings
 
@@ -175,3 +179,31 @@ class TestGetCurrentUserId:
 
         # Assert
         assert type(result) is uuid.UUID
+
+
+class TestCloseMailer:
+    """Test suite for close_mailer shutdown hook."""
+
+    async def test_closes_and_resets_shared_mailer(self):
+        """Test that the shared mailer is closed and dropped."""
+        # Arrange
+        mailer = MagicMock()
+        mailer.close = AsyncMock()
+
+        # Act
+        with patch.object(dependencies, "_mailer", mailer):
+            await close_mailer()
+            remaining = dependencies._mailer
+
+        # Assert
+        mailer.close.assert_awaited_once()
+        assert remaining is None
+
+    async def test_noop_without_mailer(self):
+        """Test that closing before any mailer was created does nothing."""
+        # Arrange / Act
+        with patch.object(dependencies, "_mailer", None):
+            await close_mailer()
+
+            # Assert
+            assert dependencies._mailer is None
@@ -0,0 +1,88 @@
+"""Unit tests for shared utilities."""
+
+import time
+import uuid
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+
+from app.shared.utils import (
+    basis_points_to_percent,
+    percent_to_basis_points,
+    uuid7,
+)
+
+
+pytestmark = pytest.mark.unit
+
+
+class TestUuid7:
+    """Test suite for uuid7."""
+
+    def test_sets_version_and_variant(self):
+        """Test that generated values are RFC 9562 version 7 UUIDs."""
+        # Act
+        value = uuid7()
+
+        # Assert
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+
+    def test_embeds_millisecond_timestamp(self):
+        """Test that the leading 48 bits hold the Unix time in milliseconds."""
+        # Arrange
+        now_ns = 1_700_000_000_123_456_789
+
+        # Act
+        with patch.object(time, "time_ns", return_value=now_ns):
+            value = uuid7()
+
+        # Assert
+        assert value.int >> 80 == now_ns // 1_000_000
+
+    def test_orders_by_creation_time(self):
+        """Test that values from later milliseconds sort after earlier ones."""
+        # Act
+        with patch.object(time, "time_ns", return_value=1_000_000_000):
+            earlier = uuid7()
+        with patch.object(time, "time_ns", return_value=2_000_000_000):
+            later = uuid7()
+
+        # Assert
+        assert earlier < later
+
+
+class TestBasisPoints:
+    """Test suite for percentage/basis point conversion."""
+
+    @pytest.mark.parametrize(
+        ("percent", "basis_points"),
+        [
+            (Decimal("0.00"), 0),
+            (Decimal("85.5"), 8550),
+            (Decimal("33.333"), 3333),
+            (Decimal("100"), 10000),
+        ],
+    )
+    def test_percent_to_basis_points(self, percent, basis_points):
+        """Test that percentages are converted to integer basis points."""
+        # Act
+        result = percent_to_basis_points(percent)
+
+        # Assert
+        assert result == basis_points
+        assert isinstance(result, int)
+
+    def test_basis_points_to_percent(self):
+        """Test that stored basis points convert to float percentages."""
+        # Act
+        result = basis_points_to_percent(8550)
+
+        # Assert
+        assert result == 85.5
+
+    def test_basis_points_to_percent_none(self):
+        """Test that NULL stays None."""
+        # Act & Assert
+        assert basis_points_to_percent(None) is None